@@ -15,14 +15,15 @@ These classes are used in all parts of this library.
 """
 
 # System imports
+import functools
 import importlib
 import re
 import struct
-from collections import OrderedDict
-from copy import deepcopy
+from collections import OrderedDict, namedtuple
 from enum import Enum
 
 # Local source tree imports
+from pyof.foundation import cache
 from pyof.foundation.exceptions import (BadValueException, PackException,
                                         UnpackException, ValidationError)
 
@@ -31,7 +32,499 @@ from pyof.foundation.exceptions import (BadValueException, PackException,
 
 # This will determine the order on sphinx documentation.
 __all__ = ('GenericStruct', 'GenericMessage', 'GenericType', 'GenericBitMask',
-           'MetaStruct', 'MetaBitMask')
+           'MetaStruct', 'MetaBitMask', 'Field', 'StructView', 'pack_many')
+
+#: Description of a struct attribute, computed once per class by
+#: :class:`MetaStruct`. ``size`` is the static size in bytes, if known, and
+#: ``offset`` is the position of the attribute inside the struct, if all the
+#: previous attributes have static sizes. Otherwise, they are None.
+Field = namedtuple('Field', 'name prototype size offset')
+
+#: Lookup tables from values to members, one per enum, built on first use.
+#: Classes that are not enums, like bitmasks, are mapped to None.
+_ENUM_MEMBERS = {}
+
+#: Types whose instances are packed as they are.
+_PLAIN_TYPES = frozenset((int, str, bytes, bool, float, type(None)))
+
+# Functions
+
+
+def _get_enum_member(enum_ref, value):
+    """Return ``enum_ref(value)`` using a cached lookup table."""
+    try:
+        members = _ENUM_MEMBERS[enum_ref]
+    except KeyError:
+        members = None
+        if issubclass(enum_ref, Enum):
+            members = {member._value_: member for member in enum_ref}
+        _ENUM_MEMBERS[enum_ref] = members
+    if members is not None:
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            # Let the enum raise its own error.
+            pass
+    return enum_ref(value)
+
+
+def _get_plain_value(value):
+    """Return the number of an enum or bitmask, otherwise *value* itself.
+
+    It is used instead of looking for a ``value`` attribute with
+    :func:`dir`, which is slow.
+    """
+    if type(value) in _PLAIN_TYPES:
+        return value
+    elif isinstance(value, Enum):
+        return value._value_
+    elif isinstance(value, GenericType):
+        # Enum members are numbers even if they are not from enum_ref.
+        return _get_plain_value(value.value)
+    elif isinstance(value, GenericBitMask):
+        return value.bitmask
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_bitmask_names(bitmask_class, bitmask):
+    """Return the names of a bitmask class' elements selected by *bitmask*.
+
+    The results are cached, since a few bitmask values are used often.
+    """
+    # pylint: disable=protected-access
+    return tuple(name for name, value in bitmask_class._enum.items()
+                 if value & bitmask)
+
+
+def _clone(value):
+    """Return a copy of a class attribute's value for a new instance.
+
+    Python-openflow types and structs, as well as lists, are copied.
+    Everything else (numbers, strings, bytes, enums) is immutable and shared.
+    """
+    if isinstance(value, (GenericType, GenericStruct)):
+        return value.clone()
+    elif isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _get_slot(name):
+    """Return the name of the slot that stores a struct attribute."""
+    return '_{}_'.format(name)
+
+
+def _values_equal(class_attr, value, other_value):
+    """Compare two values of an attribute.
+
+    The result agrees with :func:`_get_hash_key`. ``None`` stands for the
+    class attribute, which is packed instead. Values of basic types that are
+    not integers may be written in many ways, like ``b''`` and an empty
+    :class:`~.basic_types.BinaryData`, so they are compared packed, as
+    :meth:`GenericStruct.pack` would write them.
+    """
+    if value is None:
+        value = class_attr
+    if other_value is None:
+        other_value = class_attr
+    if value is other_value:
+        return True
+    if isinstance(class_attr, GenericType):
+        plain_value = _get_plain_value(value)
+        other_plain_value = _get_plain_value(other_value)
+        if isinstance(plain_value, int) and \
+                isinstance(other_plain_value, int):
+            return plain_value == other_plain_value
+        return _get_hash_key(class_attr, value) == \
+            _get_hash_key(class_attr, other_value)
+    if isinstance(value, list) and isinstance(other_value, list):
+        return len(value) == len(other_value) and all(
+            _values_equal(item, item, other_item)
+            for item, other_item in zip(value, other_value))
+    return value == other_value
+
+
+def _get_hash_key(class_attr, value):
+    """Return a hashable key of an attribute's value.
+
+    Equal values have equal keys (see :func:`_values_equal`): ``None`` is
+    replaced by the class attribute, enums and bitmasks become integers,
+    other values of basic types are packed and structs are hashed.
+    """
+    if value is None:
+        value = class_attr
+    if isinstance(class_attr, GenericType):
+        plain_value = _get_plain_value(value)
+        if isinstance(plain_value, int):
+            return plain_value
+        try:
+            return class_attr.pack(value)
+        except (BadValueException, PackException, AttributeError, TypeError,
+                ValueError, struct.error):
+            return plain_value
+    elif isinstance(value, list):
+        return tuple(_get_hash_key(item, item) for item in value)
+    elif isinstance(value, GenericStruct):
+        return value.get_hash()
+    return value
+
+
+def _write_into(buff, offset, data):
+    """Copy *data* into *buff* at *offset* and return the next offset.
+
+    Raises:
+        :exc:`~.exceptions.PackException`: If *buff* is too small.
+    """
+    end = offset + len(data)
+    if end > len(buff):
+        msg = 'Buffer of {} bytes is too small to write {} bytes at {}.'
+        raise PackException(msg.format(len(buff), len(data), offset))
+    buff[offset:end] = data
+    return end
+
+
+def _get_uint_validator(size, enum_ref=None):
+    """Return a function that checks unsigned integers of *size* bytes.
+
+    Enum members are accepted only if they belong to *enum_ref*. Plain
+    integers are accepted even with an *enum_ref*, since some enums (like
+    ports) name only a few special values.
+    """
+    limit = 1 << (8 * size)
+    if not (enum_ref and issubclass(enum_ref, Enum)):
+        enum_ref = None
+
+    def validate(value):
+        if isinstance(value, GenericType):
+            value = value._value  # pylint: disable=protected-access
+        if isinstance(value, Enum):
+            if enum_ref is not None and not isinstance(value, enum_ref):
+                return False
+            value = value._value_
+        elif isinstance(value, GenericBitMask):
+            value = value.bitmask
+        return isinstance(value, int) and 0 <= value < limit
+    return validate
+
+
+def _get_struct_validator(struct_class):
+    """Return a function that checks instances of *struct_class*."""
+    def validate(value):
+        return isinstance(value, struct_class) and value.is_valid()
+    return validate
+
+
+def _validate_items(items):
+    """Check every item of a list attribute."""
+    return isinstance(items, list) and all(
+        isinstance(item, (GenericType, GenericStruct)) and item.is_valid()
+        for item in items)
+
+
+#: Matches the names of modules that belong to an OpenFlow version.
+_VERSION_MODULE_RE = re.compile(r'(pyof\.)(v0x\d+)(\..*)')
+
+#: Classes of versioned modules by module and class name. Classes are added
+#: as their modules are loaded, so resolving versions rarely imports.
+_VERSIONED_CLASSES = {}
+
+#: Cache of :meth:`MetaStruct.get_versioned_class` results.
+_VERSION_RESOLUTIONS = {}
+
+#: Generated functions of a struct class (see :func:`_compile_codec`).
+_Codec = namedtuple('_Codec', 'pack_into unpack unpack_into source')
+
+#: Errors that make generated functions fall back to the attribute-wise
+#: methods, which either succeed or raise more meaningful exceptions.
+_CODEC_ERRORS = (struct.error, AttributeError, TypeError, ValueError)
+
+
+def _get_field_runs(fields):
+    """Group consecutive fields that fit a :class:`struct.Struct` format.
+
+    Returns:
+        list: Tuples of fixed-format basic type fields and single fields.
+    """
+    runs, run = [], []
+    for field in fields:
+        if isinstance(field.prototype, GenericType) and field.size is not None:
+            run.append(field)
+            continue
+        if run:
+            runs.append(tuple(run))
+            run = []
+        runs.append(field)
+    if run:
+        runs.append(tuple(run))
+    return runs
+
+
+def _write_pack_into(struct_class, runs, namespace):
+    """Return the source lines of a struct's ``pack_into`` function."""
+    lines = ['def pack_into(self, buff, offset):',
+             '    begin = offset',
+             '    try:']
+    for number, run in enumerate(runs):
+        if isinstance(run, Field):
+            namespace['proto_' + run.name] = run.prototype
+            lines.append('        begin = proto_{0}.pack_into(buff, begin, '
+                         'self._{0}_)'.format(run.name))
+            continue
+        layout, items = MetaStruct.get_fixed_layout(run)
+        namespace['layout_{}'.format(number)] = layout
+        lines.append('        layout_{}.pack_into('.format(number))
+        lines.append('            buff, begin,')
+        for name, prototype, has_item in items:
+            if has_item:
+                namespace['proto_' + name] = prototype
+                lines.append('            proto_{0}.to_fixed_item(self._{0}_),'
+                             .format(name))
+        lines.append('        )')
+        lines.append('        begin += {}'.format(layout.size))
+    lines.append('    except _CODEC_ERRORS:')
+    lines.append('        pass')
+    lines.append('    else:')
+    lines.append('        return begin')
+    # Out of the except clause, so errors are not chained to the first one.
+    lines.append('    return self._pack_fields_into(buff, offset)')
+    return lines
+
+
+def _write_unpack(struct_class, runs, namespace, reuse=False):
+    """Return the source lines of a struct's ``unpack`` function.
+
+    The size of an attribute listed in ``_length_attributes`` is read from
+    its length attribute and the struct ends as told by
+    ``_struct_length_attribute``, so lists in the middle of a struct do not
+    consume the rest of the buffer. Attributes of basic types are stored as
+    plain values (see :class:`_TypeFieldDescriptor`). If *reuse* is True,
+    the function is named ``unpack_into`` and updates the instance's struct
+    and list attributes instead of cloning the class' ones (see
+    :meth:`GenericStruct.unpack_into`), unless the class overrides
+    ``unpack``.
+    """
+    if reuse and struct_class.unpack not in (GenericStruct.unpack,
+                                             GenericMessage.unpack):
+        # The class unpacks some attributes by itself.
+        return ['def unpack_into(self, buff, offset):',
+                '    self.unpack(buff, offset)']
+    # pylint: disable=protected-access
+    measured_by = {measured: length for length, measured
+                   in struct_class._length_attributes.items()}
+    struct_length = struct_class._struct_length_attribute
+    is_message = issubclass(struct_class, GenericMessage)
+    #: Expressions of the plain values of unpacked integers
+    plain_values = {}
+    #: Expressions of the values stored by each attribute
+    values = OrderedDict()
+    lines = ['def {}(self, buff, offset):'.format(
+        'unpack_into' if reuse else 'unpack'),
+             '    data = memoryview(buff)',
+             '    begin = offset',
+             '    try:']
+
+    def write_attribute(name, prototype):
+        """Write the lines that create or reuse an attribute object."""
+        namespace['proto_' + name] = prototype
+        values[name] = 'attr_' + name
+        if isinstance(prototype, GenericType):
+            # Only the plain value is kept.
+            values[name] = 'attr_{}._value'.format(name)
+        elif reuse:
+            namespace['class_' + name] = type(prototype)
+            lines.append("        attr_{0} = getattr(self, '_{0}_', None)"
+                         .format(name))
+            lines.append('        if attr_{0}.__class__ is not class_{0}:'
+                         .format(name))
+            lines.append('            attr_{0} = proto_{0}.clone()'
+                         .format(name))
+            return
+        lines.append('        attr_{0} = proto_{0}.clone()'.format(name))
+
+    def write_fixed_item(name, prototype, item):
+        """Write the line that converts an item of a fixed layout."""
+        values[name] = 'attr_' + name
+        if type(prototype).from_fixed_item is not \
+                GenericType.from_fixed_item:
+            namespace['proto_' + name] = prototype
+            value = 'proto_{}.from_fixed_item({})'.format(name, item)
+        elif prototype.enum_ref:
+            namespace['enum_' + name] = prototype.enum_ref
+            value = '_get_enum_member(enum_{}, {})'.format(name, item)
+        else:
+            value = item
+            if prototype.get_fixed_format() in ('B', 'H', 'I', 'Q'):
+                plain_values[name] = 'attr_' + name
+        lines.append('        attr_{} = {}'.format(name, value))
+
+    for number, run in enumerate(runs):
+        if isinstance(run, Field):
+            name = run.name
+            if is_message and name == 'header':
+                # Messages are unpacked without their headers.
+                continue
+            write_attribute(name, run.prototype)
+            method = 'unpack'
+            if reuse and isinstance(run.prototype, list):
+                # List items are appended by unpack.
+                lines.append('        del attr_{}[:]'.format(name))
+            elif reuse and isinstance(run.prototype, GenericStruct):
+                method = 'unpack_into'
+            last = run is runs[-1]
+            if name in measured_by:
+                length = measured_by[name]
+                plain_value = plain_values.get(
+                    length, '_get_plain_value(attr_{})'.format(length))
+                lines.append('        end = begin + {}'.format(plain_value))
+                lines.append('        attr_{}.{}(data[:end], begin)'
+                             .format(name, method))
+                lines.append('        begin = end')
+            else:
+                lines.append('        attr_{}.{}(data, begin)'
+                             .format(name, method))
+                if run.size is not None:
+                    lines.append('        begin += {}'.format(run.size))
+                elif not last:
+                    lines.append('        begin += attr_{}.get_size()'
+                                 .format(name))
+            continue
+        layout, items = MetaStruct.get_fixed_layout(run)
+        namespace['layout_{}'.format(number)] = layout
+        lines.append('        items_{0} = layout_{0}.unpack_from(data, begin)'
+                     .format(number))
+        index = 0
+        for name, prototype, has_item in items:
+            if has_item:
+                write_fixed_item(name, prototype,
+                                 'items_{}[{}]'.format(number, index))
+                index += 1
+            else:
+                # Padding keeps the class attribute's value.
+                namespace['default_' + name] = prototype._value
+                values[name] = 'default_' + name
+        lines.append('        begin += {}'.format(layout.size))
+        if struct_length in (item[0] for item in items):
+            lines.append('        data = data[:offset + {}]'
+                         .format(plain_values[struct_length]))
+    if not values:
+        lines.append('        pass')
+    lines.append('    except _UNPACK_ERRORS:')
+    lines.append('        pass')
+    lines.append('    else:')
+    slots = [(_get_slot(name), value) for name, value in values.items()]
+    if slots:
+        slots.append(('_plain_fields', str(struct_class._plain_mask)))
+        # Values were changed in place, so cached hash keys are stale.
+        slots.append(('_hash', 'None'))
+    if struct_class.__setattr__ is object.__setattr__:
+        lines.extend('        self.{} = {}'.format(slot, value)
+                     for slot, value in slots)
+    else:
+        # Slots are set directly, as the class' __setattr__ expects public
+        # names.
+        lines.extend("        _set_slot(self, '{}', {})".format(slot, value)
+                     for slot, value in slots)
+    lines.append('        return')
+    lines.append('    self._unpack_fields(buff, offset)')
+    return lines
+
+
+def _compile_codec(struct_class):
+    """Generate the ``pack_into`` and ``unpack*`` functions of a struct.
+
+    The functions are written as Python source specialised for the class'
+    attributes: consecutive fixed-size basic types are packed and unpacked
+    by a single precompiled :class:`struct.Struct` and variable-size
+    attributes are bounded by their length attributes. The source can be
+    inspected with :meth:`GenericStruct.get_codec_source`. The compiled code
+    is reused from :mod:`pyof.foundation.cache` when it is enabled.
+
+    Args:
+        struct_class (type): Class created by :class:`MetaStruct`.
+
+    Returns:
+        _Codec: The compiled functions and their source.
+    """
+    # pylint: disable=protected-access
+    runs = _get_field_runs(struct_class._fields)
+    namespace = {'_CODEC_ERRORS': _CODEC_ERRORS,
+                 '_UNPACK_ERRORS': (UnpackException,) + _CODEC_ERRORS,
+                 '_get_enum_member': _get_enum_member,
+                 '_set_slot': object.__setattr__,
+                 '_get_plain_value': _get_plain_value}
+    lines = _write_pack_into(struct_class, runs, namespace)
+    lines.append('')
+    lines.append('')
+    lines.extend(_write_unpack(struct_class, runs, namespace))
+    lines.append('')
+    lines.append('')
+    lines.extend(_write_unpack(struct_class, runs, namespace, reuse=True))
+    source = '\n'.join(lines) + '\n'
+    filename = '<pyof codec {}.{}>'.format(struct_class.__module__,
+                                           struct_class.__qualname__)
+    # pylint: disable=exec-used
+    exec(cache.compile_source(source, filename), namespace)
+    # Let tracebacks show the generated lines. linecache is imported here
+    # because it is slow to import and only needed once structs are used.
+    import linecache  # pylint: disable=import-outside-toplevel
+    linecache.cache[filename] = (len(source), None,
+                                 source.splitlines(True), filename)
+    return _Codec(namespace['pack_into'], namespace['unpack'],
+                  namespace['unpack_into'], source)
+
+
+def _get_codec(struct_class):
+    """Return the generated functions of a struct, compiling them once."""
+    codec = struct_class.__dict__.get('_codec')
+    if codec is None:
+        codec = _compile_codec(struct_class)
+        struct_class._codec = codec  # pylint: disable=protected-access
+    return codec
+
+
+def pack_many(messages, xids=None, views=False):
+    """Pack several messages into one buffer.
+
+    The buffer is allocated once, with the sum of the messages' sizes, and
+    each message is packed in place by :meth:`GenericMessage.pack_into`,
+    which also writes its header length. It is faster than joining the
+    results of :meth:`GenericStruct.pack` and the buffer can be sent with a
+    single call.
+
+    Args:
+        messages (iterable): Messages to be packed, in order.
+        xids (iterable): If given, the xid of each message is set to the
+            next one of these before packing. Messages after the last xid
+            keep theirs.
+        views (bool): Whether to return a view of each message instead of
+            the whole buffer, e.g. for :meth:`socket.socket.sendmsg`.
+
+    Returns:
+        bytearray: The packed messages, one after the other, or a list of
+            :class:`memoryview` objects of it if *views* is True.
+
+    Raises:
+        :exc:`~.exceptions.PackException`: If a message cannot be packed.
+        :exc:`~.exceptions.ValidationError`: If validation fails.
+    """
+    messages = list(messages)
+    if xids is not None:
+        for message, xid in zip(messages, xids):
+            message.header.xid = xid
+    buff = bytearray(sum(message.get_size() for message in messages))
+    ends = []
+    end = 0
+    for message in messages:
+        end = message.pack_into(buff, end)
+        ends.append(end)
+    # Sizes can be overestimated, like in GenericStruct.pack.
+    del buff[end:]
+    if not views:
+        return buff
+    view = memoryview(buff)
+    return [view[begin:end] for begin, end in zip([0] + ends, ends)]
+
 
 # Classes
 
@@ -41,8 +534,14 @@ class GenericType:
 
     Base class for :class:`~.UBInt8`, :class:`~.Char`
     and others.
+
+    Each struct attribute is an instance of this class, so instances store
+    their plain value in ``__slots__`` instead of a ``__dict__``. Subclasses
+    should declare the ``__slots__`` of any attribute they add.
     """
 
+    __slots__ = ('_value', 'enum_ref')
+
     _fmt = None
 
     def __init__(self, value=None, enum_ref=None):
@@ -64,6 +563,12 @@ class GenericType:
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
+            value, other_value = self.value, other.value
+            if value == other_value:
+                return True
+            elif isinstance(value, int) and isinstance(other_value, int):
+                return False
+            # Other values, like addresses, may be written in many ways.
             return self.pack() == other.pack()
         elif hasattr(other, 'value'):
             return self.value == other.value
@@ -120,14 +625,16 @@ class GenericType:
 
         The value of an enum, bitmask, etc.
         """
-        if self.isenum():
-            if isinstance(self._value, self.enum_ref):
-                return self._value.value
-            return self._value
-        elif self.is_bitmask():
-            return self._value.bitmask
-        else:
-            return self._value
+        # Same as isenum() and is_bitmask(), inlined because it is read often.
+        value = self._value
+        enum_ref = self.enum_ref
+        if enum_ref and issubclass(enum_ref, Enum):
+            if isinstance(value, enum_ref):
+                return value._value_
+            return value
+        elif isinstance(value, GenericBitMask):
+            return value.bitmask
+        return value
 
     def pack(self, value=None):
         r"""Pack the value as a binary representation.
@@ -162,9 +669,9 @@ class GenericType:
 
         if value is None:
             value = self.value
-        elif 'value' in dir(value):
+        else:
             # if it is enum or bitmask gets only the 'int' value
-            value = value.value
+            value = _get_plain_value(value)
 
         try:
             return struct.pack(self._fmt, value)
@@ -174,6 +681,26 @@ class GenericType:
                                                       value)
             raise PackException(msg)
 
+    def pack_into(self, buff, offset=0, value=None):
+        """Pack the value into a writable buffer.
+
+        The ``value`` argument follows the same rules of :meth:`pack`.
+
+        Args:
+            buff (bytearray, memoryview): Buffer that will receive the binary
+                representation. It must be large enough.
+            offset (int): Where to begin writing.
+            value: Value to be packed. If None, pack this instance's value.
+
+        Returns:
+            int: The offset right after the written bytes.
+
+        Raises:
+            :exc:`~.exceptions.PackException`: If the value does not fit the
+                binary format or the buffer is too small.
+        """
+        return _write_into(buff, offset, self.pack(value))
+
     def unpack(self, buff, offset=0):
         """Unpack *buff* into this object.
 
@@ -190,7 +717,7 @@ class GenericType:
         try:
             self._value = struct.unpack_from(self._fmt, buff, offset)[0]
             if self.enum_ref:
-                self._value = self.enum_ref(self._value)
+                self._value = _get_enum_member(self.enum_ref, self._value)
         except (struct.error, TypeError, ValueError) as e:
             msg = '{}; fmt = {}, buff = {}, offset = {}.'.format(e, self._fmt,
                                                                  buff, offset)
@@ -204,19 +731,109 @@ class GenericType:
         """
         return struct.calcsize(self._fmt)
 
+    def clone(self):
+        """Return a new instance with the same attributes.
+
+        It is used instead of :func:`copy.deepcopy` to create instance
+        attributes from class attributes. The values stored by basic types
+        are immutable, so a shallow copy is enough.
+
+        Subclasses with more ``__slots__`` must extend this method.
+
+        Returns:
+            GenericType: A copy of this object.
+        """
+        new = type(self).__new__(type(self))
+        new._value = self._value
+        new.enum_ref = self.enum_ref
+        if hasattr(self, '__dict__'):
+            new.__dict__.update(self.__dict__)
+        return new
+
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code of this type, if fixed.
+
+        Types that always take the same number of bytes and map to a single
+        :mod:`struct` item (or to padding) return their format code without
+        the byte order character, e.g. ``'H'`` for :class:`~.UBInt16`. It is
+        used by :class:`MetaStruct` to compile fixed-layout structs.
+
+        Returns:
+            str: The format code or ``None`` if the size is not fixed.
+        """
+        if self._fmt and self._fmt[0] == '!':
+            return self._fmt[1:]
+        return None
+
+    def to_fixed_item(self, value=None):
+        """Return the item to be packed by a compiled fixed-layout struct.
+
+        The ``value`` argument follows the same rules of :meth:`pack`.
+
+        Args:
+            value: Value to be converted. If None, use this instance's value.
+
+        Returns:
+            The value ready to be packed using :meth:`get_fixed_format`.
+        """
+        if isinstance(value, type(self)):
+            return value.to_fixed_item()
+        if value is None:
+            return self.value
+        return _get_plain_value(value)
+
+    def from_fixed_item(self, item):
+        """Return the value of an unpacked struct item.
+
+        It is the counterpart of :meth:`to_fixed_item` for compiled
+        fixed-layout structs, which unpack all their attributes at once and
+        store their plain values.
+
+        Args:
+            item: Item unpacked using :meth:`get_fixed_format`.
+
+        Returns:
+            The value, as :meth:`unpack` would store it.
+        """
+        if self.enum_ref:
+            return _get_enum_member(self.enum_ref, item)
+        return item
+
     def is_valid(self):
         """Check whether the value fits the binary format.
 
-        Assert that :func:`pack` succeeds.
+        See :meth:`get_validator`.
 
         Returns:
             bool: Whether the value is valid for this type.
         """
-        try:
-            self.pack()
+        return self.get_validator()(self)
+
+    def get_validator(self):
+        """Return a function that checks values of this type.
+
+        :class:`MetaStruct` calls it once per class attribute, so checking a
+        struct does not inspect the attributes again. Unsigned integers are
+        range-checked and enum members must belong to :attr:`enum_ref`. Other
+        types are valid if :meth:`pack` succeeds.
+
+        Returns:
+            callable: Function that receives a value (or an instance of this
+                type) and returns whether it is valid.
+        """
+        fmt = self.get_fixed_format()
+        if fmt in ('B', 'H', 'I', 'Q'):
+            return _get_uint_validator(struct.calcsize('!' + fmt),
+                                       self.enum_ref)
+
+        def validate(value):
+            try:
+                self.pack(value)
+            except (BadValueException, PackException, struct.error,
+                    AttributeError, TypeError, ValueError):
+                return False
             return True
-        except BadValueException:
-            return False
+        return validate
 
     def isenum(self):
         """Test whether it is an :class:`~Enum`.
@@ -235,6 +852,220 @@ class GenericType:
         return self._value and issubclass(type(self._value), GenericBitMask)
 
 
+#: Subclass of each basic type whose instances are views of attributes.
+_VIEW_CLASSES = {}
+
+
+class _TypeView:
+    """Mixin of the basic type objects returned by struct attributes.
+
+    Struct attributes store plain values (see :class:`_FieldDescriptor`).
+    Reading one returns a view of it that keeps the :class:`GenericType`
+    API: it is an instance of the class attribute's type, whose value is
+    read from and written to the struct, so changing the view (e.g. with
+    :meth:`~GenericType.unpack`) changes the struct. Other attributes of
+    the view, like the length of a :class:`~.basic_types.Char`, are the
+    class attribute's.
+    """
+
+    __slots__ = ()
+
+    @property
+    def _value(self):
+        return self._descriptor.get_value(self._struct)
+
+    @_value.setter
+    def _value(self, value):
+        self._descriptor.set_plain_value(self._struct, value)
+
+    @property
+    def enum_ref(self):
+        """Return the enum of the class attribute."""
+        return self._descriptor.prototype.enum_ref
+
+    def __getattr__(self, name):
+        # Only called for the slots that views do not set.
+        if name in ('_struct', '_descriptor'):
+            raise AttributeError(name)
+        return getattr(self._descriptor.prototype, name)
+
+    def __eq__(self, other):
+        return self.clone() == other
+
+    def __reduce_ex__(self, protocol):
+        return self.clone().__reduce_ex__(protocol)
+
+    def clone(self):
+        """Return a copy of the viewed value that is not bound to the struct.
+
+        Returns:
+            GenericType: An instance of the class attribute's type.
+        """
+        new = self._descriptor.prototype.clone()
+        new._value = self._value
+        return new
+
+
+def _get_view_class(type_class):
+    """Return the view class of a basic type, creating it once."""
+    try:
+        return _VIEW_CLASSES[type_class]
+    except KeyError:
+        pass
+    view_class = type(type_class.__name__, (_TypeView, type_class),
+                      {'__slots__': ('_struct', '_descriptor'),
+                       '__module__': type_class.__module__,
+                       '__qualname__': type_class.__qualname__})
+    _VIEW_CLASSES[type_class] = view_class
+    return view_class
+
+
+def _get_type_slots(type_class):
+    """Return the slots of a basic type besides its value.
+
+    Returns:
+        tuple: Slot names, or None if instances also have a ``__dict__``.
+    """
+    names = []
+    for klass in type_class.__mro__[:-1]:
+        slots = klass.__dict__.get('__slots__')
+        if slots is None:
+            return None
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name != '_value')
+    return tuple(names)
+
+
+class _FieldDescriptor:
+    """Data descriptor of a struct attribute, which is stored in a slot.
+
+    :class:`MetaStruct` replaces each class attribute by one of these. It
+    still returns the class attribute when read from the class or from an
+    instance that has not set it.
+    """
+
+    __slots__ = ('name', 'prototype', 'get_value', 'set_value', 'set_hash')
+
+    def __init__(self, field, member, hash_member):
+        """Describe the attribute of *field*.
+
+        Args:
+            field (Field): The attribute.
+            member: Descriptor of the slot that stores the attribute.
+            hash_member: Descriptor of the ``_hash`` slot, which caches
+                hash keys (see :meth:`GenericStruct.get_hash`).
+        """
+        self.name = field.name
+        self.prototype = field.prototype
+        #: Functions that read and write the slots, without conversions. The
+        #: slots are set directly, in case the class has __setattr__.
+        self.get_value = member.__get__
+        self.set_value = member.__set__
+        self.set_hash = hash_member.__set__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.prototype
+        try:
+            return self.get_value(instance)
+        except AttributeError:
+            # Not set yet, so the class attribute is used, as by pack.
+            return self.prototype
+
+    def __set__(self, instance, value):
+        self.set_value(instance, value)
+        self.set_hash(instance, None)
+
+
+class _TypeFieldDescriptor(_FieldDescriptor):
+    """Descriptor of a struct attribute of a basic type.
+
+    Values are stored plain (integers, enum members, strings, bytes) instead
+    of one :class:`GenericType` object per attribute, and read through a
+    view of the class attribute's type (see :class:`_TypeView`). The bits of
+    the instance's ``_plain_fields`` tell which attributes hold such values.
+    Other values, like numbers assigned by users, are stored and returned as
+    they are.
+
+    An object of the attribute's type is stored as its plain value if
+    nothing else, like the enum or the length, sets it apart from the class
+    attribute.
+    """
+
+    __slots__ = ('bit', 'set_plain_fields', '_view_class', '_type_slots')
+
+    def __init__(self, field, position, member, hash_member, plain_fields):
+        """Describe the attribute of *field*.
+
+        Args:
+            field (Field): The attribute.
+            position (int): Position of the attribute in the struct.
+            member: Descriptor of the slot that stores the attribute.
+            hash_member: Descriptor of the ``_hash`` slot.
+            plain_fields: Descriptor of the ``_plain_fields`` slot.
+        """
+        super().__init__(field, member, hash_member)
+        self.bit = 1 << position
+        self.set_plain_fields = plain_fields.__set__
+        self._view_class = _get_view_class(type(field.prototype))
+        self._type_slots = _get_type_slots(type(field.prototype))
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.prototype
+        try:
+            value = self.get_value(instance)
+        except AttributeError:
+            return self.prototype
+        if instance._plain_fields & self.bit:
+            view = object.__new__(self._view_class)
+            view._struct = instance
+            view._descriptor = self
+            return view
+        return value
+
+    def __set__(self, instance, value):
+        try:
+            plain_fields = instance._plain_fields
+        except AttributeError:
+            # Created without __init__, e.g. by __new__.
+            plain_fields = 0
+        if self._is_plain(value):
+            value = value._value
+            plain_fields |= self.bit
+        else:
+            if isinstance(value, _TypeView):
+                # Do not keep reading another struct's attribute.
+                value = value.clone()
+            plain_fields &= ~self.bit
+        self.set_plain_fields(instance, plain_fields)
+        self.set_value(instance, value)
+        self.set_hash(instance, None)
+
+    def set_plain_value(self, instance, value):
+        """Store a plain value, which will be read through a view.
+
+        Args:
+            instance (GenericStruct): The struct.
+            value: Plain value of the attribute's type.
+        """
+        self.set_value(instance, value)
+        self.set_plain_fields(instance, instance._plain_fields | self.bit)
+        self.set_hash(instance, None)
+
+    def _is_plain(self, value):
+        """Check whether *value* can be stored as its plain value."""
+        value_class = type(value)
+        prototype = self.prototype
+        if value_class is not type(prototype) and \
+                value_class is not self._view_class or \
+                self._type_slots is None:
+            return False
+        return all(getattr(value, name) == getattr(prototype, name)
+                   for name in self._type_slots)
+
+
 class MetaStruct(type):
     """MetaClass that dinamically handles openflow version of class attributes.
 
@@ -330,9 +1161,230 @@ class MetaStruct(type):
             inherited_attributes.update(classdict)
             classdict = inherited_attributes
 
-        return super().__new__(cls, name, bases, classdict, **kwargs)
+        #: Table with the ordered attributes used by pack, unpack, etc.
+        fields = MetaStruct.get_fields(classdict)
+        if any(isinstance(base, MetaStruct) for base in bases):
+            slots = MetaStruct.get_slots(bases, fields)
+            if slots:
+                classdict['__slots__'] = \
+                    tuple(classdict.get('__slots__', ())) + slots
+
+        new_class = super().__new__(cls, name, bases, classdict, **kwargs)
+        if curr_version is not None:
+            _VERSIONED_CLASSES[(curr_module, name)] = new_class
+        new_class._fields = fields
+        new_class._field_positions = {
+            field.name: position
+            for position, field in enumerate(new_class._fields)}
+        #: Sizes are precomputed, so only variable-size attributes are
+        #: measured by get_size.
+        new_class._static_size = MetaStruct.get_static_size(new_class)
+        new_class._variable_slots = tuple(
+            (_get_slot(field.name), field.prototype)
+            for field in new_class._fields if field.size is None)
+        new_class._static_part_size = sum(
+            field.size for field in new_class._fields
+            if field.size is not None)
+        #: Lists of fixed-size items need to know whether a class has
+        #: subclasses, which may have other sizes. It is recorded here
+        #: instead of being looked up on every use.
+        new_class._has_subclasses = False
+        for base in new_class.__mro__[1:]:
+            if isinstance(base, MetaStruct):
+                base._has_subclasses = True
+        MetaStruct.set_descriptors(new_class)
+        #: Validators are also built once, so is_valid does no reflection.
+        new_class._validators = MetaStruct.get_validators(new_class._fields)
+        return new_class
+
+    @staticmethod
+    def get_fields(classdict):
+        """Build the table of a struct's attributes.
+
+        Only python-openflow attributes (instances of :class:`GenericType` or
+        of classes created by this metaclass) are considered, in the order
+        they were defined.
+
+        Args:
+            classdict (dict): Class attributes, in definition order.
+
+        Returns:
+            tuple: A :class:`Field` for each attribute.
+        """
+        fields = []
+        offset = 0
+        for name, value in classdict.items():
+            if isinstance(value, GenericType):
+                fmt = value.get_fixed_format()
+                size = None if fmt is None else struct.calcsize('!' + fmt)
+            elif isinstance(type(value), MetaStruct):
+                # pylint: disable=protected-access
+                size = type(value)._static_size
+            else:
+                continue
+            fields.append(Field(name, value, size, offset))
+            if offset is not None and size is not None:
+                offset += size
+            else:
+                offset = None
+        return tuple(fields)
+
+    @staticmethod
+    def get_slots(bases, fields):
+        """Return the slots that store the attributes of a new struct class.
+
+        Each attribute is stored in a slot named after it (see
+        :class:`_FieldDescriptor`). Slots inherited from the bases, like
+        those of attributes that are redefined, are not declared again.
+
+        Args:
+            bases (tuple): Base classes of the new class.
+            fields (tuple): The new class' :class:`Field` table.
+
+        Returns:
+            tuple: Names of the new slots.
+        """
+        inherited = set()
+        for base in bases:
+            for klass in base.__mro__:
+                slots = klass.__dict__.get('__slots__', ())
+                inherited.update((slots,) if isinstance(slots, str)
+                                 else slots)
+        slots = [_get_slot(field.name) for field in fields]
+        if fields:
+            slots.extend(('_plain_fields', '_hash'))
+        return tuple(slot for slot in slots if slot not in inherited)
+
+    @staticmethod
+    def set_descriptors(struct_class):
+        """Replace the class attributes of a struct by their descriptors.
+
+        The class attributes are still returned when read from the class.
+        The default values of new instances (see
+        :meth:`GenericStruct.__init__`) are computed here, too.
+
+        Args:
+            struct_class (type): Class created by this metaclass.
+        """
+        # pylint: disable=protected-access
+        fields = struct_class._fields
+        names = {field.name for field in fields}
+        for base in struct_class.__mro__[1:]:
+            if not isinstance(base, MetaStruct):
+                continue
+            for field in base._fields:
+                # Removed attributes are plain class attributes again, so
+                # the descriptors of the base do not use this class' slots.
+                if field.name not in names and \
+                        field.name not in struct_class.__dict__:
+                    setattr(struct_class, field.name, field.prototype)
+                    names.add(field.name)
+        struct_class._slots = tuple(_get_slot(field.name) for field in fields)
+        plain_mask = 0
+        plain_defaults, object_defaults = [], []
+        for position, field in enumerate(fields):
+            slot = _get_slot(field.name)
+            member = getattr(struct_class, slot)
+            if isinstance(field.prototype, GenericType):
+                descriptor = _TypeFieldDescriptor(
+                    field, position, member, struct_class._hash,
+                    struct_class._plain_fields)
+                plain_mask |= descriptor.bit
+                plain_defaults.append((slot, field.prototype._value))
+            else:
+                descriptor = _FieldDescriptor(field, member,
+                                              struct_class._hash)
+                object_defaults.append((slot, field.prototype.clone))
+            setattr(struct_class, field.name, descriptor)
+        #: Attributes of basic types that store plain values
+        struct_class._plain_mask = plain_mask
+        #: Values of new instances' attributes. Other attributes are clones
+        #: of their class attributes, created by the computed bound methods.
+        struct_class._plain_defaults = tuple(plain_defaults)
+        struct_class._object_defaults = tuple(object_defaults)
+
+    @staticmethod
+    def get_static_size(struct_class):
+        """Return the size of every instance of a struct class, if static.
+
+        Lists (see :class:`~.basic_types.TypeList`) are never static, even
+        without attributes.
+
+        Args:
+            struct_class (type): Class created by this metaclass.
+
+        Returns:
+            int: Size in bytes or None if it depends on the instance.
+        """
+        # pylint: disable=protected-access
+        if issubclass(struct_class, list) or \
+                any(field.size is None for field in struct_class._fields):
+            return None
+        return sum(field.size for field in struct_class._fields)
 
     @staticmethod
+    def get_validators(fields):
+        """Build the functions that check a struct's attributes.
+
+        Basic types provide their own validators (see
+        :meth:`GenericType.get_validator`), nested structs must be instances
+        of the attribute's class and valid, and lists must have valid items.
+
+        Args:
+            fields (tuple): The struct's :class:`Field` table.
+
+        Returns:
+            tuple: ``(name, class attribute, validator)`` for each attribute.
+        """
+        validators = []
+        for field in fields:
+            prototype = field.prototype
+            if isinstance(prototype, GenericType):
+                validator = prototype.get_validator()
+            elif isinstance(prototype, list):
+                validator = _validate_items
+            else:
+                validator = _get_struct_validator(type(prototype))
+            validators.append((field.name, prototype, validator))
+        return tuple(validators)
+
+    @staticmethod
+    def get_fixed_layout(fields):
+        """Compile attributes with a fixed layout.
+
+        Attributes have a fixed layout when all of them are
+        :class:`GenericType` instances with a fixed format (see
+        :meth:`GenericType.get_fixed_format`). They can be packed or
+        unpacked with one :class:`struct.Struct` call instead of one call per
+        attribute. The generated pack and unpack functions (see
+        :meth:`GenericStruct.get_codec_source`) compile each sequence of such
+        attributes.
+
+        Args:
+            fields (tuple): Consecutive :class:`Field` items of a struct.
+
+        Returns:
+            tuple: The compiled :class:`struct.Struct` and a tuple of
+                ``(name, class attribute, has_item)`` for each attribute, or
+                None if the layout is not fixed.
+        """
+        if not fields:
+            return None
+        fmt = '!'
+        layout = []
+        for field in fields:
+            if not isinstance(field.prototype, GenericType) or \
+               field.size is None:
+                return None
+            code = field.prototype.get_fixed_format()
+            fmt += code
+            #: Padding does not produce any item
+            layout.append((field.name, field.prototype,
+                           not code.endswith('x')))
+        return struct.Struct(fmt), tuple(layout)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_pyof_version(module_fullname):
         """Get the module pyof version based on the module fullname.
 
@@ -344,8 +1396,7 @@ class MetaStruct(type):
             version (str): The module version, on the format 'v0x0?' if any. Or
             None (None): If there isn't a version on the fullname.
         """
-        ver_module_re = re.compile(r'(pyof\.)(v0x\d+)(\..*)')
-        matched = ver_module_re.match(module_fullname)
+        matched = _VERSION_MODULE_RE.match(module_fullname)
         if matched:
             version = matched.group(2)
             # module = matched.group(3)
@@ -419,23 +1470,45 @@ class MetaStruct(type):
         if new_version is None:
             return (name, obj)
 
-        cls = obj.__class__
-        cls_name = cls.__name__
-        cls_mod = cls.__module__
+        new_cls = MetaStruct.get_versioned_class(obj.__class__, new_version)
+        if new_cls is not None:
+            #: return the tuple with the attribute name and the instance
+            return (name, new_cls())
+
+        return (name, obj)
+
+    @staticmethod
+    def get_versioned_class(cls, version):
+        """Return the class that replaces *cls* on another pyof version.
+
+        Results are cached by class and version. The module of the new
+        version is only imported if it has not created the class yet.
+
+        Args:
+            cls (type): Class of a class attribute.
+            version (str): The pyof version, e.g. 'v0x04'.
 
+        Returns:
+            type: The class on the given version, or None if *cls* is not
+                from a versioned module or is already on that version.
+        """
+        key = (cls, version)
+        try:
+            return _VERSION_RESOLUTIONS[key]
+        except KeyError:
+            pass
+        new_cls = None
         #: If the module name does not starts with pyof.v0 then it is not a
         #: 'pyof versioned' module (OpenFlow specification defined), so we do
         #: not have anything to do with it.
-        new_mod = MetaStruct.replace_pyof_version(cls_mod, new_version)
+        new_mod = MetaStruct.replace_pyof_version(cls.__module__, version)
         if new_mod is not None:
-            # Loads the module
-            new_mod = importlib.import_module(new_mod)
-            #: Get the class from the loaded module
-            new_cls = getattr(new_mod, cls_name)
-            #: return the tuple with the attribute name and the instance
-            return (name, new_cls())
-
-        return (name, obj)
+            new_cls = _VERSIONED_CLASSES.get((new_mod, cls.__name__))
+            if new_cls is None:
+                new_cls = getattr(importlib.import_module(new_mod),
+                                  cls.__name__)
+        _VERSION_RESOLUTIONS[key] = new_cls
+        return new_cls
 
 
 class GenericStruct(object, metaclass=MetaStruct):
@@ -449,56 +1522,158 @@ class GenericStruct(object, metaclass=MetaStruct):
               too.
     """
 
+    #: Whether instances can be hashed, e.g. to be stored in sets. It can be
+    #: set on a struct class or here, for all structs and messages. Hashed
+    #: instances should not be changed while they are in a set or dict.
+    hashable = False
+
+    #: Whether :meth:`pack` checks :meth:`is_valid` first. Validation helps
+    #: to catch bugs (e.g. while testing or staging), but it makes packing
+    #: slower, so it is disabled by default. It can be set on a struct class
+    #: or here, for all structs and messages.
+    validate_on_pack = False
+
+    #: Attributes that hold the size of other attributes, e.g.
+    #: ``{'actions_len': 'actions'}``. They are checked by :meth:`is_valid`
+    #: unless they are None, because they are usually computed by pack.
+    _length_attributes = {}
+
+    #: Attribute that holds the size of the whole struct, e.g. ``'length'``.
+    #: Variable-size attributes are unpacked only up to that size.
+    _struct_length_attribute = None
+
     def __init__(self):
-        """Contructor takes no argument and stores attributes' deep copies."""
-        for name, value in self._get_class_attributes():
-            setattr(self, name, deepcopy(value))
+        """Contructor takes no argument and stores attributes' copies."""
+        if not self._fields:
+            return
+        # Slots are set directly, like by unpack, even if the class has
+        # __setattr__.
+        set_slot = object.__setattr__
+        for slot, value in self._plain_defaults:
+            set_slot(self, slot, value)
+        for slot, factory in self._object_defaults:
+            set_slot(self, slot, factory())
+        set_slot(self, '_plain_fields', self._plain_mask)
+        set_slot(self, '_hash', None)
 
     def __eq__(self, other):
         """Check whether two structures have the same structure and values.
 
-        Compare the binary representation of structs to decide whether they
-        are equal or not.
+        Structs of the same class are compared attribute by attribute,
+        without packing them. Otherwise, their binary representations are
+        compared.
 
         Args:
             other (GenericStruct): The struct to be compared with.
         """
-        return self.pack() == other.pack()
+        if type(other) is type(self):
+            return self._attributes_equal(other)
+        elif hasattr(other, 'pack'):
+            return self.pack() == other.pack()
+        return NotImplemented
 
-    @staticmethod
-    def _attr_fits_into_class(attr, cls):
-        if not isinstance(attr, cls):
-            try:
-                struct.pack(cls._fmt, attr)  # pylint: disable=protected-access
-            except struct.error:
-                return False
-        return True
+    def __hash__(self):
+        """Return a hash based on the attributes' values.
 
-    @staticmethod
-    def _is_pyof_attribute(obj):
-        """Return True if the object is a kytos attribute.
+        Only available if :attr:`hashable` is True. See :meth:`get_hash`.
 
-        To be a kytos attribute the item must be an instance of either
-        GenericType or GenericStruct.
+        Raises:
+            TypeError: If :attr:`hashable` is False.
+        """
+        if not self.hashable:
+            msg = "unhashable type: '{}'".format(type(self).__name__)
+            raise TypeError(msg)
+        return self.get_hash()
 
-        returns:
-            True: if the obj is a kytos attribute
-            False: if the obj is not a kytos attribute
+    def get_hash(self):
+        """Return a hash based on the attributes' values.
+
+        Equal structs have the same hash. The hash keys of attributes that
+        hold immutable values, like numbers and strings, are cached until an
+        attribute is assigned or unpacked. Values that may be changed in
+        place, like nested structs and lists, are hashed on every call, so
+        the hash always reflects the current values. This method works even
+        if :attr:`hashable` is False.
+
+        Returns:
+            int: The hash value.
         """
-        return isinstance(obj, GenericType) or isinstance(obj, GenericStruct)
+        return hash(self._get_hash_key())
+
+    def _get_hash_key(self, skipped=None):
+        """Return a tuple with the class and the attributes' hash keys."""
+        if not self._fields:
+            return (type(self),)
+        cached = getattr(self, '_hash', None)
+        if cached is None or cached[0] != skipped:
+            cached = self._get_cached_hash_keys(skipped)
+            # Set directly, in case the class has __setattr__.
+            object.__setattr__(self, '_hash', cached)
+        keys, mutable = cached[1:]
+        if not mutable:
+            return keys
+        keys = list(keys)
+        for index, slot, prototype in mutable:
+            keys[index] = _get_hash_key(prototype,
+                                        getattr(self, slot, prototype))
+        return tuple(keys)
+
+    def _get_cached_hash_keys(self, skipped):
+        """Return the hash keys that stay valid until an attribute changes.
 
-    def _validate_attributes_type(self):
-        """Validate the type of each attribute."""
-        for _attr, _class in self._get_attributes():
-            if isinstance(_attr, _class):
-                return True
-            elif issubclass(_class, GenericType):
-                if GenericStruct._attr_fits_into_class(_attr, _class):
-                    return True
-            elif not isinstance(_attr, _class):
+        Returns:
+            tuple: *skipped*, the keys of :meth:`_get_hash_key` with None in
+                place of mutable values and the position, slot and class
+                attribute of each of them.
+        """
+        keys, mutable = [type(self)], []
+        for field, slot in zip(self._fields, self._slots):
+            if field.name == skipped:
+                continue
+            value = getattr(self, slot, field.prototype)
+            if type(value) in _PLAIN_TYPES or isinstance(value, Enum):
+                keys.append(_get_hash_key(field.prototype, value))
+            else:
+                mutable.append((len(keys), slot, field.prototype))
+                keys.append(None)
+        return skipped, tuple(keys), tuple(mutable)
+
+    def _attributes_equal(self, other, skipped=None):
+        """Compare attributes of two structs of the same class."""
+        for field, slot in zip(self._fields, self._slots):
+            if field.name != skipped and not _values_equal(
+                    field.prototype,
+                    getattr(self, slot, field.prototype),
+                    getattr(other, slot, field.prototype)):
                 return False
         return True
 
+    def clone(self):
+        """Return a new struct with copies of this struct's attributes.
+
+        Attributes are copied recursively, like :func:`copy.deepcopy` does,
+        but without its overhead. :meth:`__init__` is not called.
+
+        Returns:
+            GenericStruct: A copy of this struct.
+        """
+        new = type(self).__new__(type(self))
+        set_slot = object.__setattr__
+        for slot in self._slots:
+            try:
+                set_slot(new, slot, _clone(getattr(self, slot)))
+            except AttributeError:
+                pass
+        if self._fields:
+            try:
+                set_slot(new, '_plain_fields', self._plain_fields)
+            except AttributeError:
+                pass
+        if self.__dict__:
+            new.__dict__.update((name, _clone(value))
+                                for name, value in self.__dict__.items())
+        return new
+
     @classmethod
     def _get_class_attributes(cls):
         """Return a generator for class attributes' names and value.
@@ -519,12 +1694,10 @@ class GenericStruct(object, metaclass=MetaStruct):
             generator: tuples with attribute name and value.
         """
         #: see this method docstring for a important notice about the use of
-        #: cls.__dict__
-        for name, value in cls.__dict__.items():
-            # gets only our (kytos) attributes. this ignores methods, dunder
-            # methods and attributes, and common python type attributes.
-            if GenericStruct._is_pyof_attribute(value):
-                yield (name, value)
+        #: cls.__dict__. The attributes were collected by MetaStruct when the
+        #: class was created.
+        for field in cls._fields:
+            yield (field.name, field.prototype)
 
     def _get_instance_attributes(self):
         """Return a generator for instance attributes' name and value.
@@ -538,9 +1711,9 @@ class GenericStruct(object, metaclass=MetaStruct):
         returns:
             generator: tuples with attribute name and value.
         """
-        for name, value in self.__dict__.items():
-            if name in map((lambda x: x[0]), self._get_class_attributes()):
-                yield (name, value)
+        for field, slot in zip(self._fields, self._slots):
+            if hasattr(self, slot):
+                yield (field.name, getattr(self, field.name))
 
     def _get_attributes(self):
         """Return a generator for instance and class attribute.
@@ -554,13 +1727,11 @@ class GenericStruct(object, metaclass=MetaStruct):
         Returns:
             generator: Tuples with instance attribute and class attribute
         """
-        return map((lambda i, c: (i[1], c[1])),
-                   self._get_instance_attributes(),
-                   self._get_class_attributes())
+        return ((getattr(self, slot, field.prototype), field.prototype)
+                for field, slot in zip(self._fields, self._slots))
 
     def _unpack_attribute(self, name, obj, buff, begin):
-        attribute = deepcopy(obj)
-        setattr(self, name, attribute)
+        attribute = obj.clone()
         if len(buff) == 0:
             size = 0
         else:
@@ -571,6 +1742,8 @@ class GenericStruct(object, metaclass=MetaStruct):
                 child_cls = type(self).__name__
                 msg = '{}.{}; {}'.format(child_cls, name, e)
                 raise UnpackException(msg)
+        # Set after unpacking, since values of basic types are stored plain.
+        setattr(self, name, attribute)
         return size
 
     def get_size(self, value=None):
@@ -590,8 +1763,11 @@ class GenericStruct(object, metaclass=MetaStruct):
             Exception: If the struct is not valid.
         """
         if value is None:
-            return sum(cls_val.get_size(obj_val) for obj_val, cls_val in
-                       self._get_attributes())
+            if self._static_size is not None:
+                return self._static_size
+            return self._static_part_size + sum(
+                prototype.get_size(getattr(self, slot, None))
+                for slot, prototype in self._variable_slots)
         elif isinstance(value, type(self)):
             return value.get_size()
         else:
@@ -602,9 +1778,8 @@ class GenericStruct(object, metaclass=MetaStruct):
     def pack(self, value=None):
         """Pack the struct in a binary representation.
 
-        Iterate over the class attributes, according to the
-        order of definition, and then convert each attribute to its byte
-        representation using its own ``pack`` method.
+        Allocate a buffer with :meth:`get_size` bytes and fill it using
+        :meth:`pack_into`.
 
         Returns:
             bytes: Binary representation of the struct object.
@@ -613,18 +1788,50 @@ class GenericStruct(object, metaclass=MetaStruct):
             :exc:`~.exceptions.ValidationError`: If validation fails.
         """
         if value is None:
-            if not self.is_valid():
+            buff = bytearray(self.get_size())
+            end = self.pack_into(buff)
+            del buff[end:]
+            return bytes(buff)
+        elif isinstance(value, type(self)):
+            return value.pack()
+        else:
+            msg = "{} is not an instance of {}".format(value,
+                                                       type(self).__name__)
+            raise PackException(msg)
+
+    def pack_into(self, buff, offset=0, value=None):
+        """Pack the struct into a writable buffer.
+
+        Iterate over the class attributes, according to the order of
+        definition, and write each attribute using its own ``pack_into``
+        method. No intermediate :class:`bytes` object is created for the
+        struct, so many structs can be packed into one preallocated buffer.
+
+        Args:
+            buff (bytearray, memoryview): Buffer that will receive the binary
+                representation. It must have at least :meth:`get_size` bytes
+                after ``offset``.
+            offset (int): Where to begin writing.
+            value: In structs, the user can assign other value instead of a
+                class' instance.
+
+        Returns:
+            int: The offset right after the written struct.
+
+        Raises:
+            :exc:`~.exceptions.ValidationError`: If validation fails (see
+                :attr:`validate_on_pack`).
+            :exc:`~.exceptions.PackException`: If an attribute could not be
+                packed or the buffer is too small.
+        """
+        if value is None:
+            if self.validate_on_pack and not self.is_valid():
                 error_msg = "Error on validation prior to pack() on class "
                 error_msg += "{}.".format(type(self).__name__)
                 raise ValidationError(error_msg)
-            else:
-                message = b''
-                # pylint: disable=no-member
-                for instance_attr, class_attr in self._get_attributes():
-                    message += class_attr.pack(instance_attr)
-                return message
+            return _get_codec(type(self)).pack_into(self, buff, offset)
         elif isinstance(value, type(self)):
-            return value.pack()
+            return value.pack_into(buff, offset)
         else:
             msg = "{} is not an instance of {}".format(value,
                                                        type(self).__name__)
@@ -635,16 +1842,115 @@ class GenericStruct(object, metaclass=MetaStruct):
 
         Update this object attributes based on the unpacked values of *buff*.
         It is an inplace method and it receives the binary data of the struct.
+        The work is done by a function generated for the struct's class (see
+        :meth:`get_codec_source`).
 
         Args:
             buff (bytes): Binary data package to be unpacked.
             offset (int): Where to begin unpacking.
         """
+        _get_codec(type(self)).unpack(self, buff, offset)
+
+    def unpack_into(self, buff, offset=0):
+        """Unpack a binary struct reusing this object's attribute objects.
+
+        It is like :meth:`unpack`, but the values are written into the
+        attribute objects already assigned to this struct (recursively),
+        which avoids creating new ones. It is meant for decoding many
+        messages into the same instances, e.g. taken from a
+        :class:`~.pool.StructPool`. Messages are unpacked without their
+        headers, as in :meth:`GenericMessage.unpack`.
+
+        If unpacking fails, the attributes may be partially updated.
+
+        Args:
+            buff (bytes): Binary data package to be unpacked.
+            offset (int): Where to begin unpacking.
+        """
+        _get_codec(type(self)).unpack_into(self, buff, offset)
+
+    def _pack_fields_into(self, buff, offset):
+        """Pack the attributes one by one.
+
+        It is slower than the generated ``pack_into`` function (see
+        :meth:`get_codec_source`), which calls it to raise meaningful errors.
+        """
+        # pylint: disable=no-member
+        for instance_attr, class_attr in self._get_attributes():
+            offset = class_attr.pack_into(buff, offset, instance_attr)
+        return offset
+
+    def _unpack_fields(self, buff, offset, skipped=None):
+        """Unpack the attributes one by one.
+
+        It is slower than the generated ``unpack`` function (see
+        :meth:`get_codec_source`), which calls it to raise meaningful errors.
+        """
+        measured_by = {measured: length for length, measured
+                       in self._length_attributes.items()}
         begin = offset
-        for name, value in self._get_class_attributes():
-            size = self._unpack_attribute(name, value, buff, begin)
+        for field in self._fields:
+            if field.name == skipped:
+                continue
+            if field.name in measured_by:
+                end = begin + _get_plain_value(
+                    getattr(self, measured_by[field.name]))
+                self._unpack_attribute(field.name, field.prototype,
+                                       memoryview(buff)[:end], begin)
+                begin = end
+                continue
+            size = self._unpack_attribute(field.name, field.prototype, buff,
+                                          begin)
+            if field.name == self._struct_length_attribute:
+                buff = memoryview(buff)[:offset + _get_plain_value(
+                    getattr(self, field.name))]
             begin += size
 
+    @classmethod
+    def get_codec_source(cls):
+        """Return the source of the class' generated pack and unpack code.
+
+        The ``pack_into`` and ``unpack`` functions of each class are
+        generated on first use, specialised for its attributes. This method
+        is meant for inspection and debugging.
+
+        Returns:
+            str: Python source of both functions.
+        """
+        return _get_codec(cls).source
+
+    @classmethod
+    def get_dtype(cls):
+        """Return the NumPy structured type of the class' fixed-size part.
+
+        Arrays of structs can be decoded into columns of this type with
+        :func:`~.columnar.unpack_array`. NumPy is required.
+
+        Returns:
+            numpy.dtype: Type of the attributes from the beginning of the
+                struct up to the first variable-size one.
+        """
+        # NumPy is an optional dependency.
+        # pylint: disable=import-outside-toplevel
+        from pyof.foundation.columnar import get_dtype
+        return get_dtype(cls)
+
+    @classmethod
+    def view(cls, buffer, offset=0):
+        """Return a read-only view of the struct packed in *buffer*.
+
+        No attribute is unpacked until it is accessed, which is much cheaper
+        than :meth:`unpack` when only a few attributes are needed.
+
+        Args:
+            buffer: Bytes-like object with the packed struct.
+            offset (int): Where the struct begins.
+
+        Returns:
+            StructView: View of the struct.
+        """
+        return StructView(cls, memoryview(buffer)[offset:])
+
     def is_valid(self):
         """Check whether all struct attributes in are valid.
 
@@ -656,9 +1962,35 @@ class GenericStruct(object, metaclass=MetaStruct):
         Returns:
             bool: Whether the struct is valid.
         """
+        return self._attributes_valid()
+
+    def _attributes_valid(self, skipped=None):
+        """Run the class' validators on the attributes' values."""
+        for (name, prototype, validator), slot in zip(self._validators,
+                                                      self._slots):
+            if name == skipped:
+                continue
+            value = getattr(self, slot, prototype)
+            if name in self._length_attributes:
+                if _get_plain_value(value) is None:
+                    continue
+                if not self._length_attribute_valid(name, value):
+                    return False
+            if value is None or not validator(value):
+                return False
         return True
-        # pylint: disable=unreachable
-        return self._validate_attributes_type()
+
+    def _length_attribute_valid(self, name, value):
+        """Check whether *value* is the size of the measured attribute."""
+        measured_name = self._length_attributes[name]
+        measured = self._fields[self._field_positions[measured_name]]
+        try:
+            size = measured.prototype.get_size(
+                getattr(self, _get_slot(measured_name), measured.prototype))
+        except (BadValueException, PackException, AttributeError,
+                TypeError, ValueError):
+            return False
+        return _get_plain_value(value) == size
 
 
 class GenericMessage(GenericStruct):
@@ -685,8 +2017,32 @@ class GenericMessage(GenericStruct):
             raise NotImplementedError(msg)
         super().__init_subclass__(**kwargs)
 
+    def __eq__(self, other):
+        """Check whether two messages have the same content.
+
+        The header length is not compared because it is only updated when
+        a message is packed.
+
+        Args:
+            other (GenericMessage): The message to be compared with.
+        """
+        if type(other) is type(self):
+            # pylint: disable=protected-access
+            return self.header._attributes_equal(other.header, 'length') and \
+                self._attributes_equal(other, 'header')
+        return super().__eq__(other)
+
+    __hash__ = GenericStruct.__hash__
+
+    def _get_hash_key(self, skipped=None):
+        # pylint: disable=protected-access
+        return (self.header._get_hash_key('length'),) + \
+            super()._get_hash_key('header')
+
     def _validate_message_length(self):
-        return self.header.length == self.get_size()
+        """Check the header length, unless it was not computed yet."""
+        length = _get_plain_value(self.header.length)
+        return not length or length == self.get_size()
 
     def is_valid(self):
         """Check whether a message is valid or not.
@@ -699,39 +2055,93 @@ class GenericMessage(GenericStruct):
         Returns:
             bool: Whether the message is valid.
         """
-        return True
-        # pylint: disable=unreachable
-        return super().is_valid() and self._validate_message_length()
+        # pylint: disable=protected-access
+        return self.header._attributes_valid('length') and \
+            self._attributes_valid('header') and \
+            self._validate_message_length()
 
-    def pack(self, value=None):
-        """Pack the message into a binary data.
+    def pack_into(self, buff, offset=0, value=None):
+        """Pack the message into a writable buffer.
 
         One of the basic operations on a Message is the pack operation. During
         the packing process, we convert all message attributes to binary
         format.
 
         Since that this is usually used before sending the message to a switch,
-        here we also call :meth:`update_header_length`.
+        the header length is also updated. Instead of calculating the message
+        size beforehand (like :meth:`update_header_length`), the length is
+        written into the header after the whole message is packed.
 
-        .. seealso:: This method call its parent's :meth:`GenericStruct.pack`
-            after :meth:`update_header_length`.
+        .. seealso:: This method calls its parent's
+            :meth:`GenericStruct.pack_into`.
+
+        Args:
+            buff (bytearray, memoryview): Buffer that will receive the binary
+                representation.
+            offset (int): Where to begin writing.
+            value: Other instance of this message to be packed.
 
         Returns:
-            bytes: A binary data thats represents the Message.
+            int: The offset right after the written message.
 
         Raises:
             Exception: If there are validation errors.
         """
         if value is None:
-            self.update_header_length()
-            return super().pack()
+            self.header.length = 0
+            end = super().pack_into(buff, offset)
+            self.header.length = end - offset
+            self._pack_header_length_into(buff, offset, end - offset)
+            return end
         elif isinstance(value, type(self)):
-            return value.pack()
+            return value.pack_into(buff, offset)
         else:
             msg = "{} is not an instance of {}".format(value,
                                                        type(self).__name__)
             raise PackException(msg)
 
+    def _pack_header_length_into(self, buff, offset, length):
+        """Overwrite the header length of a message packed at *offset*."""
+        length_offset, length_attr = self._get_header_length_field()
+        length_attr.pack_into(buff, offset + length_offset, length)
+
+    @classmethod
+    def _get_header_length_field(cls):
+        """Return the offset and the class attribute of the header length."""
+        # pylint: disable=protected-access
+        header = cls._fields[cls._field_positions['header']]
+        header_class = type(header.prototype)
+        length = header_class._fields[header_class._field_positions['length']]
+        return header.offset + length.offset, length.prototype
+
+    @classmethod
+    def view(cls, buffer, offset=0):
+        """Return a read-only view of the message packed in *buffer*.
+
+        Unlike :meth:`GenericStruct.view`, the view is limited to the message
+        length found in the header, so *buffer* may contain more data after
+        the message.
+
+        Args:
+            buffer: Bytes-like object with the whole message, header included.
+            offset (int): Where the message begins.
+
+        Returns:
+            StructView: View of the message.
+
+        Raises:
+            :exc:`~.exceptions.UnpackException`: If *buffer* is shorter than
+                the message length.
+        """
+        buff = memoryview(buffer)[offset:]
+        length_offset, length_attr = cls._get_header_length_field()
+        length = length_attr.clone()
+        length.unpack(buff, length_offset)
+        if len(buff) < length.value:
+            msg = 'Buffer has {} bytes but the message length is {}.'
+            raise UnpackException(msg.format(len(buff), length.value))
+        return StructView(cls, buff[:length.value])
+
     def unpack(self, buff, offset=0):
         """Unpack a binary message into this object's attributes.
 
@@ -744,11 +2154,10 @@ class GenericMessage(GenericStruct):
                 header.
             offset (int): Where to begin unpacking.
         """
-        begin = offset
-        for name, value in self._get_class_attributes():
-            if type(value).__name__ != "Header":
-                size = self._unpack_attribute(name, value, buff, begin)
-                begin += size
+        _get_codec(type(self)).unpack(self, buff, offset)
+
+    def _unpack_fields(self, buff, offset, skipped='header'):
+        super()._unpack_fields(buff, offset, skipped)
 
     def update_header_length(self):
         """Update the header length attribute based on current message size.
@@ -759,6 +2168,122 @@ class GenericMessage(GenericStruct):
         self.header.length = self.get_size()
 
 
+class StructView:
+    """Read-only view of a struct or message packed in a buffer.
+
+    Views are created by :meth:`GenericStruct.view` and
+    :meth:`GenericMessage.view`. An attribute is unpacked from the buffer at
+    its precomputed offset (see :class:`Field`) when it is first accessed and
+    then cached, so the buffer must not be changed while the view is in use.
+    Attributes placed after a variable-size attribute are located by
+    unpacking the previous attributes.
+
+    Call :meth:`promote` to get a full mutable struct or message.
+    """
+
+    def __init__(self, struct_class, buffer):
+        """Create a view of *struct_class* over *buffer*.
+
+        Args:
+            struct_class (type): Subclass of :class:`GenericStruct`.
+            buffer (memoryview): Packed struct, starting at its first byte.
+        """
+        object.__setattr__(self, '_struct_class', struct_class)
+        object.__setattr__(self, '_buffer', buffer)
+        object.__setattr__(self, '_offsets', {})
+
+    def __repr__(self):
+        return "{}.view({!r})".format(self._struct_class.__name__,
+                                      self.pack())
+
+    def __getattr__(self, name):
+        # Only called for attributes not cached yet.
+        # pylint: disable=protected-access
+        try:
+            position = self._struct_class._field_positions[name]
+        except KeyError:
+            msg = "'{}' view has no attribute '{}'"
+            raise AttributeError(msg.format(self._struct_class.__name__,
+                                            name))
+        offset = self._get_offset(position)
+        attribute = self._struct_class._fields[position].prototype.clone()
+        attribute.unpack(self._buffer[:self._get_end(position, offset)],
+                         offset)
+        self.__dict__[name] = attribute
+        return attribute
+
+    def __setattr__(self, name, value):
+        msg = "'{}' view is read-only"
+        raise AttributeError(msg.format(self._struct_class.__name__))
+
+    def _get_offset(self, position):
+        """Return the offset of the attribute at *position* in the buffer."""
+        # pylint: disable=protected-access
+        offset = self._struct_class._fields[position].offset
+        if offset is None:
+            offset = self._offsets.get(position)
+        if offset is None:
+            previous = self._struct_class._fields[position - 1]
+            offset = self._get_offset(position - 1)
+            length_name = self._get_length_name(previous.name)
+            if length_name is None:
+                offset += getattr(self, previous.name).get_size()
+            else:
+                offset += _get_plain_value(getattr(self, length_name))
+            self._offsets[position] = offset
+        return offset
+
+    def _get_length_name(self, name):
+        """Return the attribute that holds the size of *name*, if any."""
+        # pylint: disable=protected-access
+        for length_name, measured in \
+                self._struct_class._length_attributes.items():
+            if measured == name:
+                return length_name
+        return None
+
+    def _get_end(self, position, offset):
+        """Return where the attribute at *position* must stop unpacking.
+
+        Like the generated ``unpack`` function, attributes listed in
+        ``_length_attributes`` end as told by their length attribute and
+        the others end with the struct (see ``_struct_length_attribute``).
+        """
+        # pylint: disable=protected-access
+        struct_class = self._struct_class
+        length_name = self._get_length_name(struct_class._fields[position]
+                                            .name)
+        if length_name is not None:
+            return offset + _get_plain_value(getattr(self, length_name))
+        struct_length = struct_class._struct_length_attribute
+        if struct_length is not None and \
+                struct_class._field_positions[struct_length] < position:
+            return _get_plain_value(getattr(self, struct_length))
+        return len(self._buffer)
+
+    def get_size(self):
+        """Return the size of the viewed struct in bytes."""
+        return len(self._buffer)
+
+    def pack(self):
+        """Return the viewed bytes, without unpacking any attribute."""
+        return bytes(self._buffer)
+
+    def promote(self):
+        """Unpack the whole buffer into a new struct or message.
+
+        Returns:
+            GenericStruct: Mutable instance of the viewed class.
+        """
+        struct_obj = self._struct_class()
+        if isinstance(struct_obj, GenericMessage):
+            struct_obj.header.unpack(self._buffer)
+            struct_obj.unpack(self._buffer[struct_obj.header.get_size():])
+        else:
+            struct_obj.unpack(self._buffer)
+        return struct_obj
+
+
 class MetaBitMask(type):
     """MetaClass to create a special BitMaskEnum type.
 
@@ -797,6 +2322,9 @@ class MetaBitMask(type):
 class GenericBitMask(object, metaclass=MetaBitMask):
     """Base class for enums that use bitmask values."""
 
+    #: Subclasses get their elements' names and values from MetaBitMask.
+    _enum = OrderedDict()
+
     def __init__(self, bitmask=None):
         """The constructor has the optional parameter below.
 
@@ -804,7 +2332,6 @@ class GenericBitMask(object, metaclass=MetaBitMask):
             bitmask: Bitmask value.
         """
         self.bitmask = bitmask
-        self._enum = {}
 
     def __str__(self):
         return "{}".format(self.bitmask)
@@ -819,11 +2346,9 @@ class GenericBitMask(object, metaclass=MetaBitMask):
         Returns:
             list: Enum names.
         """
-        result = []
-        for key, value in self.iteritems():
-            if value & self.bitmask:
-                result.append(key)
-        return result
+        if not self.bitmask:
+            return []
+        return list(_get_bitmask_names(type(self), self.bitmask))
 
     def iteritems(self):
         """Generator for attributes' name-value pairs.
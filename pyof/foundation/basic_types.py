@@ -1,22 +1,39 @@
 """Basic types used in structures and messages."""
 
 # System imports
+import functools
 import struct
 
 # Local source tree imports
 from pyof.foundation import exceptions
-from pyof.foundation.base import GenericStruct, GenericType
+from pyof.foundation.base import (GenericStruct, GenericType, MetaStruct,
+                                  _write_into)
 
 # Third-party imports
 
 __all__ = ('BinaryData', 'Char', 'ConstantTypeList', 'FixedTypeList',
-           'IPAddress', 'DPID', 'HWAddress', 'Pad', 'UBInt8', 'UBInt16',
-           'UBInt32', 'UBInt64')
+           'IPAddress', 'DPID', 'HWAddress', 'LazyFixedTypeList', 'Pad',
+           'UBInt8', 'UBInt16', 'UBInt32', 'UBInt64')
+
+
+def _hex_to_bytes(value, separator, base, length):
+    """Convert a string like ``'00:0a:ff'`` into bytes.
+
+    Raises:
+        ValueError: If the number of parts is not ``length`` or a part does
+            not fit into a byte.
+    """
+    parts = value.split(separator)
+    if len(parts) != length:
+        raise ValueError('{} does not have {} parts.'.format(value, length))
+    return bytes([int(part, base) for part in parts])
 
 
 class Pad(GenericType):
     """Class for padding attributes."""
 
+    __slots__ = ('_length',)
+
     _fmt = ''
 
     def __init__(self, length=0):
@@ -31,6 +48,12 @@ class Pad(GenericType):
     def __repr__(self):
         return "{}({})".format(type(self).__name__, self._length)
 
+    def clone(self):
+        """Return a new instance with the same length."""
+        new = super().clone()
+        new._length = self._length
+        return new
+
     def __str__(self):
         return '0' * self._length
 
@@ -72,6 +95,10 @@ class Pad(GenericType):
         """
         return b'\x00' * self._length
 
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code for ``length`` pad bytes."""
+        return '{}x'.format(self._length)
+
 
 class UBInt8(GenericType):
     """Format character for an Unsigned Char.
@@ -79,6 +106,8 @@ class UBInt8(GenericType):
     Class for an 8-bit (1-byte) Unsigned Integer.
     """
 
+    __slots__ = ()
+
     _fmt = "!B"
 
 
@@ -88,6 +117,8 @@ class UBInt16(GenericType):
     Class for an 16-bit (2-byte) Unsigned Integer.
     """
 
+    __slots__ = ()
+
     _fmt = "!H"
 
 
@@ -97,6 +128,8 @@ class UBInt32(GenericType):
     Class for an 32-bit (4-byte) Unsigned Integer.
     """
 
+    __slots__ = ()
+
     _fmt = "!I"
 
 
@@ -106,12 +139,16 @@ class UBInt64(GenericType):
     Class for an 64-bit (8-byte) Unsigned Integer.
     """
 
+    __slots__ = ()
+
     _fmt = "!Q"
 
 
 class DPID(GenericType):
     """DataPath ID. Identifies a switch."""
 
+    __slots__ = ()
+
     _fmt = "!8B"
 
     def __init__(self, dpid=None):
@@ -158,18 +195,31 @@ class DPID(GenericType):
         Raises:
             Exception: If there is a struct unpacking error.
         """
-        begin = offset
-        hexas = []
-        while begin < offset + 8:
-            number = struct.unpack("!B", buff[begin:begin+1])[0]
-            hexas.append("%.2x" % number)
-            begin += 1
-        self._value = ':'.join(hexas)
+        unpacked_data = struct.unpack_from('!8B', buff, offset)
+        self._value = ':'.join("%.2x" % number for number in unpacked_data)
+
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code of a DPID."""
+        return '8s'
+
+    def to_fixed_item(self, value=None):
+        """Return the DPID as 8 bytes for a compiled fixed-layout struct."""
+        if isinstance(value, type(self)):
+            return value.to_fixed_item()
+        if value is None:
+            value = self._value
+        return _hex_to_bytes(value, ':', 16, 8)
+
+    def from_fixed_item(self, item):
+        """Return the DPID value of its 8 unpacked bytes."""
+        return ':'.join("%.2x" % number for number in item)
 
 
 class Char(GenericType):
     """Build a double char type according to the length."""
 
+    __slots__ = ('length', '_fmt')
+
     def __init__(self, value=None, length=0):
         """The constructor takes the optional parameters below.
 
@@ -181,6 +231,13 @@ class Char(GenericType):
         self.length = length
         self._fmt = '!{}{}'.format(self.length, 's')
 
+    def clone(self):
+        """Return a new instance with the same value and length."""
+        new = super().clone()
+        new.length = self.length
+        new._fmt = self._fmt
+        return new
+
     def pack(self, value=None):
         """Pack the value as a binary representation.
 
@@ -204,6 +261,27 @@ class Char(GenericType):
                                                          err)
             raise exceptions.PackException(msg)
 
+    def get_validator(self):
+        """Return a function that checks ASCII strings for this length.
+
+        The strings must be shorter than :attr:`length`, because of the null
+        terminator. Longer strings would be truncated by :meth:`pack`.
+
+        Returns:
+            callable: Function that receives a value and returns whether it
+                is valid.
+        """
+        length = self.length
+
+        def validate(value):
+            if isinstance(value, Char):
+                value = value.value
+            try:
+                return len(value.encode('ascii')) < length
+            except (AttributeError, UnicodeEncodeError):
+                return False
+        return validate
+
     def unpack(self, buff, offset=0):
         """Unpack a binary message into this object's attributes.
 
@@ -218,19 +296,37 @@ class Char(GenericType):
             Exception: If there is a struct unpacking error.
         """
         try:
-            begin = offset
-            end = begin + self.length
-            unpacked_data = struct.unpack(self._fmt, buff[begin:end])[0]
+            unpacked_data = struct.unpack_from(self._fmt, buff, offset)[0]
         except struct.error:
             raise Exception("%s: %s" % (offset, buff))
 
         self._value = unpacked_data.decode('ascii').rstrip('\0')
 
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code for ``length`` characters."""
+        if self.length > 0:
+            return '{}s'.format(self.length)
+        return None
+
+    def to_fixed_item(self, value=None):
+        """Return the null-terminated bytes for a compiled struct."""
+        if isinstance(value, type(self)):
+            value = value.value
+        elif value is None:
+            value = self.value
+        # struct pads the remaining bytes with null characters
+        return bytes(value, 'ascii')[:self.length - 1]
+
+    def from_fixed_item(self, item):
+        """Return the value of the unpacked bytes."""
+        return item.decode('ascii').rstrip('\0')
+
 
 class IPAddress(GenericType):
     """Defines a IP address."""
 
-    netmask = UBInt32()
+    __slots__ = ('netmask',)
+
     max_prefix = UBInt32(32)
 
     def __init__(self, address="0.0.0.0/32"):
@@ -248,6 +344,12 @@ class IPAddress(GenericType):
         super().__init__(address)
         self.netmask = int(netmask)
 
+    def clone(self):
+        """Return a new instance with the same address and netmask."""
+        new = super().clone()
+        new.netmask = self.netmask
+        return new
+
     def pack(self, value=None):
         """Pack the value as a binary representation.
 
@@ -294,11 +396,27 @@ class IPAddress(GenericType):
             Exception: If there is a struct unpacking error.
         """
         try:
-            unpacked_data = struct.unpack('!4B', buff[offset:offset+4])
+            unpacked_data = struct.unpack_from('!4B', buff, offset)
             self._value = '.'.join([str(x) for x in unpacked_data])
         except:
             raise Exception("%s: %s" % (offset, buff))
 
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code of an IPv4 address."""
+        return '4s'
+
+    def to_fixed_item(self, value=None):
+        """Return the address as 4 bytes for a compiled struct."""
+        if isinstance(value, type(self)):
+            return value.to_fixed_item()
+        if value is None:
+            value = self._value
+        return _hex_to_bytes(value.split('/')[0], '.', 10, 4)
+
+    def from_fixed_item(self, item):
+        """Return the address of its 4 unpacked bytes."""
+        return '.'.join([str(x) for x in item])
+
     def get_size(self, value=None):
         """Return the ip address size in bytes.
 
@@ -316,6 +434,8 @@ class IPAddress(GenericType):
 class HWAddress(GenericType):
     """Defines a hardware address."""
 
+    __slots__ = ()
+
     def __init__(self, hw_address='00:00:00:00:00:00'):
         """The constructor takes the parameters below.
 
@@ -373,7 +493,7 @@ class HWAddress(GenericType):
             return "{0:0{1}x}".format(n, 2)
 
         try:
-            unpacked_data = struct.unpack('!6B', buff[offset:offset+6])
+            unpacked_data = struct.unpack_from('!6B', buff, offset)
         except:
             raise Exception("%s: %s" % (offset, buff))
         transformed_data = ':'.join([_int2hex(x) for x in unpacked_data])
@@ -392,6 +512,24 @@ class HWAddress(GenericType):
         """
         return 6
 
+    def get_fixed_format(self):
+        """Return the :mod:`struct` format code of a hardware address."""
+        return '6s'
+
+    def to_fixed_item(self, value=None):
+        """Return the address as 6 bytes for a compiled struct."""
+        if isinstance(value, type(self)):
+            return value.to_fixed_item()
+        if value is None:
+            value = self._value
+        if value == 0:
+            value = '00:00:00:00:00:00'
+        return _hex_to_bytes(value, ':', 16, 6)
+
+    def from_fixed_item(self, item):
+        """Return the address of its 6 unpacked bytes."""
+        return ':'.join(["{0:0{1}x}".format(x, 2) for x in item])
+
     def is_broadcast(self):
         """Return true if the value is a broadcast address. False otherwise."""
         return self.value == 'ff:ff:ff:ff:ff:ff'
@@ -404,8 +542,24 @@ class BinaryData(GenericType):
     :class:`.PacketOut` messages. Both the :meth:`pack` and :meth:`unpack`
     methods will return the binary data itself. :meth:`get_size` method will
     return the size of the instance using Python's :func:`len`.
+
+    Any bytes-like object (:class:`bytes`, :class:`bytearray`,
+    :class:`memoryview`, :class:`mmap.mmap`) can be unpacked. By default the
+    data is copied into :class:`bytes`. Set :attr:`zero_copy` to ``True`` to
+    keep a :class:`memoryview` of the unpacked buffer instead, so large
+    payloads such as ``PacketIn.data`` are never copied. In that case, the
+    buffer must not be changed while the unpacked objects are in use.
+
+    The value may also be a struct, message or type, such as the body of a
+    stats request or the data of an error message, which is packed in place.
     """
 
+    __slots__ = ()
+
+    #: Whether :meth:`unpack` keeps a :class:`memoryview` of the buffer
+    #: instead of copying the data.
+    zero_copy = False
+
     def __init__(self, value=b''):
         """The constructor takes the parameter below.
 
@@ -431,9 +585,39 @@ class BinaryData(GenericType):
 
         if isinstance(value, bytes) and len(value) > 0:
             return value
+        elif isinstance(value, (bytearray, memoryview)):
+            return bytes(value)
+        elif isinstance(value, (GenericStruct, GenericType)):
+            return value.pack()
         else:
             return b''
 
+    def pack_into(self, buff, offset=0, value=None):
+        """Write the binary data into *buff* without an intermediate copy.
+
+        Args:
+            buff (bytearray): Writable buffer.
+            offset (int): Where to begin writing.
+            value: Binary data to be written instead of this object's value.
+
+        Returns:
+            int: The offset right after the written data.
+
+        Raises:
+            :exc:`~.exceptions.PackException`: If the buffer is too small.
+        """
+        if isinstance(value, type(self)):
+            return value.pack_into(buff, offset)
+
+        if value is None:
+            value = self._value
+
+        if isinstance(value, (GenericStruct, GenericType)):
+            return value.pack_into(buff, offset)
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            value = b''
+        return _write_into(buff, offset, value)
+
     def unpack(self, buff, offset=0):
         """Unpack a binary message into this object's attributes.
 
@@ -441,10 +625,16 @@ class BinaryData(GenericType):
         on the results. Since the *buff* is binary data, no conversion is done.
 
         Args:
-            buff (bytes): Binary data package to be unpacked.
+            buff (bytes): Binary data package to be unpacked. Any bytes-like
+                object is accepted.
             offset (int): Where to begin unpacking.
         """
-        self._value = buff[offset:]
+        if self.zero_copy:
+            self._value = memoryview(buff)[offset:]
+        elif isinstance(buff, bytes):
+            self._value = buff[offset:]
+        else:
+            self._value = bytes(memoryview(buff)[offset:])
 
     def get_size(self, value=None):
         """Return the size in bytes.
@@ -458,11 +648,12 @@ class BinaryData(GenericType):
             int: The address size in bytes.
         """
         if value is None:
-            return len(self._value)
-        elif isinstance(value, type(self)):
+            value = self._value
+        if isinstance(value, (GenericStruct, GenericType)):
             return value.get_size()
-        else:
-            return len(value)
+        elif value is None:
+            return 0
+        return len(value)
 
 
 class TypeList(list, GenericStruct):
@@ -493,6 +684,16 @@ class TypeList(list, GenericStruct):
         for item in items:
             self.append(item)
 
+    def clone(self):
+        """Return a new list with copies of this list's items.
+
+        Returns:
+            TypeList: A copy of this list.
+        """
+        new = super().clone()
+        list.extend(new, (item.clone() for item in self))
+        return new
+
     def pack(self, value=None):
         """Pack the value as a binary representation.
 
@@ -502,18 +703,34 @@ class TypeList(list, GenericStruct):
         if isinstance(value, type(self)):
             return value.pack()
 
+        buff = bytearray(self.get_size(value))
+        end = self.pack_into(buff, 0, value)
+        del buff[end:]
+        return bytes(buff)
+
+    def pack_into(self, buff, offset=0, value=None):
+        """Pack the items into a writable buffer, one after the other.
+
+        Args:
+            buff (bytearray, memoryview): Buffer that will receive the binary
+                representation.
+            offset (int): Where to begin writing.
+            value: In structs, the user can assign a list instead of this
+                class' instance.
+
+        Returns:
+            int: The offset right after the last item.
+        """
+        if isinstance(value, type(self)):
+            return value.pack_into(buff, offset)
+
         if value is None:
             value = self
-        else:
-            container = type(self)()
-            container.extend(value)
-            value = container
 
-        bin_message = b''
         try:
             for item in value:
-                bin_message += item.pack()
-            return bin_message
+                offset = item.pack_into(buff, offset)
+            return offset
         except exceptions.PackException as err:
             msg = "{} pack error: {}".format(type(self).__name__, err)
             raise exceptions.PackException(msg)
@@ -558,11 +775,22 @@ class TypeList(list, GenericStruct):
                 # If the type of the elements is GenericType, then returns the
                 # length of the list multiplied by the size of the GenericType.
                 return len(self) * self[0].get_size()
+            item_size = self._get_item_static_size()
+            if item_size is not None:
+                # All the items have the same precomputed size.
+                return len(self) * item_size
             else:
                 # Otherwise iter over the list accumulating the sizes.
                 return sum(item.get_size() for item in self)
+        elif isinstance(value, type(self)):
+            return value.get_size()
         else:
-            return type(self)(value).get_size()
+            return sum(item.get_size() for item in value)
+
+    def _get_item_static_size(self):
+        """Return the static size shared by all items, if there is one."""
+        # pylint: disable=no-self-use
+        return None
 
     def __str__(self):
         """Human-readable object representantion."""
@@ -634,6 +862,234 @@ class FixedTypeList(TypeList):
         """
         super().unpack(buff, self._pyof_class, offset)
 
+    def _get_item_static_size(self):
+        """Return the static size of ``pyof_class``, if it has no subclasses.
+
+        Subclasses may have other sizes, like the actions in
+        :class:`~.common.action.ListOfActions`.
+        """
+        # pylint: disable=protected-access
+        pyof_class = self._pyof_class
+        if isinstance(pyof_class, MetaStruct) and \
+                not pyof_class._has_subclasses:
+            return pyof_class._static_size
+        return None
+
+
+#: Placeholder of the items of a :class:`LazyFixedTypeList` not yet decoded
+_UNDECODED = object()
+
+
+class LazyFixedTypeList(FixedTypeList):
+    """A :class:`FixedTypeList` that decodes each item when it is read.
+
+    :meth:`unpack` only finds where the items begin, reading their length
+    attributes, or nothing at all if the items have a fixed size. Each item
+    is decoded the first time it is read by index or iteration, so reading a
+    few items of a long list is cheap. Operations that change the list or
+    compare it decode all the remaining items first.
+    """
+
+    def __init__(self, pyof_class, items=None):
+        """The constructor parameters follows.
+
+        Args:
+            pyof_class (:obj:`type`): Class of the items to be stored.
+            items (iterable, ``pyof_class``): Items to be stored.
+        """
+        #: Unpacked buffer, while some items were not decoded
+        self._buff = None
+        #: Offset of each item or, if they have a fixed size, of the first
+        self._offsets = None
+        #: Fixed size of the items, if any
+        self._item_size = None
+        super().__init__(pyof_class, items)
+
+    def unpack(self, buff, offset=0):
+        """Find the items in *buff*, decoding only those without a size.
+
+        Args:
+            buff (bytes): The binary data to be unpacked.
+            offset (int): If we need to shift the beginning of the data.
+
+        Raises:
+            :exc:`~.exceptions.UnpackException`: If the last item is
+                incomplete.
+        """
+        list.clear(self)
+        self._buff = None
+        if not isinstance(buff, bytes):
+            # Buffers like the stream's ones are overwritten later.
+            buff = bytes(buff[offset:])
+            offset = 0
+        item_size = self._get_item_static_size()
+        if item_size:
+            count, rest = divmod(len(buff) - offset, item_size)
+            if rest:
+                msg = 'Buffer ends in the middle of a {}.'
+                raise exceptions.UnpackException(
+                    msg.format(self._pyof_class.__name__))
+            self._offsets = offset
+        else:
+            self._offsets = self._find_offsets(buff, offset)
+            if self._offsets is None:
+                # The items must be decoded to know their sizes.
+                super().unpack(buff, offset)
+                return
+            count = len(self._offsets)
+        self._buff = buff
+        self._item_size = item_size
+        list.extend(self, [_UNDECODED] * count)
+
+    def _find_offsets(self, buff, offset):
+        """Return the offsets of the items, using their length attribute."""
+        # pylint: disable=protected-access
+        pyof_class = self._pyof_class
+        name = getattr(pyof_class, '_struct_length_attribute', None)
+        if name is None or pyof_class._has_subclasses:
+            return None
+        field = pyof_class._fields[pyof_class._field_positions[name]]
+        if field.offset is None or field.size is None:
+            return None
+        length_from = struct.Struct('!' + field.prototype.get_fixed_format())
+        length_from = length_from.unpack_from
+        minimum = field.offset + field.size
+        offsets = []
+        end = len(buff)
+        while offset < end:
+            try:
+                length = length_from(buff, offset + field.offset)[0]
+            except struct.error:
+                length = 0
+            if length < minimum or offset + length > end:
+                msg = '{} at byte {} has an invalid length.'
+                raise exceptions.UnpackException(
+                    msg.format(pyof_class.__name__, offset))
+            offsets.append(offset)
+            offset += length
+        return offsets
+
+    def _get_bounds(self, index):
+        """Return where the undecoded item at *index* begins and ends."""
+        if self._item_size:
+            begin = self._offsets + index * self._item_size
+            return begin, begin + self._item_size
+        begin = self._offsets[index]
+        if index + 1 < len(self._offsets):
+            return begin, self._offsets[index + 1]
+        return begin, len(self._buff)
+
+    def _decode(self, index):
+        """Return the item at *index*, decoding it if needed."""
+        item = list.__getitem__(self, index)
+        if item is _UNDECODED:
+            if index < 0:
+                index += len(self)
+            item = self._pyof_class()
+            item.unpack(self._buff, self._get_bounds(index)[0])
+            list.__setitem__(self, index, item)
+        return item
+
+    def _decode_all(self):
+        """Decode the remaining items and release the buffer."""
+        if self._buff is not None:
+            for index in range(len(self)):
+                self._decode(index)
+            self._buff = None
+            self._offsets = None
+
+    def __getitem__(self, key):
+        if self._buff is None:
+            return list.__getitem__(self, key)
+        if isinstance(key, slice):
+            return [self._decode(index)
+                    for index in range(*key.indices(len(self)))]
+        return self._decode(key)
+
+    def __iter__(self):
+        if self._buff is None:
+            return list.__iter__(self)
+        return (self._decode(index) for index in range(len(self)))
+
+    def __reversed__(self):
+        if self._buff is None:
+            return list.__reversed__(self)
+        return (self._decode(index)
+                for index in range(len(self) - 1, -1, -1))
+
+    def __eq__(self, other):
+        self._decode_all()
+        if isinstance(other, LazyFixedTypeList):
+            other._decode_all()  # pylint: disable=protected-access
+        return list.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def pack_into(self, buff, offset=0, value=None):
+        """Pack the items, copying the bytes of those not decoded.
+
+        Args:
+            buff (bytearray, memoryview): Buffer that will receive the binary
+                representation.
+            offset (int): Where to begin writing.
+            value: In structs, the user can assign a list instead of this
+                class' instance.
+
+        Returns:
+            int: The offset right after the last item.
+        """
+        if value is not None or self._buff is None:
+            return super().pack_into(buff, offset, value)
+        for index, item in enumerate(list.__iter__(self)):
+            if item is _UNDECODED:
+                begin, end = self._get_bounds(index)
+                offset = _write_into(buff, offset, self._buff[begin:end])
+            else:
+                offset = item.pack_into(buff, offset)
+        return offset
+
+    def get_size(self, value=None):
+        """Return the size in bytes, without decoding the items.
+
+        Args:
+            value: In structs, the user can assign other value instead of
+                this class' instance.
+
+        Returns:
+            int: The size in bytes.
+        """
+        if value is not None or self._buff is None:
+            return super().get_size(value)
+        size = 0
+        for index, item in enumerate(list.__iter__(self)):
+            if item is _UNDECODED:
+                begin, end = self._get_bounds(index)
+                size += end - begin
+            else:
+                size += item.get_size()
+        return size
+
+
+def _decoding_all(method):
+    """Wrap a list method so that it decodes all the items before."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # pylint: disable=protected-access
+        self._decode_all()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+for _name in ('__add__', '__contains__', '__delitem__', '__ge__', '__gt__',
+              '__iadd__', '__imul__', '__le__', '__lt__', '__mul__',
+              '__repr__', '__rmul__', '__setitem__', 'append', 'clear',
+              'copy', 'count', 'index', 'insert', 'pop', 'remove', 'reverse',
+              'sort'):
+    setattr(LazyFixedTypeList, _name,
+            _decoding_all(getattr(FixedTypeList, _name)))
+del _name
+
 
 class ConstantTypeList(TypeList):
     """List that contains only objects of the same type (class).
@@ -693,3 +1149,8 @@ class ConstantTypeList(TypeList):
         else:
             raise exceptions.WrongListItemType(item.__class__.__name__,
                                                self[0].__class__.__name__)
+
+    def _get_item_static_size(self):
+        """Return the static size of the items' class, if there is one."""
+        # pylint: disable=protected-access
+        return getattr(type(self[0]), '_static_size', None)
@@ -0,0 +1,150 @@
+"""Persistent cache of the code generated for structs.
+
+The ``pack_into`` and ``unpack`` functions of each struct class are
+generated and compiled on first use (see
+:meth:`~.base.GenericStruct.get_codec_source`). Compiling them takes most of
+the start-up time of short-lived processes, so the compiled code can be
+saved to a file and loaded by the next processes. The cache is enabled by
+setting the ``PYOF_CACHE_DIR`` environment variable to a directory or by
+calling :func:`enable`.
+
+Entries are keyed by the generated source, which is derived from each
+struct's layout (attribute order, formats, sizes and offsets), so a changed
+struct never reuses stale code. A cache file is only used with the same pyof
+version and Python bytecode format.
+"""
+
+# System imports
+import atexit
+import marshal
+import os
+from importlib.util import MAGIC_NUMBER
+
+# Local source tree imports
+from pyof import __version__
+
+__all__ = ('CodeCache', 'compile_source', 'disable', 'enable')
+
+#: Environment variable with the directory of the cache file.
+CACHE_DIR_VARIABLE = 'PYOF_CACHE_DIR'
+
+#: Identifies the pyof version and the bytecode format of a cache file.
+_FILE_MAGIC = MAGIC_NUMBER + 'pyof-{}\n'.format(__version__).encode('ascii')
+
+#: The cache in use, if any.
+_CACHE = None
+
+
+class CodeCache:
+    """Compiled code objects stored in a file, by source and file name."""
+
+    def __init__(self, directory):
+        """Load the cache file of *directory*, if it is valid.
+
+        Args:
+            directory (str): Where the cache file is stored. It is created
+                when the cache is saved.
+        """
+        self.path = os.path.join(directory, 'pyof-codecs.bin')
+        self._codes = self._load()
+        self._changed = False
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _load(self):
+        """Return the cached code objects or an empty dict."""
+        try:
+            with open(self.path, 'rb') as cache_file:
+                if cache_file.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                    return {}
+                codes = marshal.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return {}
+        return codes if isinstance(codes, dict) else {}
+
+    def compile(self, source, filename):
+        """Return the compiled *source*, compiling it only if not cached.
+
+        Args:
+            source (str): Python source code.
+            filename (str): Name shown in tracebacks.
+
+        Returns:
+            code: The code object, ready to be executed.
+        """
+        key = filename + '\n' + source
+        code = self._codes.get(key)
+        if code is None:
+            code = compile(source, filename, 'exec')
+            self._codes[key] = code
+            self._changed = True
+        return code
+
+    def save(self):
+        """Write the cache file if new code was compiled.
+
+        The file is replaced atomically, so processes that save at the same
+        time do not corrupt it.
+        """
+        if not self._changed:
+            return
+        directory = os.path.dirname(self.path)
+        temp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(_FILE_MAGIC)
+                marshal.dump(self._codes, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError:
+            # The cache is an optimization, so it must not break programs.
+            return
+        self._changed = False
+
+
+def enable(directory):
+    """Use a cache file in *directory*, saved when the process exits.
+
+    Forked processes that exit without running :mod:`atexit` handlers
+    should call ``save()`` on the returned cache.
+
+    Args:
+        directory (str): Where the cache file is stored.
+
+    Returns:
+        CodeCache: The cache in use.
+    """
+    global _CACHE  # pylint: disable=global-statement
+    disable()
+    _CACHE = CodeCache(directory)
+    atexit.register(_CACHE.save)
+    return _CACHE
+
+
+def disable():
+    """Save the cache in use, if any, and stop using it."""
+    global _CACHE  # pylint: disable=global-statement
+    if _CACHE is not None:
+        _CACHE.save()
+        atexit.unregister(_CACHE.save)
+        _CACHE = None
+
+
+def compile_source(source, filename):
+    """Compile generated code, using the cache if it is enabled.
+
+    Args:
+        source (str): Python source code.
+        filename (str): Name shown in tracebacks.
+
+    Returns:
+        code: The code object, ready to be executed.
+    """
+    if _CACHE is None:
+        return compile(source, filename, 'exec')
+    return _CACHE.compile(source, filename)
+
+
+if os.environ.get(CACHE_DIR_VARIABLE):
+    enable(os.environ[CACHE_DIR_VARIABLE])
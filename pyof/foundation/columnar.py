@@ -0,0 +1,194 @@
+"""Columnar decoding of struct arrays with NumPy.
+
+Stats replies carry arrays of structs, like flow or port counters, that
+are expensive to unpack into one object per attribute. This module decodes
+them into NumPy structured arrays, one column per attribute, in a few
+vectorised steps:
+
+.. code-block:: python3
+
+    from pyof.foundation.columnar import unpack_array
+    from pyof.v0x01.controller2switch.common import PortStats
+    from pyof.v0x01.controller2switch.stats_reply import StatsReply
+
+    reply = StatsReply.view(data)
+    ports = unpack_array(PortStats, reply.body.value).records
+    total = ports['rx_bytes'].sum()
+
+It requires NumPy, which is an optional dependency of python-openflow
+(``pip install python-openflow[numpy]``).
+"""
+
+# System imports
+import struct
+from collections import namedtuple
+
+# Third-party imports
+import numpy
+
+# Local source tree imports
+from pyof.foundation.base import GenericType
+from pyof.foundation.basic_types import Char, Pad
+from pyof.foundation.exceptions import UnpackException
+
+__all__ = ('StructArray', 'get_dtype', 'unpack_array')
+
+#: Structs decoded by :func:`unpack_array`. ``records`` is a structured
+#: array with the attributes of each struct's fixed-size beginning (see
+#: :func:`get_dtype`). ``offsets`` has the position of each struct in the
+#: buffer, plus the end of the last one, so the variable-size end of struct
+#: ``i`` (e.g. a list of actions) is
+#: ``buffer[offsets[i] + records.itemsize:offsets[i + 1]]``.
+StructArray = namedtuple('StructArray', 'records offsets')
+
+#: NumPy types of the fixed formats of integers.
+_INTEGER_TYPES = {'B': 'u1', 'H': '>u2', 'I': '>u4', 'Q': '>u8'}
+
+#: Data types of struct classes.
+_DTYPES = {}
+
+
+def _get_field_dtype(prototype):
+    """Return the NumPy type of an attribute or None if it is not fixed."""
+    if isinstance(prototype, list):
+        return None
+    elif not isinstance(prototype, GenericType):
+        # Nested structs are mapped as a whole or not at all.
+        try:
+            dtype = get_dtype(type(prototype))
+        except ValueError:
+            return None
+        # pylint: disable=protected-access
+        if dtype.itemsize == type(prototype)._static_size:
+            return dtype
+        return None
+    code = prototype.get_fixed_format()
+    if code in _INTEGER_TYPES:
+        return numpy.dtype(_INTEGER_TYPES[code])
+    elif code and code.endswith('s'):
+        if isinstance(prototype, Char):
+            return numpy.dtype('S' + code[:-1])
+        # Addresses and other binary values are kept as bytes.
+        return numpy.dtype(('u1', (int(code[:-1]),)))
+    return None
+
+
+def get_dtype(struct_class):
+    """Return the NumPy structured type of a struct class.
+
+    The type has the attributes from the beginning of the struct up to the
+    first one whose size is variable or that has no NumPy type, e.g. a list
+    of actions. Integers are unsigned and big-endian (enums and bitmasks are
+    kept as numbers), characters are byte strings, other binary values
+    (addresses) are byte arrays and nested structs are nested types. Padding
+    is skipped.
+
+    Args:
+        struct_class (type): Subclass of :class:`~.base.GenericStruct`.
+
+    Returns:
+        numpy.dtype: The type of the struct's fixed-size beginning.
+
+    Raises:
+        ValueError: If the struct does not begin with fixed-size attributes.
+    """
+    try:
+        return _DTYPES[struct_class]
+    except KeyError:
+        pass
+    # pylint: disable=protected-access
+    names, formats, offsets = [], [], []
+    itemsize = 0
+    for field in struct_class._fields:
+        if field.size is None or field.offset is None:
+            break
+        if not isinstance(field.prototype, Pad):
+            dtype = _get_field_dtype(field.prototype)
+            if dtype is None:
+                break
+            names.append(field.name)
+            formats.append(dtype)
+            offsets.append(field.offset)
+        itemsize = field.offset + field.size
+    if not itemsize:
+        msg = '{} does not begin with fixed-size attributes.'
+        raise ValueError(msg.format(struct_class.__name__))
+    dtype = numpy.dtype({'names': names, 'formats': formats,
+                         'offsets': offsets, 'itemsize': itemsize})
+    _DTYPES[struct_class] = dtype
+    return dtype
+
+
+def _get_offsets(struct_class, buff, offset, itemsize):
+    """Find where each struct begins, reading their length attributes."""
+    # pylint: disable=protected-access
+    name = struct_class._struct_length_attribute
+    field = None
+    if name is not None:
+        field = struct_class._fields[struct_class._field_positions[name]]
+    if field is None or field.offset is None or field.size is None:
+        msg = '{} has a variable size but no length attribute.'
+        raise ValueError(msg.format(struct_class.__name__))
+    length_from = struct.Struct('!' + field.prototype.get_fixed_format())
+    length_from = length_from.unpack_from
+    length_offset = field.offset
+    offsets = []
+    end = len(buff)
+    begin = offset
+    while begin < end:
+        offsets.append(begin)
+        try:
+            length = length_from(buff, begin + length_offset)[0]
+        except struct.error:
+            length = 0
+        if length < itemsize:
+            msg = '{} at byte {} has an invalid length.'
+            raise UnpackException(msg.format(struct_class.__name__, begin))
+        begin += length
+    if begin != end:
+        msg = 'Buffer ends in the middle of a {}.'
+        raise UnpackException(msg.format(struct_class.__name__))
+    offsets.append(end)
+    return numpy.array(offsets, dtype=numpy.intp)
+
+
+def unpack_array(struct_class, buff, offset=0):
+    """Decode consecutive structs into a NumPy structured array.
+
+    Structs of static size are mapped onto *buff* without copying it.
+    Structs with a ``_struct_length_attribute`` are located by reading only
+    their lengths one by one, then the fixed-size beginnings of all of them
+    are gathered at once.
+
+    Args:
+        struct_class (type): Subclass of :class:`~.base.GenericStruct`.
+        buff (bytes): Bytes-like object with the structs, e.g. the body of
+            a stats reply.
+        offset (int): Where the first struct begins.
+
+    Returns:
+        StructArray: The structs' records and offsets.
+
+    Raises:
+        :exc:`~.exceptions.UnpackException`: If *buff* does not hold whole
+            structs.
+        ValueError: If the struct class cannot be decoded this way.
+    """
+    dtype = get_dtype(struct_class)
+    itemsize = dtype.itemsize
+    data = numpy.frombuffer(buff, numpy.uint8)
+    # pylint: disable=protected-access
+    if struct_class._struct_length_attribute is None and \
+            struct_class._static_size == itemsize:
+        count, remainder = divmod(len(data) - offset, itemsize)
+        if remainder:
+            msg = 'Buffer does not hold whole {} structs.'
+            raise UnpackException(msg.format(struct_class.__name__))
+        records = numpy.frombuffer(buff, dtype, count, offset)
+        offsets = numpy.arange(offset, len(data) + 1, itemsize,
+                               dtype=numpy.intp)
+        return StructArray(records, offsets)
+    offsets = _get_offsets(struct_class, buff, offset, itemsize)
+    indexes = offsets[:-1, numpy.newaxis] + numpy.arange(itemsize)
+    records = data[indexes].view(dtype).reshape(len(offsets) - 1)
+    return StructArray(records, offsets)
@@ -0,0 +1,238 @@
+"""OpenFlow connections for :mod:`asyncio`.
+
+:class:`OpenFlowProtocol` receives bytes into a
+:class:`~.stream.MessageFramer`, unpacks each message and either passes it
+to a handler or keeps it for an ``async for`` loop. Messages are sent with
+:meth:`~OpenFlowProtocol.send` and :meth:`~OpenFlowProtocol.drain`, which
+waits while too many bytes are waiting to be written:
+
+.. code-block:: python3
+
+    from pyof.foundation.connection import OpenFlowProtocol
+    from pyof.v0x01.common.header import Type
+    from pyof.v0x01.common.utils import unpack_message
+    from pyof.v0x01.symmetric.echo_reply import EchoReply
+
+    transport, protocol = await loop.create_connection(
+        lambda: OpenFlowProtocol(unpack_message), host, 6653)
+    async for message in protocol:
+        if message.header.message_type == Type.OFPT_ECHO_REQUEST:
+            protocol.send(EchoReply(xid=message.header.xid))
+            await protocol.drain()
+
+Both directions have backpressure. Reading from the socket is paused while
+``max_pending`` messages were not consumed by the ``async for`` loop, and
+:meth:`~OpenFlowProtocol.drain` waits while the transport's write buffer is
+above its high-water mark.
+"""
+
+# System imports
+import asyncio
+from collections import deque
+
+# Local source tree imports
+from pyof.foundation.base import pack_many
+from pyof.foundation.exceptions import UnpackException
+from pyof.foundation.stream import MessageFramer
+
+__all__ = ('OpenFlowProtocol',)
+
+#: Minimum number of bytes offered to each read from the socket
+_READ_SIZE = 4096
+
+
+class OpenFlowProtocol(asyncio.BufferedProtocol):
+    """Connection that sends and receives OpenFlow messages.
+
+    Without a handler, received messages are consumed by iterating over the
+    protocol with ``async for``, which ends when the connection is closed.
+    """
+
+    def __init__(self, unpack, handler=None, max_pending=1024,
+                 write_limits=(64 * 1024, 16 * 1024), **framer_options):
+        """Create a protocol for one connection.
+
+        Args:
+            unpack (callable): Function that unpacks a message, header
+                included, e.g. :func:`pyof.v0x01.common.utils.unpack_message`.
+            handler (callable): If given, it is called with each received
+                message instead of keeping it for ``async for``. Errors it
+                raises close the connection.
+            max_pending (int): Number of received messages that, once
+                waiting to be consumed, pause reading. Reading is resumed
+                when half of them are consumed.
+            write_limits (tuple): High and low-water marks of the write
+                buffer, in bytes (see :meth:`drain`).
+            framer_options: Arguments of :class:`~.stream.MessageFramer`.
+        """
+        self.unpack = unpack
+        self.handler = handler
+        self.max_pending = max_pending
+        self.write_limits = write_limits
+        self.transport = None
+        self._framer = MessageFramer(**framer_options)
+        self._messages = deque()
+        self._reading_paused = False
+        self._writing_paused = False
+        #: Future of the ``async for`` loop waiting for a message
+        self._receive_waiter = None
+        #: Futures of :meth:`drain` calls waiting to write
+        self._drain_waiters = []
+        self._closed = False
+        self._exception = None
+
+    # Protocol callbacks
+
+    def connection_made(self, transport):
+        """Store the transport and set its write buffer limits."""
+        self.transport = transport
+        high, low = self.write_limits
+        transport.set_write_buffer_limits(high, low)
+
+    def get_buffer(self, sizehint):
+        """Return the framer's buffer to receive bytes into.
+
+        The event loop passes ``-1`` when it has no size hint, so reads are
+        offered at least :data:`_READ_SIZE` bytes.
+        """
+        return self._framer.get_buffer(max(sizehint, _READ_SIZE))
+
+    def buffer_updated(self, nbytes):
+        """Unpack the messages completed by the received bytes."""
+        self._framer.received(nbytes)
+        self._read_messages()
+
+    def connection_lost(self, exc):
+        """End the ``async for`` loop and fail waiting :meth:`drain` calls."""
+        self._closed = True
+        if self._exception is None:
+            self._exception = exc
+        # Messages received before are still returned by ``async for``.
+        self._read_messages(limit=False)
+        if self._exception is None and self._framer.pending:
+            msg = 'Connection closed in the middle of a message.'
+            self._exception = UnpackException(msg)
+        self._wake_receiver()
+        error = exc or ConnectionResetError('Connection lost')
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_exception(error)
+        self._drain_waiters.clear()
+
+    def pause_writing(self):
+        """Make :meth:`drain` wait, as the write buffer is full."""
+        self._writing_paused = True
+
+    def resume_writing(self):
+        """Wake waiting :meth:`drain` calls."""
+        self._writing_paused = False
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._drain_waiters.clear()
+
+    # Receiving
+
+    def _read_messages(self, limit=True):
+        """Unpack complete messages until too many are pending."""
+        try:
+            for frame in self._framer.frames():
+                message = self.unpack(frame)
+                if self.handler is not None:
+                    self.handler(message)
+                    continue
+                self._messages.append(message)
+                if limit and len(self._messages) >= self.max_pending:
+                    # The remaining frames stay in the framer.
+                    if not self._reading_paused:
+                        self._reading_paused = True
+                        self.transport.pause_reading()
+                    break
+        except Exception as error:  # pylint: disable=broad-except
+            # Framing or unpacking errors leave the stream unusable.
+            self._exception = error
+            self.transport.close()
+        self._wake_receiver()
+
+    def _wake_receiver(self):
+        waiter = self._receive_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """Return the next received message.
+
+        Raises:
+            StopAsyncIteration: If the connection was closed cleanly.
+            Exception: The error that closed the connection, if any.
+        """
+        while not self._messages:
+            if self._closed:
+                if self._exception is not None:
+                    raise self._exception
+                raise StopAsyncIteration
+            self._receive_waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._receive_waiter
+            finally:
+                self._receive_waiter = None
+        message = self._messages.popleft()
+        if self._reading_paused and \
+                len(self._messages) <= self.max_pending // 2:
+            self._reading_paused = False
+            self._read_messages()
+            if not self._reading_paused and not self._closed:
+                self.transport.resume_reading()
+        return message
+
+    # Sending
+
+    def send(self, message):
+        """Pack *message* and add it to the write buffer.
+
+        Call :meth:`drain` regularly to wait while the buffer is full.
+
+        Args:
+            message (GenericMessage): Message to be sent.
+        """
+        self.transport.write(message.pack())
+
+    def send_many(self, messages, xids=None):
+        """Pack several messages and add them to the write buffer at once.
+
+        Args:
+            messages (iterable): Messages to be sent, in order.
+            xids (iterable): Optional xids of the messages (see
+                :func:`~.base.pack_many`).
+        """
+        self.transport.write(pack_many(messages, xids))
+
+    def send_bytes(self, data):
+        """Add packed messages to the write buffer.
+
+        Args:
+            data (bytes): One or more packed messages.
+        """
+        self.transport.write(data)
+
+    async def drain(self):
+        """Wait until the write buffer is below its low-water mark.
+
+        Raises:
+            ConnectionResetError: If the connection is lost.
+        """
+        if self._closed:
+            raise self._exception or ConnectionResetError('Connection lost')
+        if not self._writing_paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+    def close(self):
+        """Close the connection after sending the buffered messages."""
+        if self.transport is not None:
+            self.transport.close()
@@ -0,0 +1,242 @@
+"""Matching of replies to requests by transaction id.
+
+Replies carry the xid of the request that caused them. A
+:class:`Correlator` assigns xids to the requests of one connection and
+returns a future for each one, which is resolved by the reply, failed with
+:exc:`~.exceptions.ErrorReply` by an error message or failed with
+:exc:`asyncio.TimeoutError` if no reply arrives in time:
+
+.. code-block:: python3
+
+    from pyof.foundation.correlation import Correlator
+
+    correlator = Correlator(timeout=5)
+
+    async def barrier(protocol):
+        request = BarrierRequest()
+        reply = correlator.request(request)
+        protocol.send(request)
+        return await reply
+
+    # Where messages are received:
+    async for message in protocol:
+        if not correlator.dispatch(message):
+            handle(message)
+
+Requests that expire are found by a hashed timer wheel, so the cost of
+keeping many requests in flight does not grow with their number.
+"""
+
+# System imports
+import asyncio
+import functools
+import random
+
+# Local source tree imports
+from pyof.foundation.exceptions import ErrorReply
+
+__all__ = ('Correlator', 'XidAllocator')
+
+#: Message type of error messages in every OpenFlow version (OFPT_ERROR).
+_ERROR_TYPE = 1
+
+
+def _get_number(value):
+    """Return the number of a header attribute, enum or integer."""
+    return getattr(value, 'value', value)
+
+
+class XidAllocator:
+    """Iterator of the xids of one connection.
+
+    Xids are sequential, starting at a random number, and wrap around after
+    ``0xffffffff``. It can be passed as the *xids* of
+    :func:`~.base.pack_many`.
+    """
+
+    def __init__(self, first=None, in_use=None):
+        """Create an allocator.
+
+        Args:
+            first (int): First xid. Defaults to a random integer.
+            in_use (container): Xids that must be skipped, e.g. those of
+                requests waiting for replies.
+        """
+        self._next = random.getrandbits(32) if first is None else first
+        self._in_use = () if in_use is None else in_use
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        xid = self._next
+        while xid in self._in_use:
+            xid = (xid + 1) & 0xffffffff
+        self._next = (xid + 1) & 0xffffffff
+        return xid
+
+
+class Correlator:
+    """Futures of the requests of one connection, by xid.
+
+    It must be used in an :mod:`asyncio` event loop, which runs the timer
+    that expires requests.
+    """
+
+    def __init__(self, timeout=10.0, resolution=0.1, slots=512):
+        """Create an empty table.
+
+        Args:
+            timeout (float): Default seconds to wait for each reply.
+            resolution (float): Seconds between checks for expired
+                requests. Requests expire up to this late.
+            slots (int): Number of slots of the timer wheel.
+        """
+        self.timeout = timeout
+        self.resolution = resolution
+        #: Future and expiration tick of each request, by xid
+        self._pending = {}
+        #: Xids of the requests that may expire at each tick, modulo slots
+        self._wheel = [set() for _ in range(slots)]
+        self._xids = XidAllocator(in_use=self._pending)
+        self._loop = None
+        self._timer = None
+        #: Last tick whose slot was checked
+        self._tick = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, xid):
+        return xid in self._pending
+
+    def next_xid(self):
+        """Return an xid that is not used by any request waiting for reply.
+
+        Returns:
+            int: The xid.
+        """
+        return next(self._xids)
+
+    def request(self, message, timeout=None):
+        """Set a new xid to *message* and wait for the reply to it.
+
+        Args:
+            message (GenericMessage): Request to be sent after this call.
+            timeout (float): Seconds to wait for the reply. Defaults to
+                :attr:`timeout`.
+
+        Returns:
+            asyncio.Future: Future of the reply.
+        """
+        xid = self.next_xid()
+        message.header.xid = xid
+        return self.expect(xid, timeout)
+
+    def expect(self, xid, timeout=None):
+        """Wait for the reply to the request with *xid*.
+
+        Args:
+            xid (int): Xid of the request.
+            timeout (float): Seconds to wait for the reply. Defaults to
+                :attr:`timeout`.
+
+        Returns:
+            asyncio.Future: Future of the reply. Cancelling it stops
+                waiting.
+
+        Raises:
+            ValueError: If a request with the same xid is waiting.
+        """
+        if xid in self._pending:
+            raise ValueError('Xid {} is already waiting for a reply.'
+                             .format(xid))
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._tick = self._get_tick()
+        if timeout is None:
+            timeout = self.timeout
+        future = self._loop.create_future()
+        # Round up, so requests never expire early.
+        tick = self._get_tick() + 1 + int(timeout / self.resolution)
+        self._pending[xid] = (future, tick)
+        self._wheel[tick % len(self._wheel)].add(xid)
+        future.add_done_callback(functools.partial(self._discard, xid))
+        if self._timer is None:
+            self._timer = self._loop.call_later(self.resolution,
+                                                self._expire)
+        return future
+
+    def dispatch(self, message):
+        """Resolve the future of the request that *message* replies to.
+
+        Error messages fail the future with
+        :exc:`~.exceptions.ErrorReply`.
+
+        Args:
+            message (GenericMessage): Received message.
+
+        Returns:
+            bool: Whether *message* was a reply to a waiting request.
+        """
+        xid = _get_number(message.header.xid)
+        entry = self._pending.get(xid)
+        if entry is None:
+            return False
+        future = entry[0]
+        self._discard(xid, future)
+        if not future.done():
+            if _get_number(message.header.message_type) == _ERROR_TYPE:
+                future.set_exception(ErrorReply(message))
+            else:
+                future.set_result(message)
+        return True
+
+    def cancel_all(self, exception=None):
+        """Stop waiting for every request, e.g. when the connection is lost.
+
+        Args:
+            exception (Exception): Error set to the futures. By default,
+                they are cancelled.
+        """
+        for future, _ in list(self._pending.values()):
+            if future.done():
+                continue
+            if exception is None:
+                future.cancel()
+            else:
+                future.set_exception(exception)
+        self._pending.clear()
+        for slot in self._wheel:
+            slot.clear()
+
+    def _discard(self, xid, future):
+        """Remove a request from the table, if it is still there."""
+        entry = self._pending.get(xid)
+        if entry is not None and entry[0] is future:
+            del self._pending[xid]
+            self._wheel[entry[1] % len(self._wheel)].discard(xid)
+
+    def _get_tick(self):
+        return int(self._loop.time() / self.resolution)
+
+    def _expire(self):
+        """Fail the requests whose time is over and schedule the next run."""
+        now = self._get_tick()
+        slots = len(self._wheel)
+        # After a long pause, every slot is checked once.
+        for tick in range(max(self._tick + 1, now - slots + 1), now + 1):
+            slot = self._wheel[tick % slots]
+            expired = [xid for xid in slot if self._pending[xid][1] <= now]
+            for xid in expired:
+                future = self._pending.pop(xid)[0]
+                slot.discard(xid)
+                if not future.done():
+                    future.set_exception(asyncio.TimeoutError(
+                        'No reply to xid {}.'.format(xid)))
+        self._tick = now
+        if self._pending:
+            self._timer = self._loop.call_later(self.resolution,
+                                                self._expire)
+        else:
+            self._timer = None
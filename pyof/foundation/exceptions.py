@@ -59,3 +59,19 @@ class PackException(Exception):
 
     def __str__(self):
         return "Pack error: " + super().__str__()
+
+
+class ErrorReply(Exception):
+    """A request was answered with an error message."""
+
+    def __init__(self, message):
+        """Store the error message.
+
+        Args:
+            message (GenericMessage): The reply, e.g. an ``ErrorMsg``.
+        """
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return "Error reply: {}".format(type(self.message).__name__)
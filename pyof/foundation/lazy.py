@@ -0,0 +1,62 @@
+"""Lazy loading of python-openflow packages.
+
+The packages of each OpenFlow version do not import their modules up front.
+Instead, a module is imported when it is first accessed as an attribute of
+its package (see :pep:`562`):
+
+.. code-block:: python3
+
+    import pyof.v0x01
+
+    header = pyof.v0x01.common.header.Header()
+"""
+
+# System imports
+import importlib
+import os
+
+__all__ = ('lazy_modules',)
+
+
+def lazy_modules(namespace):
+    """Return the ``__getattr__`` and ``__dir__`` functions of a package.
+
+    Call it in the package's ``__init__.py``:
+
+    .. code-block:: python3
+
+        __getattr__, __dir__ = lazy_modules(globals())
+
+    Args:
+        namespace (dict): The package's globals.
+
+    Returns:
+        tuple: Functions that import and list the package's modules and
+            subpackages.
+    """
+    package_name = namespace['__name__']
+
+    def __getattr__(name):  # pylint: disable=invalid-name
+        if not name.startswith('__'):
+            module_name = package_name + '.' + name
+            try:
+                return importlib.import_module(module_name)
+            except ModuleNotFoundError as error:
+                # Errors of modules imported by the module are not hidden.
+                if error.name != module_name:
+                    raise
+        msg = 'module {!r} has no attribute {!r}'.format(package_name, name)
+        raise AttributeError(msg)
+
+    def __dir__():  # pylint: disable=invalid-name
+        names = set(namespace)
+        for path in namespace['__path__']:
+            for entry in os.listdir(path):
+                if entry.endswith('.py') and entry != '__init__.py':
+                    names.add(entry[:-3])
+                elif os.path.isfile(os.path.join(path, entry,
+                                                 '__init__.py')):
+                    names.add(entry)
+        return sorted(names)
+
+    return __getattr__, __dir__
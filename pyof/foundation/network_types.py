@@ -125,7 +125,7 @@ class GenericTLV:
             Exception: If there is a struct unpacking error.
         """
         header = UBInt16()
-        header.unpack(buffer[offset:offset+2])
+        header.unpack(buffer, offset)
         self.type = header.value >> 9
         length = header.value & 511
         begin, end = offset + 2, offset + 2 + length
@@ -175,12 +175,12 @@ class TLVWithSubType(GenericTLV):
             Exception: If there is a struct unpacking error.
         """
         header = UBInt16()
-        header.unpack(buffer[offset:offset+2])
+        header.unpack(buffer, offset)
         self.type = header.value >> 9
         length = header.value & 511
         begin, end = offset + 2, offset + 2 + length
         sub_type = UBInt8()
-        sub_type.unpack(buffer[begin:begin+1])
+        sub_type.unpack(buffer, begin)
         self.sub_type = sub_type.value
         self.sub_value = BinaryData(buffer[begin+1:end])
 
@@ -0,0 +1,66 @@
+"""Pools of reusable structs and messages.
+
+Decoding many messages with :meth:`~.base.GenericStruct.unpack` creates new
+objects for every message and attribute. A pool keeps released instances so
+that they are decoded again with :meth:`~.base.GenericStruct.unpack_into`,
+which reuses their attribute objects:
+
+.. code-block:: python3
+
+    from pyof.foundation.pool import StructPool
+    from pyof.v0x01.common.utils import unpack_message
+
+    pool = StructPool()
+    message = unpack_message(data, pool)
+    handle(message)
+    pool.release(message)
+
+A released instance must not be used anymore, because it will be
+overwritten by the next message of its class.
+"""
+
+__all__ = ('StructPool',)
+
+
+class StructPool:
+    """Free instances of struct and message classes, by class."""
+
+    def __init__(self, max_size=64):
+        """Create an empty pool.
+
+        Args:
+            max_size (int): Maximum number of free instances kept for each
+                class. Instances released beyond it are discarded.
+        """
+        self.max_size = max_size
+        self._free = {}
+
+    def acquire(self, struct_class):
+        """Return a released instance of *struct_class* or a new one.
+
+        Args:
+            struct_class (type): Struct or message class.
+
+        Returns:
+            GenericStruct: An instance whose attributes are to be
+                overwritten, e.g. by :meth:`~.base.GenericStruct.unpack_into`.
+        """
+        free = self._free.get(struct_class)
+        if free:
+            return free.pop()
+        return struct_class()
+
+    def release(self, instance):
+        """Keep *instance* to be returned by :meth:`acquire`.
+
+        Args:
+            instance (GenericStruct): Struct or message that is no longer
+                used by the caller.
+        """
+        free = self._free.setdefault(type(instance), [])
+        if len(free) < self.max_size:
+            free.append(instance)
+
+    def clear(self):
+        """Discard all free instances."""
+        self._free.clear()
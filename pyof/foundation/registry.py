@@ -0,0 +1,112 @@
+"""Message classes by OpenFlow version and message type.
+
+The ``common.utils`` module of each OpenFlow version registers the modules of
+its messages. Their classes are kept in a table with one list per version,
+indexed by the message type number, so the class of a received message is
+found with two list lookups, straight from the first bytes of its header:
+
+.. code-block:: python3
+
+    from pyof.foundation.registry import get_message_class
+
+    message_class = get_message_class(buffer[0], buffer[1])
+
+Message modules are only imported when their class is first requested.
+"""
+
+# System imports
+import importlib
+
+__all__ = ('get_message_class', 'import_version', 'register')
+
+#: Package of each version, whose messages are registered when first needed
+_VERSION_PACKAGES = {0x01: 'pyof.v0x01', 0x04: 'pyof.v0x04'}
+
+#: Message class of each message type number, by version number. Classes are
+#: ``None`` until loaded and so are the versions without messages.
+_CLASSES = [None] * 256
+
+#: Module and class names of each message type number, by version number
+_MODULES = {}
+
+
+def register(version, package, modules):
+    """Register the messages of an OpenFlow version.
+
+    Args:
+        version (int): Version number, e.g. ``0x01``.
+        package (str): Package of the version, e.g. ``'pyof.v0x01'``.
+        modules (dict): Module, relative to *package*, and class name of
+            each message type (an enum member or its number).
+    """
+    _MODULES[version] = {
+        getattr(message_type, 'value', message_type):
+        (package + '.' + module_name, class_name)
+        for message_type, (module_name, class_name) in modules.items()}
+    _CLASSES[version] = [None] * 256
+
+
+def get_message_class(version, message_type):
+    """Return the class of a message, importing its module if needed.
+
+    Args:
+        version (int): Version number.
+        message_type (int): Message type number or enum member.
+
+    Returns:
+        type: The message class.
+
+    Raises:
+        ValueError: Unknown version or message type.
+    """
+    try:
+        message_class = _CLASSES[version][message_type]
+    except (IndexError, TypeError):
+        message_class = None
+    if message_class is None:
+        message_class = _load(version, message_type)
+    return message_class
+
+
+def import_version(version):
+    """Return the ``common.utils`` module of a version, which registers it.
+
+    Args:
+        version (int): Version number.
+
+    Returns:
+        module: The version's ``common.utils`` module.
+
+    Raises:
+        ValueError: If the version is not implemented or its package is not
+            installed.
+    """
+    try:
+        package = _VERSION_PACKAGES[version]
+    except (KeyError, TypeError):
+        raise ValueError('Version {} is not implemented.'.format(version))
+    module_name = package + '.common.utils'
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as error:
+        # Errors of modules imported by the version are not hidden.
+        if error.name is None or \
+                not (module_name + '.').startswith(error.name + '.'):
+            raise
+        msg = 'Version {} is not installed.'.format(version)
+        raise ValueError(msg) from error
+
+
+def _load(version, message_type):
+    """Import the class of a message and store it in the table."""
+    message_type = getattr(message_type, 'value', message_type)
+    if version not in _MODULES:
+        import_version(version)
+    try:
+        module_name, class_name = _MODULES[version][message_type]
+    except (KeyError, TypeError):
+        msg = 'Message type {} of version {} is not known.'
+        raise ValueError(msg.format(message_type, version))
+    message_class = getattr(importlib.import_module(module_name), class_name)
+    _CLASSES[version][message_type] = message_class
+    return message_class
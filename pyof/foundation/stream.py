@@ -0,0 +1,173 @@
+"""Split a byte stream into OpenFlow messages.
+
+OpenFlow messages are sent over TCP or TLS streams, which deliver them in
+arbitrary chunks: a chunk may hold part of a message, several messages or
+both. :class:`MessageFramer` collects the chunks in a reusable buffer and
+returns each complete message as soon as its last byte is received, using
+the length in the message's header:
+
+.. code-block:: python3
+
+    from pyof.foundation.stream import MessageFramer
+    from pyof.v0x01.common.utils import unpack_message
+
+    framer = MessageFramer()
+    while True:
+        nbytes = sock.recv_into(framer.get_buffer())
+        if not nbytes:
+            break
+        framer.received(nbytes)
+        for message in framer.messages(unpack_message):
+            handle(message)
+
+The header layout is the same in every OpenFlow version, so the framer
+works with any of them.
+"""
+
+# System imports
+import struct
+
+# Local source tree imports
+from pyof.foundation.exceptions import UnpackException
+
+__all__ = ('MessageFramer',)
+
+#: Version, message type and length, the beginning of every OpenFlow header.
+_HEADER_START = struct.Struct('!BBH')
+
+#: Size of the OpenFlow header.
+HEADER_SIZE = 8
+
+
+class MessageFramer:
+    """Buffer that splits a stream of bytes into messages.
+
+    Bytes are written into the buffer returned by :meth:`get_buffer`, e.g.
+    with :meth:`socket.socket.recv_into`, or copied by :meth:`feed`.
+    Complete messages are then returned by :meth:`frames` as
+    :class:`memoryview` objects of the buffer, without copying them.
+
+    Consumed bytes are discarded when more room is needed, by moving the
+    incomplete message to the beginning of the buffer. The buffer is replaced
+    by a bigger one if a message does not fit.
+
+    A frame is valid until the next call to :meth:`get_buffer` or
+    :meth:`feed`. Unpacked messages copy their data, unless they use
+    :attr:`.BinaryData.zero_copy`.
+    """
+
+    def __init__(self, size=65536, max_length=0xffff, versions=None):
+        """Create an empty framer.
+
+        Args:
+            size (int): Initial size of the buffer in bytes.
+            max_length (int): Largest message length accepted.
+            versions (iterable): OpenFlow versions accepted, e.g.
+                ``(0x01, 0x04)``. By default, any version is accepted.
+        """
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        #: Beginning of the bytes that were not returned as frames
+        self._start = 0
+        #: End of the received bytes
+        self._end = 0
+        self.max_length = max_length
+        self.versions = None if versions is None else frozenset(versions)
+
+    @property
+    def pending(self):
+        """int: Number of received bytes that are not part of a frame."""
+        return self._end - self._start
+
+    def get_buffer(self, size=4096):
+        """Return the free part of the buffer, to receive more bytes.
+
+        Call :meth:`received` with the number of bytes written into it.
+
+        Args:
+            size (int): Minimum size of the returned buffer.
+
+        Returns:
+            memoryview: Writable view of at least *size* bytes.
+        """
+        if self._start == self._end:
+            self._start = self._end = 0
+        if len(self._buffer) - self._end < size:
+            self._make_room(size)
+        return self._view[self._end:]
+
+    def _make_room(self, size):
+        """Move the pending bytes to the beginning of a big enough buffer."""
+        pending = self._end - self._start
+        if pending + size > len(self._buffer):
+            # Frames returned before keep the old buffer alive.
+            buffer = bytearray(max(pending + size, 2 * len(self._buffer)))
+            buffer[:pending] = self._view[self._start:self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        elif pending:
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+        self._start, self._end = 0, pending
+
+    def received(self, nbytes):
+        """Add bytes written into the buffer returned by :meth:`get_buffer`.
+
+        Args:
+            nbytes (int): Number of bytes written.
+        """
+        if not 0 <= nbytes <= len(self._buffer) - self._end:
+            raise ValueError('{} bytes do not fit in the buffer.'
+                             .format(nbytes))
+        self._end += nbytes
+
+    def feed(self, data):
+        """Copy *data* into the buffer.
+
+        Args:
+            data (bytes): Bytes-like object received from the stream.
+        """
+        size = len(data)
+        self.get_buffer(size)[:size] = data
+        self._end += size
+
+    def frames(self):
+        """Yield the complete messages received so far.
+
+        Each message is removed from the buffer as it is yielded, so the
+        remaining ones are yielded by the next call if the iteration stops.
+
+        Yields:
+            memoryview: Bytes of a message, header included.
+
+        Raises:
+            :exc:`~.exceptions.UnpackException`: If a header has an invalid
+                length or an unexpected version. The stream cannot be split
+                after that.
+        """
+        while self._end - self._start >= _HEADER_START.size:
+            start = self._start
+            version, _, length = _HEADER_START.unpack_from(self._buffer,
+                                                           start)
+            if length < HEADER_SIZE or length > self.max_length:
+                msg = 'Invalid message length {} at stream byte {}.'
+                raise UnpackException(msg.format(length, start))
+            if self.versions is not None and version not in self.versions:
+                msg = 'Unexpected OpenFlow version {} at stream byte {}.'
+                raise UnpackException(msg.format(version, start))
+            if self._end - start < length:
+                return
+            self._start = start + length
+            yield self._view[start:start + length]
+
+    def messages(self, unpack):
+        """Yield the complete messages received so far, unpacked.
+
+        Args:
+            unpack (callable): Function that unpacks a message, header
+                included, e.g. :func:`pyof.v0x01.common.utils.unpack_message`.
+
+        Yields:
+            GenericMessage: Each unpacked message.
+        """
+        for frame in self.frames():
+            yield unpack(frame)
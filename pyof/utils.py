@@ -0,0 +1,51 @@
+"""Helper functions for every implemented OpenFlow version.
+
+Connections that may speak several versions unpack their messages with
+:func:`unpack_message`, which reads the version byte of each header:
+
+.. code-block:: python3
+
+    from pyof.foundation.connection import OpenFlowProtocol
+    from pyof.utils import unpack_message
+
+    protocol = OpenFlowProtocol(unpack_message)
+
+The package of a version is only imported when its first message arrives.
+"""
+
+# Local source tree imports
+from pyof.foundation import registry
+from pyof.foundation.exceptions import UnpackException
+
+__all__ = ('unpack_message',)
+
+#: The ``unpack_message`` function of each version number, once imported
+_UNPACK_FUNCTIONS = [None] * 256
+
+
+def unpack_message(buffer, pool=None):
+    """Unpack a message of any implemented version, header included.
+
+    Args:
+        buffer (bytes): Binary data of a message, header included.
+        pool (~pyof.foundation.pool.StructPool): Optional pool of messages
+            (see :func:`pyof.v0x01.common.utils.unpack_message`).
+
+    Returns:
+        GenericMessage: The unpacked message.
+
+    Raises:
+        :exc:`~.exceptions.UnpackException`: If the version is not
+            implemented or installed, or the message cannot be unpacked.
+    """
+    if not buffer:
+        raise UnpackException('Empty buffer.')
+    version = buffer[0]
+    unpack = _UNPACK_FUNCTIONS[version]
+    if unpack is None:
+        try:
+            unpack = registry.import_version(version).unpack_message
+        except ValueError as error:
+            raise UnpackException(str(error))
+        _UNPACK_FUNCTIONS[version] = unpack
+    return unpack(buffer, pool)
@@ -1 +1,4 @@
 """The ofx parser package - spec version 0x01 (1.0.0)."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
@@ -1 +1,4 @@
 """Asynchronous messages."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
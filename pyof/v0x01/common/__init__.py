@@ -1 +1,4 @@
 """Common structures used on OpenFlow Protocol."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
@@ -73,28 +73,21 @@ class ActionHeader(GenericStruct):
         self.action_type = action_type
         self.length = length
 
-    def unpack(self, buff, offset=0):
-        """Unpack a binary message into this object's attributes.
-
-        Unpack the binary value *buff* and update this object attributes based
-        on the results.
+    @classmethod
+    def get_action_class(cls, action_type):
+        """Return the class of the actions of a type.
 
         Args:
-            buff (bytes): Binary data package to be unpacked.
-            offset (int): Where to begin unpacking.
+            action_type (int): Value of :attr:`action_type`.
 
-        Raises:
-            Exception: If there is a struct unpacking error.
+        Returns:
+            type: Subclass that allows *action_type* or this class if there
+                is none.
         """
-        self.action_type = UBInt16(enum_ref=ActionType)
-        self.action_type.unpack(buff, offset)
-
-        for cls in ActionHeader.__subclasses__():
-            if self.action_type.value in cls.get_allowed_types():
-                self.__class__ = cls
-                break
-
-        super().unpack(buff, offset)
+        for action_class in cls.__subclasses__():
+            if action_type in action_class.get_allowed_types():
+                return action_class
+        return cls
 
     @classmethod
     def get_allowed_types(cls):
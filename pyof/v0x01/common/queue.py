@@ -75,6 +75,8 @@ class PacketQueue(GenericStruct):
     pad = Pad(2)
     properties = ListOfProperties()
 
+    _struct_length_attribute = 'length'
+
     def __init__(self, queue_id=None, length=None, properties=None):
         """The contructor takes the paremeters below.
 
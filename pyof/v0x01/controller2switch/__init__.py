@@ -1 +1,4 @@
 """Controller to Switch and Switch to Controller Messages."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
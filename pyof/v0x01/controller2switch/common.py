@@ -100,6 +100,22 @@ class ListOfActions(FixedTypeList):
         """
         super().__init__(pyof_class=ActionHeader, items=items)
 
+    def unpack(self, buff, offset=0):
+        """Unpack the actions, each one as an instance of its own class.
+
+        Args:
+            buff (bytes): The binary data to be unpacked.
+            offset (int): If we need to shift the beginning of the data.
+        """
+        action_type = UBInt16()
+        begin = offset
+        while begin < len(buff):
+            action_type.unpack(buff, begin)
+            action = ActionHeader.get_action_class(action_type.value)()
+            action.unpack(buff, begin)
+            self.append(action)
+            begin += action.get_size()
+
 
 class AggregateStatsReply(GenericStruct):
     """Body of reply to OFPST_AGGREGATE request."""
@@ -201,6 +217,8 @@ class FlowStats(GenericStruct):
     byte_count = UBInt64()
     actions = ListOfActions()
 
+    _struct_length_attribute = 'length'
+
     def __init__(self, length=None, table_id=None, match=None,
                  duration_sec=None, duration_nsec=None, priority=None,
                  idle_timeout=None, hard_timeout=None, cookie=None,
@@ -237,21 +255,6 @@ class FlowStats(GenericStruct):
         self.byte_count = byte_count
         self.actions = [] if actions is None else actions
 
-    def unpack(self, buff, offset=0):
-        """Unpack *buff* into this object.
-
-        Do nothing, since the _length is already defined and it is just a Pad.
-        Keep buff and offset just for compability with other unpack methods.
-
-        Args:
-            buff: Buffer where data is located.
-            offset (int): Where data stream begins.
-        """
-        self.length = UBInt16()
-        self.length.unpack(buff, offset)
-        max_length = offset + self.length.value
-        super().unpack(buff[:max_length], offset)
-
 
 class FlowStatsRequest(GenericStruct):
     """Body for ofp_stats_request of type OFPST_FLOW."""
@@ -1,6 +1,4 @@
 """For the controller to send a packet out through the datapath."""
-from copy import deepcopy
-
 from pyof.foundation.base import GenericMessage
 from pyof.foundation.basic_types import BinaryData, UBInt16, UBInt32
 from pyof.foundation.exceptions import PackException, ValidationError
@@ -27,6 +25,8 @@ class PacketOut(GenericMessage):
     actions = ListOfActions()
     data = BinaryData()
 
+    _length_attributes = {'actions_len': 'actions'}
+
     def __init__(self, xid=None, buffer_id=NO_BUFFER, in_port=Port.OFPP_NONE,
                  actions=None, data=b''):
         """The constructor just assings parameters to object attributes.
@@ -62,46 +62,23 @@ class PacketOut(GenericMessage):
         except ValidationError:
             return False
 
-    def pack(self, value=None):
-        """Update the action_len attribute and call super's pack."""
+    def pack_into(self, buff, offset=0, value=None):
+        """Update the action_len attribute and call super's pack_into.
+
+        The input port is always validated, even if
+        :attr:`~.GenericStruct.validate_on_pack` is False.
+        """
         if value is None:
+            self._validate_in_port()
             self._update_actions_len()
-            return super().pack()
+            return super().pack_into(buff, offset)
         elif isinstance(value, type(self)):
-            return value.pack()
+            return value.pack_into(buff, offset)
         else:
             msg = "{} is not an instance of {}".format(value,
                                                        type(self).__name__)
             raise PackException(msg)
 
-    def unpack(self, buff, offset=0):
-        """Unpack a binary message into this object's attributes.
-
-        Unpack the binary value *buff* and update this object attributes based
-        on the results. It is an inplace method and it receives the binary data
-        of the message **without the header**.
-
-        This class' unpack method is like the :meth:`.GenericMessage.unpack`
-        one, except for the ``actions`` attribute which has a length determined
-        by the ``actions_len`` attribute.
-
-        Args:
-            buff (bytes): Binary data package to be unpacked, without the
-                header.
-            offset (int): Where to begin unpacking.
-        """
-        begin = offset
-        for attribute_name, class_attribute in self.get_class_attributes():
-            if type(class_attribute).__name__ != "Header":
-                attribute = deepcopy(class_attribute)
-                if attribute_name == 'actions':
-                    length = self.actions_len.value
-                    attribute.unpack(buff[begin:begin+length])
-                else:
-                    attribute.unpack(buff, begin)
-                setattr(self, attribute_name, attribute)
-                begin += attribute.get_size()
-
     def _update_actions_len(self):
         """Update the actions_len field based on actions value."""
         if isinstance(self.actions, ListOfActions):
@@ -1,6 +1,7 @@
 """Response the stat request packet from the controller."""
 from pyof.foundation.base import GenericMessage
-from pyof.foundation.basic_types import BinaryData, FixedTypeList, UBInt16
+from pyof.foundation.basic_types import (BinaryData, LazyFixedTypeList,
+                                         UBInt16)
 from pyof.v0x01.common.header import Header, Type
 from pyof.v0x01.controller2switch.common import (AggregateStatsReply,
                                                  DescStats, FlowStats,
@@ -31,7 +32,7 @@ class StatsReply(GenericMessage):
         self.flags = flags
         self.body = body
 
-    def unpack(self, buff):
+    def unpack(self, buff, offset=0):
         """Unpack a binary message into this object's attributes.
 
         Unpack the binary value *buff* and update this object attributes based
@@ -40,20 +41,24 @@ class StatsReply(GenericMessage):
 
         This class' unpack method is like the :meth:`.GenericMessage.unpack`
         one, except for the ``body`` attribute which has its type determined
-        by the ``body_type`` attribute.
+        by the ``body_type`` attribute. Lists of stats are
+        :class:`.LazyFixedTypeList` instances, whose items are decoded when
+        they are read.
 
         Args:
             buff (bytes): Binary data package to be unpacked, without the
                 header.
+            offset (int): Where to begin unpacking.
         """
-        super().unpack(buff)
+        super().unpack(buff, offset)
 
         if self.body_type == StatsTypes.OFPST_PORT:
-            self._unpack_body(FixedTypeList(pyof_class=PortStats))
+            self._unpack_body(LazyFixedTypeList(pyof_class=PortStats))
         elif self.body_type == StatsTypes.OFPST_AGGREGATE:
-            self._unpack_body(FixedTypeList(pyof_class=AggregateStatsReply))
+            self._unpack_body(
+                LazyFixedTypeList(pyof_class=AggregateStatsReply))
         elif self.body_type == StatsTypes.OFPST_FLOW:
-            self._unpack_body(FixedTypeList(pyof_class=FlowStats))
+            self._unpack_body(LazyFixedTypeList(pyof_class=FlowStats))
         elif self.body_type == StatsTypes.OFPST_DESC:
             self._unpack_body(DescStats())
 
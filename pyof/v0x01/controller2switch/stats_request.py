@@ -38,26 +38,9 @@ class StatsRequest(GenericMessage):
         self.flags = flags
         self.body = body
 
-    def pack(self):
-        """Pack according to :attr:`body_type`.
-
-        Make `body` a binary pack before packing this object. Then, restore
-        body.
-        """
-        if self.body_type == StatsTypes.OFPST_PORT or \
-           self.body_type == StatsTypes.OFPST_FLOW or \
-           self.body_type == StatsTypes.OFPST_AGGREGATE:
-            backup = self.body
-            self.body = self.body.pack()
-            pack = super().pack()
-            self.body = backup
-            return pack
-        else:
-            return super().pack()
-
-    def unpack(self, buff):
+    def unpack(self, buff, offset=0):
         """Unpack according to :attr:`body_type`."""
-        super().unpack(buff)
+        super().unpack(buff, offset)
         if self.body_type == StatsTypes.OFPST_PORT:
             buff = self.body.value
             self.body = PortStatsRequest()
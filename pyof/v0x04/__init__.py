@@ -1 +1,4 @@
 """The ofx parser package - spec version 0x04 (1.3.0)."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
@@ -90,7 +90,7 @@ class Header(GenericStruct):
     length = UBInt16()
     xid = UBInt32()
 
-    def __init__(self, message_type=None, length=None, xid=randint(0, MAXID)):
+    def __init__(self, message_type=None, length=None, xid=None):
         """The constructor takes the optional parameters below.
 
         Args:
@@ -98,8 +98,9 @@ class Header(GenericStruct):
             length (int): Length including this ofp_header.
             xid (int): Transaction id associated with this packet. Replies use
                 the same id as was in the request to facilitate pairing.
+                Defaults to a random integer.
         """
         super().__init__()
         self.message_type = message_type
         self.length = length
-        self.xid = xid
+        self.xid = randint(0, MAXID) if xid is None else xid
@@ -86,6 +86,8 @@ class PacketQueue(GenericStruct):
     #: List of properties
     properties = ListOfProperties()
 
+    _struct_length_attribute = 'length'
+
     def __init__(self, queue_id=None, port=None, length=None, properties=None):
         """The contructor takes the paremeters below.
 
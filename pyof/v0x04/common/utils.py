@@ -1,38 +1,85 @@
 """Helper python-openflow functions."""
 
-# System imports
-
 # Third-party imports
 
 # Local source tree imports
-# Importing asynchronous messages
-from pyof.v0x04.asynchronous.error_msg import ErrorMsg
-from pyof.v0x04.asynchronous.flow_removed import FlowRemoved
-from pyof.v0x04.asynchronous.packet_in import PacketIn
-from pyof.v0x04.asynchronous.port_status import PortStatus
-# Importing controller2switch messages
-from pyof.v0x04.common.header import Type
-from pyof.v0x04.controller2switch.barrier_reply import BarrierReply
-from pyof.v0x04.controller2switch.barrier_request import BarrierRequest
-from pyof.v0x04.controller2switch.features_reply import FeaturesReply
-from pyof.v0x04.controller2switch.features_request import FeaturesRequest
-from pyof.v0x04.controller2switch.flow_mod import FlowMod
-from pyof.v0x04.controller2switch.get_config_reply import GetConfigReply
-from pyof.v0x04.controller2switch.get_config_request import GetConfigRequest
-from pyof.v0x04.controller2switch.packet_out import PacketOut
-from pyof.v0x04.controller2switch.port_mod import PortMod
-from pyof.v0x04.controller2switch.queue_get_config_reply import \
-    QueueGetConfigReply
-from pyof.v0x04.controller2switch.queue_get_config_request import \
-    QueueGetConfigRequest
-from pyof.v0x04.controller2switch.set_config import SetConfig
-# Importing symmetric messages
-from pyof.v0x04.symmetric.echo_reply import EchoReply
-from pyof.v0x04.symmetric.echo_request import EchoRequest
-from pyof.v0x04.symmetric.experimenter import ExperimenterHeader
-from pyof.v0x04.symmetric.hello import Hello
-
-__all__ = ('new_message_from_header', 'new_message_from_message_type')
+from pyof.foundation import registry
+from pyof.v0x04.common.constants import OFP_VERSION
+from pyof.v0x04.common.header import Header, Type
+
+__all__ = ('get_message_class', 'new_message_from_header',
+           'new_message_from_message_type', 'unpack_message')
+
+#: Module and class of each message type. Message modules are only imported
+#: when a message of their type is first created.
+_MESSAGE_MODULES = {
+    Type.OFPT_HELLO: ('symmetric.hello', 'Hello'),
+    Type.OFPT_ERROR: ('asynchronous.error_msg', 'ErrorMsg'),
+    Type.OFPT_ECHO_REQUEST: ('symmetric.echo_request', 'EchoRequest'),
+    Type.OFPT_ECHO_REPLY: ('symmetric.echo_reply', 'EchoReply'),
+    Type.OFPT_EXPERIMENTER: ('symmetric.experimenter', 'ExperimenterHeader'),
+    Type.OFPT_FEATURES_REQUEST: ('controller2switch.features_request',
+                                 'FeaturesRequest'),
+    Type.OFPT_FEATURES_REPLY: ('controller2switch.features_reply',
+                               'FeaturesReply'),
+    Type.OFPT_GET_CONFIG_REQUEST: ('controller2switch.get_config_request',
+                                   'GetConfigRequest'),
+    Type.OFPT_GET_CONFIG_REPLY: ('controller2switch.get_config_reply',
+                                 'GetConfigReply'),
+    Type.OFPT_SET_CONFIG: ('controller2switch.set_config', 'SetConfig'),
+    Type.OFPT_PACKET_IN: ('asynchronous.packet_in', 'PacketIn'),
+    Type.OFPT_FLOW_REMOVED: ('asynchronous.flow_removed', 'FlowRemoved'),
+    Type.OFPT_PORT_STATUS: ('asynchronous.port_status', 'PortStatus'),
+    Type.OFPT_PACKET_OUT: ('controller2switch.packet_out', 'PacketOut'),
+    Type.OFPT_FLOW_MOD: ('controller2switch.flow_mod', 'FlowMod'),
+    Type.OFPT_GROUP_MOD: ('controller2switch.group_mod', 'GroupMod'),
+    Type.OFPT_PORT_MOD: ('controller2switch.port_mod', 'PortMod'),
+    Type.OFPT_TABLE_MOD: ('controller2switch.table_mod', 'TableMod'),
+    Type.OFPT_MULTIPART_REQUEST: ('controller2switch.multipart_request',
+                                  'MultipartRequest'),
+    Type.OFPT_MULTIPART_REPLY: ('controller2switch.multipart_reply',
+                                'MultipartReply'),
+    Type.OFPT_BARRIER_REQUEST: ('controller2switch.barrier_request',
+                                'BarrierRequest'),
+    Type.OFPT_BARRIER_REPLY: ('controller2switch.barrier_reply',
+                              'BarrierReply'),
+    Type.OFPT_QUEUE_GET_CONFIG_REQUEST: (
+        'controller2switch.queue_get_config_request',
+        'QueueGetConfigRequest'),
+    Type.OFPT_QUEUE_GET_CONFIG_REPLY: (
+        'controller2switch.queue_get_config_reply', 'QueueGetConfigReply'),
+    Type.OFPT_ROLE_REQUEST: ('controller2switch.role_request', 'RoleRequest'),
+    Type.OFPT_ROLE_REPLY: ('controller2switch.role_reply', 'RoleReply'),
+    Type.OFPT_GET_ASYNC_REQUEST: ('controller2switch.get_async_request',
+                                  'GetAsyncRequest'),
+    Type.OFPT_GET_ASYNC_REPLY: ('controller2switch.get_async_reply',
+                                'GetAsyncReply'),
+    Type.OFPT_SET_ASYNC: ('controller2switch.set_async', 'SetAsync'),
+    Type.OFPT_METER_MOD: ('controller2switch.meter_mod', 'MeterMod')
+}
+
+#: Message types by name, like ``'Type.OFPT_HELLO'``.
+_TYPES_BY_NAME = {str(member): member for member in Type}
+
+registry.register(OFP_VERSION, 'pyof.v0x04', _MESSAGE_MODULES)
+
+_HEADER_SIZE = Header().get_size()
+
+
+def get_message_class(message_type):
+    """Return the class of a message type, importing its module if needed.
+
+    Args:
+        message_type (:class:`~.common.header.Type`): Message type or its
+            number.
+
+    Returns:
+        type: The message class.
+
+    Raises:
+        ValueError: Unknown message type.
+    """
+    return registry.get_message_class(OFP_VERSION, message_type)
 
 
 def new_message_from_message_type(message_type):
@@ -47,38 +94,10 @@ def new_message_from_message_type(message_type):
     Raises:
         KytosUndefinedMessageType: Unkown Message_Type.
     """
-    message_type = str(message_type)
-
-    available_classes = {
-        str(Type.OFPT_HELLO): Hello,
-        str(Type.OFPT_ERROR): ErrorMsg,
-        str(Type.OFPT_ECHO_REQUEST): EchoRequest,
-        str(Type.OFPT_ECHO_REPLY): EchoReply,
-        str(Type.OFPT_VENDOR): ExperimenterHeader,
-        str(Type.OFPT_FEATURES_REQUEST): FeaturesRequest,
-        str(Type.OFPT_FEATURES_REPLY): FeaturesReply,
-        str(Type.OFPT_GET_CONFIG_REQUEST): GetConfigRequest,
-        str(Type.OFPT_GET_CONFIG_REPLY): GetConfigReply,
-        str(Type.OFPT_SET_CONFIG): SetConfig,
-        str(Type.OFPT_PACKET_IN): PacketIn,
-        str(Type.OFPT_FLOW_REMOVED): FlowRemoved,
-        str(Type.OFPT_PORT_STATUS): PortStatus,
-        str(Type.OFPT_PACKET_OUT): PacketOut,
-        str(Type.OFPT_FLOW_MOD): FlowMod,
-        str(Type.OFPT_PORT_MOD): PortMod,
-        str(Type.OFPT_BARRIER_REQUEST): BarrierRequest,
-        str(Type.OFPT_BARRIER_REPLY): BarrierReply,
-        str(Type.OFPT_QUEUE_GET_CONFIG_REQUEST): QueueGetConfigRequest,
-        str(Type.OFPT_QUEUE_GET_CONFIG_REPLY): QueueGetConfigReply
-    }
-
-    if message_type not in available_classes:
-        raise ValueError
-
-    message_class = available_classes.get(message_type)
-    message_instance = message_class()
-
-    return message_instance
+    if isinstance(message_type, str):
+        # Names like 'Type.OFPT_HELLO' are also accepted.
+        message_type = _TYPES_BY_NAME.get(message_type, message_type)
+    return get_message_class(message_type)()
 
 
 def new_message_from_header(header):
@@ -95,20 +114,49 @@ def new_message_from_header(header):
     Raises:
         KytosUndefinedMessageType: Unkown Message_Type.
     """
-    message_type = header.message_type
-    if not isinstance(message_type, Type):
-        try:
-            if isinstance(message_type, str):
-                # False positive https://github.com/PyCQA/pylint/issues/992
-                # pylint: disable=E1136
-                message_type = Type[message_type]
-            elif isinstance(message_type, int):
-                message_type = Type(message_type)
-        except ValueError:
-            raise ValueError
+    message_type = getattr(header.message_type, 'value',
+                           header.message_type)
+    if isinstance(message_type, str) and message_type in Type.__members__:
+        message_type = Type[message_type]
 
     message = new_message_from_message_type(message_type)
     message.header.xid = header.xid
     message.header.length = header.length
 
     return message
+
+
+def unpack_message(buffer, pool=None):
+    """Unpack the whole buffer, including header pack.
+
+    Any bytes-like object is accepted. The message body is unpacked from a
+    :class:`memoryview`, so the buffer is not copied.
+
+    Args:
+        buffer (bytes): Binary data of a message, header included.
+        pool (~pyof.foundation.pool.StructPool): If given, the message and
+            its header are taken from the pool and unpacked with
+            :meth:`~pyof.foundation.base.GenericStruct.unpack_into`, which
+            reuses their attribute objects. Release the message to the pool
+            when it is no longer used.
+
+    Returns:
+        GenericMessage: The unpacked message.
+    """
+    if pool is None:
+        header = Header()
+        header.unpack(buffer)
+        # The message type is the second byte of the header.
+        message = registry.get_message_class(OFP_VERSION, buffer[1])()
+        message.header = header
+        message.unpack(memoryview(buffer)[_HEADER_SIZE:])
+        return message
+    header = pool.acquire(Header)
+    header.unpack_into(buffer)
+    message = pool.acquire(registry.get_message_class(OFP_VERSION,
+                                                      buffer[1]))
+    if isinstance(message.header, Header):
+        pool.release(message.header)
+    message.header = header
+    message.unpack_into(memoryview(buffer)[_HEADER_SIZE:])
+    return message
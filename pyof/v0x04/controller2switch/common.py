@@ -289,6 +289,8 @@ class FlowStats(GenericStruct):
     byte_count = UBInt64()
     match = Match()
 
+    _struct_length_attribute = 'length'
+
     def __init__(self, length=None, table_id=None, duration_sec=None,
                  duration_nsec=None, priority=None, idle_timeout=None,
                  hard_timeout=None, flags=None, cookie=None, packet_count=None,
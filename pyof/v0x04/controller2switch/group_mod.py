@@ -44,6 +44,8 @@ class Bucket(GenericStruct):
     pad = Pad(4)
     actions = FixedTypeList(ActionHeader)
 
+    _struct_length_attribute = 'length'
+
     def __init__(self, length=None, weight=None, watch_port=None,
                  watch_group=None, actions=None):
         """Initialize all instance variables.
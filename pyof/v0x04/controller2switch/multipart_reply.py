@@ -1,29 +1,43 @@
 """Controller replying state from datapath."""
 
 # System imports
-from enum import Enum
+import struct
 
 # Local source tree imports
-from pyof.foundation.base import GenericMessage
+from pyof.foundation.base import GenericBitMask, GenericMessage
 from pyof.foundation.basic_types import BinaryData, Pad, UBInt16
+from pyof.foundation.exceptions import UnpackException
 from pyof.v0x04.common.header import Header, Type
-from pyof.v0x04.controller2switch.common import MultipartTypes
+from pyof.v0x04.controller2switch.common import (
+    AggregateStatsReply, DescStats, FlowStats, MultipartTypes, PortStats,
+    QueueStats, TableStats)
 
 # Third-party imports
 
 
-__all__ = ('MultipartReply', 'MultipartReplyFlags')
+__all__ = ('MultipartReply', 'MultipartReplyFlags', 'MultipartReassembler',
+           'MULTIPART_REPLY_BODIES')
 
 # Enum
 
 
-class MultipartReplyFlags(Enum):
+class MultipartReplyFlags(GenericBitMask):
     """Flags for MultipartReply."""
 
     #: More replies to follow.
     OFPMPF_REPLY_MORE = 1 << 0
 
 
+#: Class of the records in the body of each type of multipart reply.
+MULTIPART_REPLY_BODIES = {
+    MultipartTypes.OFPMP_DESC: DescStats,
+    MultipartTypes.OFPMP_FLOW: FlowStats,
+    MultipartTypes.OFPMP_AGGREGATE: AggregateStatsReply,
+    MultipartTypes.OFPMP_TABLE: TableStats,
+    MultipartTypes.OFPMP_PORT_STATS: PortStats,
+    MultipartTypes.OFPMP_QUEUE: QueueStats,
+}
+
 # Classes
 
 
@@ -35,7 +49,7 @@ class MultipartReply(GenericMessage):
     """
 
     #: :class:`~.common.header.Header`
-    header = Header(message_type=Type.OFPT_PORT_MOD)
+    header = Header(message_type=Type.OFPT_MULTIPART_REPLY)
     #: One of the OFPMP_* constants.
     multipart_type = UBInt16(enum_ref=MultipartTypes)
     #: OFPMPF_REPLY_* flags.
@@ -58,3 +72,131 @@ class MultipartReply(GenericMessage):
         self.multipart_type = multipart_type
         self.flags = flags
         self.body = body
+
+
+class MultipartReassembler:
+    """Records of multipart replies, decoded as each part arrives.
+
+    A reply split in several :class:`MultipartReply` messages is identified
+    by their xid. Each part is decoded into instances of the class in
+    :data:`MULTIPART_REPLY_BODIES` as soon as it is fed, so only the bytes of
+    a record split between two parts are kept until the next one:
+
+    .. code-block:: python3
+
+        reassembler = MultipartReassembler()
+        for reply in replies:
+            records, complete = reassembler.feed(reply)
+            for flow_stats in records:
+                ...
+
+    Bodies of types without a class are returned as one :class:`bytes`
+    record per part.
+    """
+
+    def __init__(self):
+        """Create a reassembler without pending replies."""
+        #: Type, record class and undecoded bytes of each reply, by xid
+        self._replies = {}
+
+    def __len__(self):
+        return len(self._replies)
+
+    def __contains__(self, xid):
+        return xid in self._replies
+
+    def feed(self, reply):
+        """Decode the records of one part of a reply.
+
+        Args:
+            reply (MultipartReply): The part, received in order.
+
+        Returns:
+            tuple: A list of the records completed by this part and whether
+                it was the last part of the reply.
+
+        Raises:
+            :exc:`~.exceptions.UnpackException`: If the part does not belong
+                to the reply with the same xid, a record has an invalid
+                length or the last part ends in the middle of a record.
+        """
+        xid = _get_value(reply.header.xid)
+        multipart_type = _get_value(reply.multipart_type)
+        more = _get_value(reply.flags) & MultipartReplyFlags.OFPMPF_REPLY_MORE
+        body = _get_value(reply.body) or b''
+        state = self._replies.pop(xid, None)
+        if state is None:
+            state = (multipart_type, _get_record_class(multipart_type), b'')
+        elif state[0] != multipart_type:
+            msg = 'Multipart reply {} changed its type from {} to {}.'
+            raise UnpackException(msg.format(xid, state[0], multipart_type))
+        record_class, rest = state[1:]
+        if record_class is None:
+            records = [bytes(body)] if body else []
+        else:
+            data = rest + bytes(body) if rest else memoryview(body)
+            records, used = _decode_records(record_class, data)
+            rest = bytes(data[used:])
+        if more:
+            self._replies[xid] = (multipart_type, record_class, rest)
+        elif rest:
+            msg = 'Multipart reply {} ends in the middle of a {}.'
+            raise UnpackException(msg.format(xid, record_class.__name__))
+        return records, not more
+
+    def discard(self, xid):
+        """Forget an incomplete reply, e.g. after its request timed out.
+
+        Args:
+            xid (int): Xid of the reply.
+        """
+        self._replies.pop(xid, None)
+
+
+def _get_value(value):
+    """Return the plain value of an attribute, enum or bitmask."""
+    value = getattr(value, 'value', value)
+    return getattr(value, 'bitmask', value)
+
+
+def _get_record_class(multipart_type):
+    """Return the class of the records of a type of reply, if known."""
+    try:
+        return MULTIPART_REPLY_BODIES.get(MultipartTypes(multipart_type))
+    except ValueError:
+        return None
+
+
+def _decode_records(record_class, data):
+    """Return the records in *data* and the number of bytes they take.
+
+    Bytes after the last complete record are left undecoded.
+    """
+    # pylint: disable=protected-access
+    name = record_class._struct_length_attribute
+    length_from = None
+    minimum = record_class._static_size
+    if name is not None:
+        field = record_class._fields[record_class._field_positions[name]]
+        fmt = '!' + field.prototype.get_fixed_format()
+        length_from = struct.Struct(fmt).unpack_from
+        length_offset = field.offset
+        minimum = field.offset + field.size
+    records = []
+    begin = 0
+    end = len(data)
+    while end - begin >= minimum:
+        size = minimum
+        if length_from is not None:
+            size = length_from(data, begin + length_offset)[0]
+            if size < minimum:
+                msg = '{} has an invalid length of {} bytes.'
+                raise UnpackException(msg.format(record_class.__name__,
+                                                 size))
+        if end - begin < size:
+            break
+        record = record_class()
+        record.unpack(data[begin:begin + size])
+        records.append(record)
+        begin += size
+    return records, begin
@@ -18,7 +18,7 @@ class QueueGetConfigReply(GenericMessage):
     """Class implements the response to the config request."""
 
     #: :class:`~.common.header.Header`.
-    header = Header(message_type=Type.OFPT_GET_CONFIG_REPLY)
+    header = Header(message_type=Type.OFPT_QUEUE_GET_CONFIG_REPLY)
     #: Port to be queried. Should refer to a valid physical port
     #: (i.e. < OFPP_MAX), or OFPP_ANY to request all configured queues.
     port = UBInt32(enum_ref=PortNo)
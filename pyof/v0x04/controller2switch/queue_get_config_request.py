@@ -17,7 +17,7 @@ class QueueGetConfigRequest(GenericMessage):
     """Query structure for configured queues on a port."""
 
     #: :class:`~.common.header.Header`.
-    header = Header(message_type=Type.OFPT_GET_CONFIG_REQUEST)
+    header = Header(message_type=Type.OFPT_QUEUE_GET_CONFIG_REQUEST)
     #: Port to be queried. Should refer to a valid physical port
     #: (i.e. < OFPP_MAX), or OFPP_ANY to request all configured queues.
     port = UBInt32(enum_ref=PortNo)
@@ -1 +1,4 @@
 """Symmetric Messages."""
+from pyof.foundation.lazy import lazy_modules
+
+__getattr__, __dir__ = lazy_modules(globals())
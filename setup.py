@@ -87,6 +87,9 @@ setup(name='python-openflow',
       author_email='of-ng-dev@ncc.unesp.br',
       license='MIT',
       test_suite='tests',
+      extras_require={
+          'numpy': ['numpy']
+      },
       packages=find_packages(exclude=['tests', '*v0x02*', '*v0x04*']),
       cmdclass={
           'lint': Linter,
@@ -1,7 +1,10 @@
 """Test Base module of python-openflow."""
 import unittest
+from enum import Enum
 
 from pyof.foundation import base, basic_types
+from pyof.foundation.exceptions import (PackException, UnpackException,
+                                        ValidationError)
 
 
 class TestGenericStruct(unittest.TestCase):
@@ -62,6 +65,174 @@ class TestGenericStruct(unittest.TestCase):
         self.assertIsNot(message1.b.c.c1, message2.b.c.c1)
         self.assertIsNot(message1.b.c.c2, message2.b.c.c2)
 
+    def test_fields(self):
+        """[Foundation/Base/MetaStruct] - Field table."""
+        # pylint: disable=protected-access
+        fields = self.MyMessage._fields
+        self.assertEqual([field.name for field in fields],
+                         ['header', 'a', 'b', 'i'])
+        self.assertEqual([field.size for field in fields], [4, 3, 12, 4])
+        self.assertEqual([field.offset for field in fields], [0, 4, 7, 19])
+        self.assertIs(fields[3].prototype, self.MyMessage.i)
+
+    def test_static_size(self):
+        """[Foundation/Base/MetaStruct] - Static size."""
+        # pylint: disable=protected-access
+        self.assertEqual(self.MyMessage._static_size, 23)
+        self.assertEqual(self.MyMessage().get_size(), 23)
+
+        class VariableStruct(base.GenericStruct):
+            """Struct with a variable-size attribute."""
+
+            a1 = basic_types.UBInt8(1)
+            data = basic_types.BinaryData(b'')
+
+        self.assertIsNone(VariableStruct._static_size)
+        struct = VariableStruct()
+        struct.data = b'abc'
+        self.assertEqual(struct.get_size(), 4)
+
+    def test_pack_into(self):
+        """[Foundation/Base/GenericMessage] - Packing into a buffer."""
+        message = self.MyMessage()
+        buff = bytearray(2 + 2 * message.get_size())
+        end = message.pack_into(buff, 2)
+        end = message.pack_into(memoryview(buff), end)
+        self.assertEqual(end, len(buff))
+        self.assertEqual(message.header.length, 23)
+        expected = b'\x01\x02\x17\x04\x01\x00\x02\x00\x00\x00\x03' + \
+            b'\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x05'
+        self.assertEqual(bytes(buff), b'\x00\x00' + expected * 2)
+        self.assertEqual(message.pack(), expected)
+
+    def test_pack_into_small_buffer(self):
+        """[Foundation/Base/GenericMessage] - Packing into a small buffer."""
+        message = self.MyMessage()
+        buff = bytearray(message.get_size() - 1)
+        self.assertRaises(PackException, message.pack_into, buff)
+
+    def test_equality(self):
+        """[Foundation/Base/GenericStruct] - Attribute-wise equality."""
+        message1 = self.MyMessage()
+        message2 = self.MyMessage()
+        message1.pack()
+        self.assertNotEqual(message1.header.length, message2.header.length)
+        self.assertEqual(message1, message2)
+        message2.b.c.c1 = 7
+        self.assertNotEqual(message1, message2)
+        message2.b.c.c1 = basic_types.UBInt32(3)
+        self.assertEqual(message1, message2)
+
+    def test_hash(self):
+        """[Foundation/Base/GenericStruct] - Opt-in hashing."""
+        message1 = self.MyMessage()
+        message2 = self.MyMessage()
+        self.assertRaises(TypeError, hash, message1)
+        self.MyMessage.hashable = True
+        self.assertEqual(len({message1, message2}), 1)
+        message2.i = 6
+        self.assertEqual(len({message1, message2}), 2)
+
+    def test_hash_changes(self):
+        """[Foundation/Base/GenericStruct] - Hash follows the attributes."""
+        struct = self.MyMessage().a
+        hash_value = struct.get_hash()
+        self.assertEqual(struct.get_hash(), hash_value)
+        struct.a1 = 2
+        self.assertNotEqual(struct.get_hash(), hash_value)
+        struct.a1 = basic_types.UBInt8(1)
+        self.assertEqual(struct.get_hash(), hash_value)
+        struct.a1.unpack(b'\x09')
+        self.assertNotEqual(struct.get_hash(), hash_value)
+        message = self.MyMessage()
+        hash_value = message.get_hash()
+        message.b.c.c1 = 7
+        self.assertNotEqual(message.get_hash(), hash_value)
+
+    def test_hash_cache(self):
+        """[Foundation/Base/GenericStruct] - Hash keys are cached."""
+        message = self.MyMessage()
+        hash_value = message.get_hash()
+        # pylint: disable=protected-access,no-member
+        self.assertIsNotNone(message._hash)
+        self.assertIsNotNone(message.a._hash)
+        self.assertEqual(message.get_hash(), hash_value)
+        message.i = basic_types.UBInt32(6)
+        self.assertIsNone(message._hash)
+        self.assertNotEqual(message.get_hash(), hash_value)
+        struct = message.a
+        struct.get_hash()
+        struct.unpack(b'\x01\x00\x03')
+        self.assertIsNone(struct._hash)
+        message.i.unpack(b'\x00\x00\x00\x05')
+        self.assertIsNone(message._hash)
+        self.assertNotEqual(message.get_hash(), hash_value)
+        struct.unpack(b'\x01\x00\x02')
+        self.assertEqual(message.get_hash(), hash_value)
+
+    def test_equal_empty_values(self):
+        """[Foundation/Base/GenericStruct] - None and empty binary data."""
+        from pyof.v0x04.common.utils import unpack_message
+        from pyof.v0x04.symmetric.echo_request import EchoRequest
+        message = EchoRequest(xid=5)
+        unpacked = unpack_message(message.pack())
+        self.assertEqual(message, unpacked)
+        self.assertEqual(message.get_hash(), unpacked.get_hash())
+        message.data = b'abc'
+        self.assertNotEqual(message, unpacked)
+
+    def test_equal_structs_hash_equally(self):
+        """[Foundation/Base/GenericStruct] - Hashes agree with equality."""
+        class Color(Enum):
+            """Example enum."""
+
+            RED = 1
+            BLUE = 2
+
+        class Struct(base.GenericStruct):
+            """Struct with integer, enum and address defaults."""
+
+            hashable = True
+            a = basic_types.UBInt8(1)
+            color = basic_types.UBInt8(Color.RED, enum_ref=Color)
+            hw_address = basic_types.HWAddress('00:00:00:00:00:01')
+
+        values = {
+            'a': [None, 1, basic_types.UBInt8(1), 2,
+                  basic_types.UBInt8(Color.RED, enum_ref=Color)],
+            'color': [None, Color.RED, 1, Color.BLUE,
+                      basic_types.UBInt8(Color.RED, enum_ref=Color)],
+            'hw_address': [None, '00:00:00:00:00:01', '00:00:00:00:00:02',
+                           basic_types.HWAddress('00:00:00:00:00:01')]}
+        structs = []
+        for name, name_values in values.items():
+            for value in name_values:
+                struct = Struct()
+                setattr(struct, name, value)
+                structs.append(struct)
+        for struct in structs:
+            for other in structs:
+                if struct == other:
+                    self.assertEqual(hash(struct), hash(other))
+        struct1, struct2 = Struct(), Struct()
+        struct1.a, struct2.a = None, 1
+        self.assertEqual(struct1, struct2)
+        self.assertEqual(len({struct1, struct2}), 1)
+        struct1.color, struct2.color = None, 1
+        self.assertEqual(struct1, struct2)
+        self.assertEqual(len({struct1, struct2}), 1)
+
+    def test_clone(self):
+        """[Foundation/Base/GenericStruct] - Cloning."""
+        message = self.MyMessage()
+        message.i = 6
+        clone = message.clone()
+        self.assertIsInstance(clone, self.MyMessage)
+        self.assertIsNot(clone.a, message.a)
+        self.assertIsNot(clone.b.c.c1, message.b.c.c1)
+        self.assertEqual(clone.i, 6)
+        self.assertEqual(clone.pack(), message.pack())
+
 
 class TestGenericType(unittest.TestCase):
     """Testing GenericType class."""
@@ -95,3 +266,461 @@ class TestGenericType(unittest.TestCase):
         self.assertEqual(1 ^ a, 0)
         self.assertEqual(b ^ 1, 3)
         self.assertEqual(1 ^ b, 3)
+
+    def test_slots(self):
+        """[Foundation/Base/GenericType] - Values are stored in slots."""
+        for attribute in (basic_types.UBInt8(1), basic_types.Pad(2),
+                          basic_types.Char('a', length=2),
+                          basic_types.IPAddress('10.0.0.1/8'),
+                          basic_types.HWAddress(), basic_types.BinaryData()):
+            self.assertFalse(hasattr(attribute, '__dict__'))
+            self.assertEqual(attribute.clone().pack(), attribute.pack())
+
+
+class TestAttributeStorage(unittest.TestCase):
+    """Testing how struct attributes are stored."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class Color(Enum):
+            """Example enum."""
+
+            RED = 1
+
+        class Struct(base.GenericStruct):
+            """Example class."""
+
+            a1 = basic_types.UBInt8(1)
+            color = basic_types.UBInt8(Color.RED, enum_ref=Color)
+            name = basic_types.Char('x', length=4)
+            data = basic_types.BinaryData()
+
+        self.Color = Color
+        self.Struct = Struct
+
+    def test_class_attributes(self):
+        """[Foundation/Base/GenericStruct] - Class attributes."""
+        self.assertIsInstance(self.Struct.a1, basic_types.UBInt8)
+        self.assertEqual(self.Struct.a1.value, 1)
+        self.assertEqual([name for name, _ in
+                          self.Struct._get_class_attributes()],
+                         ['a1', 'color', 'name', 'data'])
+
+    def test_plain_values(self):
+        """[Foundation/Base/GenericStruct] - Unpacked values are plain."""
+        struct = self.Struct()
+        struct.unpack(b'\x02\x01ab\x00\x00cd')
+        # pylint: disable=protected-access,no-member
+        self.assertEqual([struct._a1_, struct._color_, struct._name_,
+                          struct._data_],
+                         [2, self.Color.RED, 'ab', b'cd'])
+        self.assertFalse(hasattr(struct, '__dict__') and struct.__dict__)
+        self.assertIsInstance(struct.a1, basic_types.UBInt8)
+        self.assertEqual(struct.a1.value, 2)
+        self.assertEqual(struct.color.value, 1)
+        self.assertEqual(struct.name.length, 4)
+
+    def test_views(self):
+        """[Foundation/Base/GenericStruct] - Changing attribute objects."""
+        struct = self.Struct()
+        a1 = struct.a1
+        a1.unpack(b'\x09')
+        self.assertEqual(struct.a1.value, 9)
+        self.assertEqual(struct.pack()[:1], b'\x09')
+        other = self.Struct()
+        other.a1 = struct.a1
+        struct.a1 = 3
+        self.assertEqual(other.a1.value, 9)
+        self.assertEqual(a1.clone(), basic_types.UBInt8(3))
+
+    def test_assignment(self):
+        """[Foundation/Base/GenericStruct] - Assigning attribute values."""
+        struct = self.Struct()
+        struct.a1 = basic_types.UBInt8(5)
+        struct.data = b'xyz'
+        # pylint: disable=protected-access,no-member
+        self.assertEqual(struct._a1_, 5)
+        self.assertEqual(struct.a1.value, 5)
+        self.assertEqual(struct.data, b'xyz')
+        name = basic_types.Char('abcdef', length=8)
+        struct.name = name
+        self.assertIs(struct.name, name)
+        self.assertEqual(struct.get_size(), 9)
+
+
+class TestEnumCoercion(unittest.TestCase):
+    """Testing the conversion of enums and bitmasks."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class Color(Enum):
+            """Example enum."""
+
+            RED = 1
+            BLUE = 2
+
+        class Flags(base.GenericBitMask):
+            """Example bitmask."""
+
+            FLAG_A = 1 << 0
+            FLAG_B = 1 << 1
+            FLAG_C = 1 << 2
+
+        self.Color = Color
+        self.Flags = Flags
+
+    def test_pack(self):
+        """[Foundation/Base/GenericType] - Packing enums and bitmasks."""
+        attribute = basic_types.UBInt8(enum_ref=self.Color)
+        self.assertEqual(attribute.pack(self.Color.BLUE), b'\x02')
+        self.assertEqual(attribute.pack(basic_types.UBInt16(3)), b'\x03')
+        self.assertEqual(attribute.pack(self.Flags(5)), b'\x05')
+
+    def test_unpack(self):
+        """[Foundation/Base/GenericType] - Unpacking enums."""
+        # pylint: disable=protected-access
+        attribute = basic_types.UBInt8(enum_ref=self.Color)
+        attribute.unpack(b'\x02')
+        self.assertIs(attribute._value, self.Color.BLUE)
+        self.assertEqual(attribute.value, 2)
+        self.assertRaises(UnpackException, attribute.unpack, b'\x03')
+
+    def test_bitmask_names(self):
+        """[Foundation/Base/GenericBitMask] - Selected names."""
+        self.assertEqual(self.Flags(5).names, ['FLAG_A', 'FLAG_C'])
+        self.assertEqual(self.Flags(0).names, [])
+
+
+class TestFixedLayout(unittest.TestCase):
+    """Testing the compiled codec of fixed-layout structs."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class FixedStruct(base.GenericStruct):
+            """Struct with fixed-size attributes only."""
+
+            a1 = basic_types.UBInt8(1)
+            pad = basic_types.Pad(1)
+            a2 = basic_types.UBInt16(2)
+            hw_addr = basic_types.HWAddress('00:00:00:00:00:03')
+            name = basic_types.Char('four', length=5)
+
+        class VariableStruct(base.GenericStruct):
+            """Struct with a variable-size attribute."""
+
+            a1 = basic_types.UBInt8(1)
+            data = basic_types.BinaryData(b'')
+
+        self.FixedStruct = FixedStruct
+        self.VariableStruct = VariableStruct
+        self.packed = b'\x01\x00\x00\x02\x00\x00\x00\x00\x00\x03four\x00'
+
+    def test_compiled_layout(self):
+        """[Foundation/Base/MetaStruct] - Fixed layout compilation."""
+        # pylint: disable=protected-access
+        fixed_struct, fields = base.MetaStruct.get_fixed_layout(
+            self.FixedStruct._fields)
+        self.assertEqual(fixed_struct.format, '!B1xH6s5s')
+        self.assertEqual([name for name, _, _ in fields],
+                         ['a1', 'pad', 'a2', 'hw_addr', 'name'])
+        self.assertIsNone(base.MetaStruct.get_fixed_layout(
+            self.VariableStruct._fields))
+
+    def test_pack(self):
+        """[Foundation/Base/GenericStruct] - Fixed layout packing."""
+        self.assertEqual(self.FixedStruct().pack(), self.packed)
+
+    def test_unpack(self):
+        """[Foundation/Base/GenericStruct] - Fixed layout unpacking."""
+        struct = self.FixedStruct()
+        struct.a1 = 0
+        struct.unpack(b'\xff' + self.packed, 1)
+        self.assertIsInstance(struct.a1, basic_types.UBInt8)
+        self.assertEqual(struct.a1, 1)
+        self.assertEqual(struct.a2, 2)
+        self.assertEqual(struct.hw_addr.value, '00:00:00:00:00:03')
+        self.assertEqual(struct.name.value, 'four')
+
+    def test_pack_error(self):
+        """[Foundation/Base/GenericStruct] - Fixed layout packing error."""
+        struct = self.FixedStruct()
+        struct.a2 = 2 ** 16
+        self.assertRaises(PackException, struct.pack)
+
+
+class TestValidation(unittest.TestCase):
+    """Testing the compiled validators of structs and messages."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class Color(Enum):
+            """Example enum."""
+
+            RED = 1
+
+        class Other(Enum):
+            """Enum of another attribute."""
+
+            RED = 1
+
+        class Header(base.GenericStruct):
+            """Mock Header class."""
+
+            version = basic_types.UBInt8(1)
+            message_type = basic_types.UBInt8(2)
+            length = basic_types.UBInt16()
+            xid = basic_types.UBInt32(4)
+
+        class MyMessage(base.GenericMessage):
+            """Example message."""
+
+            header = Header()
+            color = basic_types.UBInt8(Color.RED, enum_ref=Color)
+            name = basic_types.Char('abc', length=4)
+            data_len = basic_types.UBInt16(0)
+            data = basic_types.BinaryData(b'')
+
+            _length_attributes = {'data_len': 'data'}
+
+        self.Other = Other
+        self.MyMessage = MyMessage
+
+    def tearDown(self):
+        """Restore the default packing behaviour."""
+        base.GenericStruct.validate_on_pack = False
+
+    def test_valid(self):
+        """[Foundation/Base/GenericMessage] - Valid message."""
+        message = self.MyMessage()
+        self.assertTrue(message.is_valid())
+        message.color = 200
+        message.data = b'data'
+        message.data_len = 4
+        self.assertTrue(message.is_valid())
+        message.pack()
+        self.assertTrue(message.is_valid())
+
+    def test_range(self):
+        """[Foundation/Base/GenericStruct] - Integer out of range."""
+        message = self.MyMessage()
+        message.header.xid = 2 ** 32
+        self.assertFalse(message.is_valid())
+        message.header.xid = -1
+        self.assertFalse(message.is_valid())
+
+    def test_enum(self):
+        """[Foundation/Base/GenericStruct] - Member of another enum."""
+        message = self.MyMessage()
+        message.color = self.Other.RED
+        self.assertFalse(message.is_valid())
+
+    def test_lengths(self):
+        """[Foundation/Base/GenericMessage] - Length consistency."""
+        message = self.MyMessage()
+        message.name = 'abcd'
+        self.assertFalse(message.is_valid())
+        message = self.MyMessage()
+        message.data = b'data'
+        message.data_len = 3
+        self.assertFalse(message.is_valid())
+        message = self.MyMessage()
+        message.header.length = 3
+        self.assertFalse(message.is_valid())
+
+    def test_validate_on_pack(self):
+        """[Foundation/Base/GenericStruct] - Validation switch."""
+        message = self.MyMessage()
+        message.name = 'abcd'
+        self.assertEqual(len(message.pack()), 15)
+        base.GenericStruct.validate_on_pack = True
+        self.assertRaises(ValidationError, message.pack)
+
+
+class TestCodec(unittest.TestCase):
+    """Testing the generated pack and unpack functions."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class Entry(base.GenericStruct):
+            """Struct with the lengths of its parts."""
+
+            length = basic_types.UBInt16()
+            items_len = basic_types.UBInt8()
+            items = basic_types.FixedTypeList(basic_types.UBInt16)
+            data = basic_types.BinaryData()
+
+            _length_attributes = {'items_len': 'items'}
+            _struct_length_attribute = 'length'
+
+        self.Entry = Entry
+        self.packed = b'\x00\x09\x04\x00\x01\x00\x02ab'
+
+    def test_source(self):
+        """[Foundation/Base/MetaStruct] - Generated source."""
+        source = self.Entry.get_codec_source()
+        self.assertIn('def pack_into(self, buff, offset):', source)
+        self.assertIn('def unpack(self, buff, offset):', source)
+        self.assertIs(source, self.Entry.get_codec_source())
+
+    def test_unpack(self):
+        """[Foundation/Base/GenericStruct] - Length-driven unpacking."""
+        entries = basic_types.FixedTypeList(self.Entry)
+        entries.unpack(self.packed * 2)
+        self.assertEqual(len(entries), 2)
+        for entry in entries:
+            self.assertEqual(entry.items, [1, 2])
+            self.assertEqual(entry.data.value, b'ab')
+
+    def test_pack(self):
+        """[Foundation/Base/GenericStruct] - Generated packing."""
+        entry = self.Entry()
+        entry.unpack(self.packed)
+        self.assertEqual(entry.pack(), self.packed)
+
+    def test_unpack_error(self):
+        """[Foundation/Base/GenericStruct] - Unpacking a short buffer."""
+        self.assertRaises(UnpackException, self.Entry().unpack, b'\x00')
+
+    def test_unpack_into(self):
+        """[Foundation/Base/GenericStruct] - Reusing attribute objects."""
+        entry = self.Entry()
+        entry.unpack(self.packed)
+        length, items = entry.length, entry.items
+        entry.unpack_into(b'\x00\x08\x04\x00\x03\x00\x04c')
+        self.assertIs(entry.items, items)
+        self.assertEqual(items, [3, 4])
+        # Attributes of basic types are views of the struct's values.
+        self.assertEqual(length.value, 8)
+        self.assertEqual(entry.data.value, b'c')
+        entry.length = 9
+        entry.unpack_into(self.packed)
+        self.assertEqual(entry.length.value, 9)
+        self.assertEqual(entry.pack(), self.packed)
+
+
+class TestPackMany(unittest.TestCase):
+    """Testing the packing of several messages into one buffer."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        from pyof.v0x01.symmetric.echo_request import EchoRequest
+        from pyof.v0x01.symmetric.hello import Hello
+        self.messages = [Hello(xid=1), EchoRequest(xid=2), Hello(xid=3)]
+
+    def test_buffer(self):
+        """[Foundation/Base] - Messages packed one after the other."""
+        packed = base.pack_many(self.messages)
+        self.assertIsInstance(packed, bytearray)
+        self.assertEqual(packed, b''.join(message.pack()
+                                          for message in self.messages))
+
+    def test_views(self):
+        """[Foundation/Base] - Views of each packed message and xids."""
+        views = base.pack_many(self.messages, xids=[10, 11], views=True)
+        self.assertEqual([message.header.xid for message in self.messages],
+                         [10, 11, 3])
+        self.assertEqual([bytes(view) for view in views],
+                         [message.pack() for message in self.messages])
+
+    def test_struct_bodies(self):
+        """[Foundation/Base] - Messages whose body is a struct."""
+        from pyof.v0x01.asynchronous.error_msg import ErrorMsg
+        from pyof.v0x01.controller2switch.common import (PortStatsRequest,
+                                                         StatsTypes)
+        from pyof.v0x01.controller2switch.stats_request import StatsRequest
+        from pyof.v0x01.symmetric.hello import Hello
+        messages = [
+            StatsRequest(xid=1, body_type=StatsTypes.OFPST_PORT,
+                         body=PortStatsRequest(port_no=1)),
+            ErrorMsg(xid=2, error_type=0, code=0, data=Hello(xid=3))]
+        self.assertEqual(base.pack_many(messages),
+                         b''.join(message.pack() for message in messages))
+        self.assertEqual([len(message.pack()) for message in messages],
+                         [20, 20])
+
+
+class TestVersionResolution(unittest.TestCase):
+    """Testing the version resolution of inherited attributes."""
+
+    def test_get_pyof_version(self):
+        """[Foundation/Base/MetaStruct] - Version of a module."""
+        get_version = base.MetaStruct.get_pyof_version
+        self.assertEqual(get_version('pyof.v0x04.common.header'), 'v0x04')
+        self.assertIsNone(get_version('pyof.foundation.base'))
+
+    def test_get_versioned_class(self):
+        """[Foundation/Base/MetaStruct] - Class on another version."""
+        from pyof.v0x01.common.header import Header as Header1
+        from pyof.v0x04.common.header import Header as Header4
+        get_class = base.MetaStruct.get_versioned_class
+        self.assertIs(get_class(Header1, 'v0x04'), Header4)
+        self.assertIs(get_class(Header1, 'v0x04'), Header4)
+        self.assertIsNone(get_class(Header4, 'v0x04'))
+        self.assertIsNone(get_class(basic_types.UBInt8, 'v0x04'))
+
+
+class TestStructView(unittest.TestCase):
+    """Testing lazy views of packed structs."""
+
+    def setUp(self):
+        """Basic Test Setup."""
+        class VariableStruct(base.GenericStruct):
+            """Struct with a variable-size attribute."""
+
+            a1 = basic_types.UBInt8(1)
+            a2 = basic_types.UBInt32(2)
+            items = basic_types.FixedTypeList(basic_types.UBInt16)
+
+        self.VariableStruct = VariableStruct
+
+    def test_lazy_unpack(self):
+        """[Foundation/Base/StructView] - Attributes are unpacked once."""
+        view = self.VariableStruct.view(b'\x00\x03\x00\x00\x00\x04\x00\x05', 1)
+        self.assertNotIn('a1', view.__dict__)
+        self.assertEqual(view.a1, 3)
+        self.assertIs(view.a1, view.__dict__['a1'])
+        self.assertEqual(view.items, [5])
+
+    def test_promote(self):
+        """[Foundation/Base/StructView] - Promotion to a struct."""
+        view = self.VariableStruct.view(b'\x03\x00\x00\x00\x04\x00\x05')
+        struct = view.promote()
+        self.assertIsInstance(struct, self.VariableStruct)
+        struct.a1 = 5
+        self.assertEqual(view.a1, 3)
+        self.assertEqual(struct.pack(), b'\x05\x00\x00\x00\x04\x00\x05')
+
+    def test_unknown_attribute(self):
+        """[Foundation/Base/StructView] - Unknown attribute."""
+        view = self.VariableStruct.view(b'\x03\x00\x00\x00\x04')
+        self.assertRaises(AttributeError, getattr, view, 'a3')
+
+    def test_length_attributes(self):
+        """[Foundation/Base/StructView] - Same attributes as unpack."""
+        from pyof.v0x01.common.action import ActionOutput
+        from pyof.v0x01.common.flow_match import Match
+        from pyof.v0x01.common.phy_port import Port
+        from pyof.v0x01.common.utils import unpack_message
+        from pyof.v0x01.controller2switch.flow_mod import (FlowMod,
+                                                           FlowModCommand)
+        from pyof.v0x01.controller2switch.packet_out import PacketOut
+        actions = [ActionOutput(port=1), ActionOutput(port=2)]
+        messages = [
+            PacketOut(xid=1, buffer_id=5, in_port=Port.OFPP_NONE,
+                      actions=actions, data=b'abcdef'),
+            FlowMod(xid=2, match=Match(in_port=1, dl_vlan=3),
+                    command=FlowModCommand.OFPFC_ADD, cookie=0,
+                    idle_timeout=0, hard_timeout=0, priority=10,
+                    buffer_id=1, out_port=Port.OFPP_NONE, flags=0,
+                    actions=actions)]
+        for message in messages:
+            packed = message.pack()
+            view = type(message).view(packed + b'next message')
+            unpacked = unpack_message(packed)
+            for field in type(message)._fields:
+                self.assertEqual(getattr(view, field.name),
+                                 getattr(unpacked, field.name), field.name)
+            self.assertEqual(view.actions.pack(),
+                             b''.join(action.pack() for action in actions))
+        view = PacketOut.view(messages[0].pack())
+        self.assertEqual(view.data, b'abcdef')
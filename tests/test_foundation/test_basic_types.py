@@ -2,6 +2,8 @@
 import unittest
 
 from pyof.foundation import basic_types
+from pyof.foundation.base import GenericStruct
+from pyof.foundation.exceptions import UnpackException, WrongListItemType
 
 
 class TestUBInt8(unittest.TestCase):
@@ -126,6 +128,13 @@ class TestHWaddress(unittest.TestCase):
         unpacked.unpack(packed)
         self.assertEqual(mac, unpacked.value)
 
+    def test_unpack_memoryview(self):
+        """Testing unpack of HWAddress from a memoryview."""
+        buff = memoryview(b'\xff\x0a\xd3\x98\xa5\x30\x47')
+        unpacked = basic_types.HWAddress()
+        unpacked.unpack(buff, 1)
+        self.assertEqual('0a:d3:98:a5:30:47', unpacked.value)
+
 
 class TestIPAddress(unittest.TestCase):
     """Test of IPAddress BasicType."""
@@ -166,3 +175,158 @@ class TestIPAddress(unittest.TestCase):
         """Testing get_size from IPAddress."""
         ip_addr = basic_types.IPAddress('192.168.0.1/24')
         self.assertEqual(ip_addr.get_size(), 4)
+
+
+class TestBinaryData(unittest.TestCase):
+    """Test of BinaryData BasicType."""
+
+    def tearDown(self):
+        """Restore the default copying behaviour."""
+        basic_types.BinaryData.zero_copy = False
+
+    def test_unpack_copy(self):
+        """[Foundation/BasicTypes/BinaryData] - unpacking a bytearray."""
+        buff = bytearray(b'\x00data')
+        data = basic_types.BinaryData()
+        data.unpack(buff, 1)
+        buff[1:] = b'xxxx'
+        self.assertIsInstance(data.value, bytes)
+        self.assertEqual(data.value, b'data')
+
+    def test_unpack_zero_copy(self):
+        """[Foundation/BasicTypes/BinaryData] - unpacking without copy."""
+        basic_types.BinaryData.zero_copy = True
+        buff = bytearray(b'\x00data')
+        data = basic_types.BinaryData()
+        data.unpack(buff, 1)
+        self.assertIsInstance(data.value, memoryview)
+        self.assertEqual(data.get_size(), 4)
+        self.assertEqual(data.pack(), b'data')
+        buff[1:] = b'xxxx'
+        self.assertEqual(data.value, b'xxxx')
+
+    def test_pack_into(self):
+        """[Foundation/BasicTypes/BinaryData] - packing a memoryview."""
+        data = basic_types.BinaryData(memoryview(b'data'))
+        buff = bytearray(5)
+        self.assertEqual(data.pack_into(buff, 1), 5)
+        self.assertEqual(buff, b'\x00data')
+
+
+class TestFixedTypeList(unittest.TestCase):
+    """Test of FixedTypeList BasicType."""
+
+    def setUp(self):
+        """Basic test setup."""
+        self.list = basic_types.FixedTypeList(
+            pyof_class=basic_types.UBInt16,
+            items=[basic_types.UBInt16(1), basic_types.UBInt16(2)])
+
+    def test_pack_into(self):
+        """[Foundation/BasicTypes/FixedTypeList] - packing into a buffer."""
+        buff = bytearray(b'\xff' * 6)
+        self.assertEqual(self.list.pack_into(buff, 1), 5)
+        self.assertEqual(buff, b'\xff\x00\x01\x00\x02\xff')
+
+    def test_pack(self):
+        """[Foundation/BasicTypes/FixedTypeList] - packing."""
+        self.assertEqual(self.list.pack(), b'\x00\x01\x00\x02')
+
+    def test_get_size_of_static_items(self):
+        """[Foundation/BasicTypes/FixedTypeList] - size of struct items."""
+        class Item(GenericStruct):
+            """Struct with a static size."""
+
+            a1 = basic_types.UBInt8(1)
+            a2 = basic_types.UBInt16(2)
+
+        items = basic_types.FixedTypeList(pyof_class=Item,
+                                          items=[Item(), Item()])
+        self.assertEqual(items.get_size(), 6)
+        self.assertEqual(len(items.pack()), 6)
+
+        class BigItem(Item):
+            """Subclass created after the list was measured."""
+
+            a3 = basic_types.UBInt8(3)
+
+        items.append(BigItem())
+        self.assertEqual(items.get_size(), 10)
+        self.assertEqual(len(items.pack()), 10)
+
+
+class TestLazyFixedTypeList(unittest.TestCase):
+    """Test of LazyFixedTypeList BasicType."""
+
+    def setUp(self):
+        """Define structs that count how many times they are unpacked."""
+        self.unpacked = []
+        unpacked = self.unpacked
+
+        class Item(GenericStruct):
+            """Struct with a static size."""
+
+            a1 = basic_types.UBInt8()
+            a2 = basic_types.UBInt16()
+
+            def unpack(self, buff, offset=0):
+                unpacked.append(offset)
+                super().unpack(buff, offset)
+
+        class SizedItem(GenericStruct):
+            """Struct with a length attribute."""
+
+            length = basic_types.UBInt16()
+            data = basic_types.BinaryData()
+
+            _struct_length_attribute = 'length'
+
+            def unpack(self, buff, offset=0):
+                unpacked.append(offset)
+                super().unpack(buff, offset)
+
+        self.item_class = Item
+        self.sized_item_class = SizedItem
+
+    def test_fixed_size(self):
+        """[Foundation/BasicTypes/LazyFixedTypeList] - fixed-size items."""
+        packed = b''.join(bytes((index, 0, index)) for index in range(100))
+        items = basic_types.LazyFixedTypeList(pyof_class=self.item_class)
+        items.unpack(packed)
+        self.assertEqual(len(items), 100)
+        self.assertEqual(self.unpacked, [])
+        self.assertEqual(items[-2].a2.value, 98)
+        self.assertEqual([item.a1.value for item in items[10:12]], [10, 11])
+        self.assertEqual(self.unpacked, [294, 30, 33])
+        self.assertEqual(items.get_size(), 300)
+        self.assertEqual(items.pack(), packed)
+        self.assertEqual(len(self.unpacked), 3)
+
+    def test_variable_size(self):
+        """[Foundation/BasicTypes/LazyFixedTypeList] - items with lengths."""
+        packed = b'\x00\x03a\x00\x02\x00\x05bcd'
+        items = basic_types.LazyFixedTypeList(
+            pyof_class=self.sized_item_class)
+        items.unpack(memoryview(packed))
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[2].data.value, b'bcd')
+        self.assertEqual(self.unpacked, [5])
+        self.assertEqual([item.data.value for item in items],
+                         [b'a', b'', b'bcd'])
+        self.assertEqual(items.pack(), packed)
+
+    def test_changes(self):
+        """[Foundation/BasicTypes/LazyFixedTypeList] - changing the list."""
+        items = basic_types.LazyFixedTypeList(pyof_class=self.item_class)
+        items.unpack(b'\x01\x00\x01\x02\x00\x02')
+        items.insert(0, self.item_class())
+        self.assertEqual([item.a1.value for item in items[1:]], [1, 2])
+        self.assertRaises(WrongListItemType, items.append, 1)
+
+    def test_invalid(self):
+        """[Foundation/BasicTypes/LazyFixedTypeList] - truncated items."""
+        items = basic_types.LazyFixedTypeList(pyof_class=self.item_class)
+        self.assertRaises(UnpackException, items.unpack, b'\x01\x00')
+        items = basic_types.LazyFixedTypeList(
+            pyof_class=self.sized_item_class)
+        self.assertRaises(UnpackException, items.unpack, b'\x00\x05ab')
@@ -0,0 +1,55 @@
+"""Test the persistent cache of generated code."""
+import os
+import tempfile
+import unittest
+
+from pyof.foundation import cache
+
+SOURCE = 'def answer():\n    return 42\n'
+
+
+class TestCodeCache(unittest.TestCase):
+    """Test the CodeCache class."""
+
+    def setUp(self):
+        """Use an empty directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_compile(self):
+        """Compile each source once."""
+        code_cache = cache.CodeCache(self.directory.name)
+        code = code_cache.compile(SOURCE, '<test>')
+        self.assertIs(code_cache.compile(SOURCE, '<test>'), code)
+        self.assertIsNot(code_cache.compile(SOURCE, '<other>'), code)
+        namespace = {}
+        exec(code, namespace)  # pylint: disable=exec-used
+        self.assertEqual(namespace['answer'](), 42)
+
+    def test_save(self):
+        """Load the code saved by another cache."""
+        code_cache = cache.CodeCache(self.directory.name)
+        code = code_cache.compile(SOURCE, '<test>')
+        code_cache.save()
+        loaded = cache.CodeCache(self.directory.name)
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded.compile(SOURCE, '<test>'), code)
+
+    def test_invalid_file(self):
+        """Ignore files of other versions and corrupted files."""
+        code_cache = cache.CodeCache(self.directory.name)
+        for content in (b'', b'pyof-0.0\n', cache._FILE_MAGIC + b'\x00'):
+            with open(code_cache.path, 'wb') as cache_file:
+                cache_file.write(content)
+            self.assertEqual(len(cache.CodeCache(self.directory.name)), 0)
+
+    def test_enable(self):
+        """Save the cache in use when it is disabled."""
+        self.addCleanup(cache.disable)
+        code_cache = cache.enable(self.directory.name)
+        cache.compile_source(SOURCE, '<test>')
+        self.assertEqual(len(code_cache), 1)
+        cache.disable()
+        self.assertTrue(os.path.exists(code_cache.path))
+        cache.compile_source(SOURCE, '<other>')
+        self.assertEqual(len(code_cache), 1)
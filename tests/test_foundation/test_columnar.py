@@ -0,0 +1,66 @@
+"""Test the columnar decoding of struct arrays."""
+import struct
+import unittest
+
+from pyof.foundation.exceptions import UnpackException
+from pyof.v0x01.common.action import ActionOutput
+from pyof.v0x01.common.flow_match import Match
+from pyof.v0x01.controller2switch.common import FlowStats, PortStats
+
+try:
+    from pyof.foundation import columnar
+except ImportError:
+    columnar = None
+
+
+def _new_flow_stats(number):
+    """Return flow stats with *number* actions."""
+    flow_stats = FlowStats(length=88 + 8 * number, table_id=1,
+                           match=Match(in_port=number), duration_sec=number,
+                           duration_nsec=0, priority=number, idle_timeout=0,
+                           hard_timeout=0, cookie=number, packet_count=0,
+                           byte_count=100 * number,
+                           actions=[ActionOutput(port=2)] * number)
+    flow_stats.priority = number
+    return flow_stats
+
+
+@unittest.skipIf(columnar is None, 'NumPy is not installed')
+class TestColumnar(unittest.TestCase):
+    """Test get_dtype and unpack_array."""
+
+    def test_dtype(self):
+        """[Foundation/Columnar] - Types of struct classes."""
+        dtype = PortStats.get_dtype()
+        self.assertEqual(dtype.itemsize, 104)
+        self.assertNotIn('pad', dtype.names)
+        self.assertEqual(dtype.fields['rx_packets'][1], 8)
+        flow_dtype = FlowStats.get_dtype()
+        self.assertEqual(flow_dtype.itemsize, 88)
+        self.assertEqual(flow_dtype.names[-1], 'byte_count')
+        self.assertEqual(flow_dtype['match'], Match.get_dtype())
+
+    def test_static_size(self):
+        """[Foundation/Columnar] - Structs of static size."""
+        body = b''.join(struct.pack('!H6x12Q', port, 10 * port, *[0] * 11)
+                        for port in range(3))
+        array = columnar.unpack_array(PortStats, body)
+        self.assertEqual(list(array.records['port_no']), [0, 1, 2])
+        self.assertEqual(list(array.records['rx_packets']), [0, 10, 20])
+        self.assertEqual(list(array.offsets), [0, 104, 208, 312])
+        self.assertRaises(UnpackException, columnar.unpack_array, PortStats,
+                          body[:-1])
+
+    def test_length_attribute(self):
+        """[Foundation/Columnar] - Structs with variable-size ends."""
+        body = b''.join(_new_flow_stats(number).pack()
+                        for number in range(3))
+        array = columnar.unpack_array(FlowStats, body)
+        records, offsets = array
+        self.assertEqual(list(records['byte_count']), [0, 100, 200])
+        self.assertEqual(list(records['match']['in_port']), [0, 1, 2])
+        self.assertEqual(list(offsets), [0, 88, 184, 288])
+        actions = body[offsets[2] + records.itemsize:offsets[3]]
+        self.assertEqual(actions, ActionOutput(port=2).pack() * 2)
+        self.assertRaises(UnpackException, columnar.unpack_array, FlowStats,
+                          body[:-8])
@@ -0,0 +1,96 @@
+"""Test the asyncio OpenFlow protocol."""
+import asyncio
+import socket
+import unittest
+
+from pyof.foundation.connection import OpenFlowProtocol
+from pyof.foundation.exceptions import UnpackException
+from pyof.v0x01.common.utils import unpack_message
+from pyof.v0x01.symmetric.echo_request import EchoRequest
+from pyof.v0x01.symmetric.hello import Hello
+
+
+class TestOpenFlowProtocol(unittest.TestCase):
+    """Test OpenFlowProtocol over a pair of connected sockets."""
+
+    def setUp(self):
+        """Create a protocol connected to a plain socket."""
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.peer, sock = socket.socketpair()
+        self.addCleanup(self.peer.close)
+        self.peer.setblocking(False)
+        _, self.protocol = self.loop.run_until_complete(
+            self.loop.create_connection(
+                lambda: OpenFlowProtocol(unpack_message, max_pending=2),
+                sock=sock))
+        self.addCleanup(self.protocol.close)
+
+    def receive_all(self):
+        """Return the xids of the messages received until the end."""
+        async def receive():
+            return [message.header.xid async for message in self.protocol]
+        return self.loop.run_until_complete(receive())
+
+    def test_receive(self):
+        """[Foundation/Connection] - Messages split and paused."""
+        stream = b''.join(EchoRequest(xid=xid).pack() for xid in range(5))
+        self.loop.run_until_complete(
+            self.loop.sock_sendall(self.peer, stream[:20]))
+        self.loop.run_until_complete(
+            self.loop.sock_sendall(self.peer, stream[20:]))
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        # Reading was paused after max_pending messages.
+        self.assertTrue(self.protocol._reading_paused)
+        self.peer.shutdown(socket.SHUT_WR)
+        self.assertEqual(self.receive_all(), [0, 1, 2, 3, 4])
+
+    def test_truncated(self):
+        """[Foundation/Connection] - Connection closed inside a message."""
+        self.loop.run_until_complete(
+            self.loop.sock_sendall(self.peer, Hello(xid=1).pack()[:5]))
+        self.peer.shutdown(socket.SHUT_WR)
+        self.assertRaises(UnpackException, self.receive_all)
+
+    def test_get_buffer(self):
+        """[Foundation/Connection] - Reads without a size hint."""
+        protocol = OpenFlowProtocol(unpack_message, size=16)
+        buffer = protocol.get_buffer(-1)
+        self.assertGreaterEqual(len(buffer), 4096)
+        buffer[:15] = Hello(xid=1).pack() + b'\x01' * 7
+        protocol.buffer_updated(15)
+        self.assertGreaterEqual(len(protocol.get_buffer(-1)), 4096)
+
+    def test_send(self):
+        """[Foundation/Connection] - Sending and draining."""
+        packed = Hello(xid=7).pack()
+
+        async def send():
+            self.protocol.send(Hello(xid=7))
+            await self.protocol.drain()
+            return await self.loop.sock_recv(self.peer, 100)
+        self.assertEqual(self.loop.run_until_complete(send()), packed)
+
+    def test_send_many(self):
+        """[Foundation/Connection] - Sending several messages at once."""
+        async def send():
+            self.protocol.send_many([Hello(), Hello()], xids=[1, 2])
+            await self.protocol.drain()
+            return await self.loop.sock_recv(self.peer, 100)
+        self.assertEqual(self.loop.run_until_complete(send()),
+                         Hello(xid=1).pack() + Hello(xid=2).pack())
+
+    def test_drain(self):
+        """[Foundation/Connection] - Waiting while the peer does not read."""
+        packed = Hello().pack() * 4096
+
+        async def send():
+            for _ in range(64):
+                self.protocol.send_bytes(packed)
+            drain = asyncio.ensure_future(self.protocol.drain())
+            await asyncio.sleep(0.01)
+            self.assertFalse(drain.done())
+            while not drain.done():
+                await self.loop.sock_recv(self.peer, 65536)
+            await drain
+        self.loop.run_until_complete(send())
@@ -0,0 +1,73 @@
+"""Test the matching of replies to requests."""
+import asyncio
+import unittest
+
+from pyof.foundation.correlation import Correlator, XidAllocator
+from pyof.foundation.exceptions import ErrorReply
+from pyof.v0x01.asynchronous.error_msg import ErrorMsg
+from pyof.v0x01.controller2switch.barrier_reply import BarrierReply
+from pyof.v0x01.controller2switch.barrier_request import BarrierRequest
+
+
+class TestXidAllocator(unittest.TestCase):
+    """Test the XidAllocator class."""
+
+    def test_sequence(self):
+        """[Foundation/Correlation] - Xids wrap and skip those in use."""
+        xids = XidAllocator(first=0xfffffffe, in_use={0xffffffff, 1})
+        self.assertEqual([next(xids) for _ in range(3)],
+                         [0xfffffffe, 0, 2])
+
+
+class TestCorrelator(unittest.TestCase):
+    """Test the Correlator class."""
+
+    def setUp(self):
+        """Create an event loop."""
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def run_async(self, coroutine):
+        """Run *coroutine* in the test's loop."""
+        return self.loop.run_until_complete(coroutine)
+
+    def test_reply(self):
+        """[Foundation/Correlation] - Reply to a request."""
+        async def request():
+            correlator = Correlator()
+            message = BarrierRequest()
+            future = correlator.request(message)
+            self.assertIn(message.header.xid, correlator)
+            self.assertFalse(correlator.dispatch(BarrierReply(xid=1234)))
+            reply = BarrierReply(xid=message.header.xid)
+            self.assertTrue(correlator.dispatch(reply))
+            self.assertIs(await future, reply)
+            self.assertEqual(len(correlator), 0)
+        self.run_async(request())
+
+    def test_error(self):
+        """[Foundation/Correlation] - Error messages fail requests."""
+        async def request():
+            correlator = Correlator()
+            future = correlator.expect(10)
+            self.assertRaises(ValueError, correlator.expect, 10)
+            correlator.dispatch(ErrorMsg(xid=10))
+            with self.assertRaises(ErrorReply):
+                await future
+        self.run_async(request())
+
+    def test_timeout(self):
+        """[Foundation/Correlation] - Requests without replies expire."""
+        async def request():
+            correlator = Correlator(timeout=0.02, resolution=0.01, slots=4)
+            futures = [correlator.expect(xid) for xid in range(3)]
+            late = correlator.expect(3, timeout=0.2)
+            for future in futures:
+                with self.assertRaises(asyncio.TimeoutError):
+                    await future
+            self.assertEqual(len(correlator), 1)
+            self.assertFalse(late.done())
+            late.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(len(correlator), 0)
+        self.run_async(request())
@@ -0,0 +1,32 @@
+"""Test the registry of message classes."""
+import unittest
+
+from pyof.foundation import registry
+from pyof.v0x01.common.header import Type as Type01
+from pyof.v0x01.symmetric.hello import Hello as Hello01
+from pyof.v0x04.common.header import Type as Type04
+from pyof.v0x04.symmetric.echo_reply import EchoReply as EchoReply04
+
+
+class TestRegistry(unittest.TestCase):
+    """Test the get_message_class function."""
+
+    def test_numbers(self):
+        """[Foundation/Registry] - classes by version and type numbers."""
+        self.assertIs(registry.get_message_class(0x01, 0), Hello01)
+        self.assertIs(registry.get_message_class(0x04, 3), EchoReply04)
+
+    def test_enum_members(self):
+        """[Foundation/Registry] - classes by message type members."""
+        self.assertIs(registry.get_message_class(0x01, Type01.OFPT_HELLO),
+                      Hello01)
+        self.assertIs(
+            registry.get_message_class(0x04, Type04.OFPT_ECHO_REPLY),
+            EchoReply04)
+
+    def test_unknown(self):
+        """[Foundation/Registry] - unknown versions and message types."""
+        for version, message_type in ((0x02, 0), (0x01, 200), (0x300, 0),
+                                      (0x01, 'OFPT_HELLO')):
+            self.assertRaises(ValueError, registry.get_message_class,
+                              version, message_type)
@@ -0,0 +1,64 @@
+"""Test the splitting of byte streams into messages."""
+import unittest
+
+from pyof.foundation.exceptions import UnpackException
+from pyof.foundation.stream import MessageFramer
+from pyof.v0x01.common.utils import unpack_message
+from pyof.v0x01.symmetric.echo_request import EchoRequest
+from pyof.v0x01.symmetric.hello import Hello
+
+
+class TestMessageFramer(unittest.TestCase):
+    """Test the MessageFramer class."""
+
+    def setUp(self):
+        """Pack a few messages."""
+        self.packed = [Hello(xid=1).pack(), EchoRequest(xid=2).pack(),
+                       Hello(xid=3).pack()]
+        self.stream = b''.join(self.packed)
+
+    def test_chunks(self):
+        """[Foundation/Stream] - Messages split across chunks."""
+        framer = MessageFramer(size=16)
+        frames = []
+        for begin in range(0, len(self.stream), 3):
+            framer.feed(self.stream[begin:begin + 3])
+            frames.extend(bytes(frame) for frame in framer.frames())
+        self.assertEqual(frames, self.packed)
+        self.assertEqual(framer.pending, 0)
+
+    def test_coalesced(self):
+        """[Foundation/Stream] - Several messages in one chunk."""
+        framer = MessageFramer()
+        framer.feed(self.stream[:-1])
+        messages = list(framer.messages(unpack_message))
+        self.assertEqual([message.header.xid for message in messages],
+                         [1, 2])
+        self.assertEqual(framer.pending, 7)
+        framer.feed(self.stream[-1:])
+        self.assertEqual(bytes(next(framer.frames())), self.packed[2])
+
+    def test_recv_into(self):
+        """[Foundation/Stream] - Bytes written into the framer's buffer."""
+        framer = MessageFramer(size=8)
+        frames = []
+        for data in self.packed:
+            buffer = framer.get_buffer(len(data))
+            buffer[:len(data)] = data
+            framer.received(len(data))
+            frames.extend(bytes(frame) for frame in framer.frames())
+        self.assertEqual(frames, self.packed)
+        self.assertRaises(ValueError, framer.received, 1 << 20)
+
+    def test_invalid_length(self):
+        """[Foundation/Stream] - Garbage lengths."""
+        for header in (b'\x01\x00\x00\x04', b'\x01\x00\x40\x00'):
+            framer = MessageFramer(max_length=0x1000)
+            framer.feed(header)
+            self.assertRaises(UnpackException, list, framer.frames())
+
+    def test_versions(self):
+        """[Foundation/Stream] - Unexpected versions."""
+        framer = MessageFramer(versions=(0x04,))
+        framer.feed(self.stream)
+        self.assertRaises(UnpackException, list, framer.frames())
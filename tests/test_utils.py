@@ -0,0 +1,45 @@
+"""Test the helper functions for every OpenFlow version."""
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from pyof.foundation import registry
+from pyof.foundation.exceptions import UnpackException
+from pyof.utils import unpack_message
+from pyof.v0x01.symmetric.echo_request import EchoRequest as EchoRequest01
+from pyof.v0x04.controller2switch.role_request import RoleRequest
+
+
+class TestUnpackMessage(unittest.TestCase):
+    """Test the unpack_message function."""
+
+    def test_versions(self):
+        """Messages of different versions."""
+        for message in (EchoRequest01(xid=1),
+                        RoleRequest(xid=2, role=1, generation_id=3)):
+            packed = message.pack()
+            unpacked = unpack_message(packed)
+            self.assertIsInstance(unpacked, type(message))
+            self.assertEqual(unpacked.pack(), packed)
+
+    def test_unknown_version(self):
+        """Versions that are not implemented."""
+        packed = bytearray(EchoRequest01(xid=1).pack())
+        packed[0] = 0x02
+        self.assertRaises(UnpackException, unpack_message, packed)
+        self.assertRaises(UnpackException, unpack_message, b'')
+
+    def test_version_not_installed(self):
+        """Versions whose package is missing."""
+        packed = bytearray(EchoRequest01(xid=1).pack())
+        packed[0] = 0x7f
+        with patch.dict(registry._VERSION_PACKAGES, {0x7f: 'pyof.v0x7f'}):
+            self.assertRaises(UnpackException, unpack_message, packed)
+
+    def test_lazy_versions(self):
+        """Importing the module does not import any version."""
+        code = ('import sys, pyof.utils; '
+                'sys.exit(any(name.startswith(("pyof.v0x01", "pyof.v0x04"))'
+                ' for name in sys.modules))')
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
@@ -25,3 +25,20 @@ class TestPacketIn(TestStruct):
     def test_unpack(self):
         """Skip unpack test for now."""
         self.skipTest('Need to recover dump contents.')
+
+    def test_view(self):
+        """Read attributes from a view of the raw dump."""
+        raw_file = self.get_raw_dump().read()
+        view = PacketIn.view(raw_file + b'next message')
+        unpacked = self.get_raw_dump().unpack()
+        self.assertEqual(view.get_size(), len(raw_file))
+        self.assertEqual(view.in_port, unpacked.in_port)
+        self.assertEqual(view.reason, unpacked.reason)
+        self.assertEqual(view.data, unpacked.data)
+        self.assertEqual(view.promote().pack(), unpacked.pack())
+
+    def test_view_is_read_only(self):
+        """Assigning to a view attribute is not allowed."""
+        view = PacketIn.view(self.get_raw_dump().read())
+        with self.assertRaises(AttributeError):
+            view.in_port = 2
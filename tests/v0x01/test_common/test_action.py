@@ -1,10 +1,13 @@
 """Testing Port structures."""
+import unittest
+
 from pyof.v0x01.common.action import (ActionDLAddr, ActionEnqueue,
                                       ActionNWAddr, ActionNWTos, ActionOutput,
                                       ActionTPPort, ActionType,
                                       ActionVendorHeader, ActionVlanPCP,
                                       ActionVlanVid)
 from pyof.v0x01.common.phy_port import Port
+from pyof.v0x01.controller2switch.common import ListOfActions
 from tests.test_struct import TestStruct
 
 
@@ -124,3 +127,19 @@ class TestActionVendorHeader(TestStruct):
         super().set_raw_dump_file('v0x01', 'ofpt_action_vendor_header')
         super().set_raw_dump_object(ActionVendorHeader, length=16, vendor=1)
         super().set_minimum_size(8)
+
+
+class TestListOfActions(unittest.TestCase):
+    """Test the unpacking of actions of several types."""
+
+    def test_unpack(self):
+        """Each action is unpacked as an instance of its own class."""
+        actions = [ActionOutput(port=1), ActionVlanVid(vlan_id=5),
+                   ActionEnqueue(port=2, queue_id=4)]
+        packed = ListOfActions(actions).pack()
+        unpacked = ListOfActions()
+        unpacked.unpack(packed)
+        self.assertEqual([type(action) for action in unpacked],
+                         [ActionOutput, ActionVlanVid, ActionEnqueue])
+        self.assertEqual(unpacked, actions)
+        self.assertEqual(unpacked[1].vlan_id.value, 5)
@@ -0,0 +1,51 @@
+"""Testing the helper functions and the lazy loading of messages."""
+import unittest
+
+import pyof.v0x01
+from pyof.foundation.pool import StructPool
+from pyof.v0x01.asynchronous.packet_in import PacketIn, PacketInReason
+from pyof.v0x01.common import utils
+from pyof.v0x01.common.header import Type
+
+
+class TestUtils(unittest.TestCase):
+    """Test the message registry."""
+
+    def test_get_message_class(self):
+        """[Common/Utils] - class of each message type."""
+        for message_type in Type:
+            message_class = utils.get_message_class(message_type)
+            self.assertIs(utils.get_message_class(message_type),
+                          message_class)
+            self.assertEqual(message_class.__module__.split('.')[1], 'v0x01')
+
+    def test_new_message_from_name(self):
+        """[Common/Utils] - message from a message type name."""
+        message = utils.new_message_from_message_type('Type.OFPT_HELLO')
+        self.assertEqual(message.header.message_type, Type.OFPT_HELLO)
+
+    def test_unknown_message_type(self):
+        """[Common/Utils] - unknown message type."""
+        self.assertRaises(ValueError, utils.new_message_from_message_type,
+                          'OFPT_UNKNOWN')
+
+    def test_unpack_message_pool(self):
+        """[Common/Utils] - unpack messages into pooled instances."""
+        packed = PacketIn(xid=3, buffer_id=1, total_len=4, in_port=2,
+                          reason=PacketInReason.OFPR_ACTION,
+                          data=b'abcd').pack()
+        pool = StructPool()
+        message = utils.unpack_message(packed, pool)
+        self.assertEqual(message, utils.unpack_message(packed))
+        pool.release(message)
+        reused = utils.unpack_message(packed, pool)
+        self.assertIs(reused, message)
+        self.assertEqual(reused.pack(), packed)
+
+    def test_lazy_modules(self):
+        """[Common/Utils] - modules loaded as package attributes."""
+        hello = pyof.v0x01.symmetric.hello
+        self.assertEqual(hello.__name__, 'pyof.v0x01.symmetric.hello')
+        self.assertIn('hello', dir(pyof.v0x01.symmetric))
+        with self.assertRaises(AttributeError):
+            pyof.v0x01.symmetric.unknown_module  # pylint: disable=W0104
@@ -0,0 +1,32 @@
+"""Testing the helper functions of v0x04."""
+import unittest
+
+from pyof.foundation.pool import StructPool
+from pyof.v0x04.common import utils
+from pyof.v0x04.common.header import Type
+from pyof.v0x04.controller2switch.common import MultipartTypes
+from pyof.v0x04.controller2switch.multipart_reply import MultipartReply
+
+
+class TestUtils(unittest.TestCase):
+    """Test the message registry."""
+
+    def test_get_message_class(self):
+        """[Common/Utils] - class of each message type."""
+        for message_type in Type:
+            message_class = utils.get_message_class(message_type)
+            self.assertIs(utils.get_message_class(message_type.value),
+                          message_class)
+            self.assertEqual(message_class().header.message_type,
+                             message_type)
+
+    def test_unpack_message(self):
+        """[Common/Utils] - unpack messages with and without a pool."""
+        packed = MultipartReply(xid=3, flags=0, body=b'abcd',
+                                multipart_type=MultipartTypes.OFPMP_DESC
+                                ).pack()
+        message = utils.unpack_message(packed)
+        self.assertIsInstance(message, MultipartReply)
+        self.assertEqual(message.pack(), packed)
+        self.assertEqual(utils.unpack_message(packed, StructPool()).pack(),
+                         packed)
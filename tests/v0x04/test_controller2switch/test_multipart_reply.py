@@ -1,5 +1,11 @@
 """MultipartReply message test."""
-from pyof.v0x04.controller2switch.multipart_reply import MultipartReply
+import struct
+import unittest
+
+from pyof.foundation.exceptions import UnpackException
+from pyof.v0x04.controller2switch.common import MultipartTypes
+from pyof.v0x04.controller2switch.multipart_reply import (
+    MultipartReassembler, MultipartReply, MultipartReplyFlags)
 from tests.test_struct import TestStruct
 
 
@@ -14,3 +20,58 @@ class TestMultipartReply(TestStruct):
         super().set_raw_dump_object(MultipartReply, xid=3, multipart_type=0,
                                     flags=1, body=0)
         super().set_minimum_size(16)
+
+
+class TestMultipartReassembler(unittest.TestCase):
+    """Test the reassembly of replies split in several messages."""
+
+    def setUp(self):
+        """Pack the body of a reply with three flows."""
+        match = b'\x00\x01\x00\x04\x00\x00\x00\x00'
+        self.body = b''.join(
+            struct.pack('!HBxIIHHHH4xQQQ', 56, table_id, 1, 2, 3, 0, 0, 0,
+                        table_id, 5, 6) + match
+            for table_id in range(3))
+        self.reassembler = MultipartReassembler()
+
+    def _feed(self, body, more, multipart_type=MultipartTypes.OFPMP_FLOW):
+        """Feed a part after packing and unpacking it."""
+        flags = MultipartReplyFlags.OFPMPF_REPLY_MORE if more else 0
+        packed = MultipartReply(xid=7, multipart_type=multipart_type,
+                                flags=flags, body=body).pack()
+        reply = MultipartReply()
+        reply.header.unpack(packed[:8])
+        reply.unpack(packed[8:])
+        return self.reassembler.feed(reply)
+
+    def test_split_records(self):
+        """Records split between parts are decoded when completed."""
+        records, complete = self._feed(self.body[:70], True)
+        self.assertEqual([flow.table_id.value for flow in records], [0])
+        self.assertFalse(complete)
+        self.assertIn(7, self.reassembler)
+        records, complete = self._feed(self.body[70:100], True)
+        self.assertEqual(records, [])
+        records, complete = self._feed(self.body[100:], False)
+        self.assertEqual([flow.cookie.value for flow in records], [1, 2])
+        self.assertTrue(complete)
+        self.assertEqual(len(self.reassembler), 0)
+
+    def test_truncated(self):
+        """The last part ends in the middle of a record."""
+        self._feed(self.body[:70], True)
+        self.assertRaises(UnpackException, self._feed, self.body[70:100],
+                          False)
+
+    def test_changed_type(self):
+        """Parts with the same xid and different types."""
+        self._feed(self.body[:70], True)
+        self.assertRaises(UnpackException, self._feed, self.body[70:], False,
+                          MultipartTypes.OFPMP_TABLE)
+
+    def test_unknown_body(self):
+        """Bodies without a record class are returned as bytes."""
+        records, complete = self._feed(b'\x01\x02', False,
+                                       MultipartTypes.OFPMP_METER)
+        self.assertEqual(records, [b'\x01\x02'])
+        self.assertTrue(complete)